@@ -4,48 +4,136 @@ Bead Sort Implementation in Python
 Bead sort is a natural sorting algorithm that simulates the process of beads
 falling under gravity. Each number is represented by that many beads on a rod.
 
-Time Complexity: O(S) where S is the sum of all elements
-Space Complexity: O(n * max(arr))
+After the beads fall, all that matters about rod j is how many beads it
+holds: one for every value greater than j. So gravity is a column count over
+the n x max bead grid, and row i of the settled grid (counted from the top)
+holds as many beads as there are rods with more than n - 1 - i beads.
+
+With NumPy, bead_sort_array() builds the grid as uint8 (bool) tiles of at
+most tile_cells cells, one block of rows and rods at a time, and counts each
+tile's columns in one vectorized pass, so memory stays bounded however large
+n x max gets. Inputs whose grid exceeds max_cells cells in total are refused,
+since the work grows with the grid. Without NumPy, the same column counts are
+gathered bead by bead in O(max) memory.
+
+Time Complexity: O(S) where S is the sum of all elements (O(n * max) cells
+    vectorized)
+Space Complexity: O(max) plus one tile of the grid
 """
 
+import time
+
+from sort_support import np
+
+TILE_CELLS = 1 << 22
+MAX_CELLS = 1 << 32
+
 
-def bead_sort(arr):
+def bead_sort(arr, tile_cells=TILE_CELLS, max_cells=MAX_CELLS):
+    """
+    Bead Sort - list version for non-negative integers
+
+    Returns:
+        List: Sorted list (original list is not modified)
+    """
     if len(arr) == 0:
         return arr
-    
+    if np is not None:
+        values = np.asarray(arr)
+        if values.dtype.kind in "iu":
+            return bead_sort_array(values, tile_cells, max_cells).tolist()
+
+    if not all(type(x) is int for x in arr):
+        raise TypeError("bead sort only sorts integers")
+    n = len(arr)
     max_val = max(arr)
-    beads = [[0] * max_val for _ in range(len(arr))]
-    
-    # Drop beads
-    for i in range(len(arr)):
-        for j in range(arr[i]):
-            beads[i][j] = 1
-    
-    # Let beads fall
-    for j in range(max_val):
-        sum_val = 0
-        for i in range(len(arr)):
-            sum_val += beads[i][j]
-            beads[i][j] = 0
-        
-        for i in range(len(arr) - sum_val, len(arr)):
-            beads[i][j] = 1
-    
-    # Count beads in each row
+    _check_budget(n, max_val, min(arr), max_cells)
+
+    # Drop beads: rod j ends up holding one bead per value > j
+    rods = [0] * max_val
+    for value in arr:
+        for j in range(value):
+            rods[j] += 1
+
+    # Let beads fall, then count the beads in each row from the top. Rods
+    # hold fewer beads the further right they are, so each row's beads are
+    # the leftmost rods that reach up to it
     sorted_arr = []
-    for i in range(len(arr)):
-        count = 0
-        for j in range(max_val):
-            if beads[i][j] == 1:
-                count += 1
-            else:
-                break
+    count = 0
+    for i in range(n):
+        height = n - i
+        while count < max_val and rods[count] >= height:
+            count += 1
         sorted_arr.append(count)
-    
     return sorted_arr
 
 
+def _check_budget(n, max_val, min_val, max_cells):
+    if min_val < 0:
+        raise ValueError("bead sort only sorts non-negative integers")
+    if n * max_val > max_cells:
+        raise ValueError(
+            f"bead grid of {n} x {max_val} cells exceeds max_cells={max_cells}"
+        )
+
+
+def bead_sort_array(values, tile_cells=TILE_CELLS, max_cells=MAX_CELLS):
+    """
+    Bead Sort - NumPy version for non-negative integer arrays
+
+    Args:
+        values: 1-D array (or list) of non-negative integers
+        tile_cells: Largest grid tile built at once (bytes of bool grid)
+        max_cells: Refuse inputs whose n x max grid is larger than this
+
+    Returns:
+        ndarray: New sorted array of the same dtype
+    """
+    values = np.asarray(values)
+    if values.ndim != 1:
+        raise ValueError("bead_sort_array expects a 1-D array")
+    if values.dtype.kind not in "iu":
+        raise TypeError("bead sort only sorts integers")
+    n = values.shape[0]
+    if n == 0:
+        return values.copy()
+    max_val = int(values.max())
+    _check_budget(n, max_val, int(values.min()), max_cells)
+
+    # Gravity: rods[j] = beads on rod j = number of values > j, counted one
+    # tile of (rows x rods) at a time
+    rods = np.zeros(max_val, dtype=np.int64)
+    width = max(1, min(max_val, tile_cells))
+    height = max(1, min(n, tile_cells // width))
+    grid = np.empty((height, width), dtype=bool)
+    for c0 in range(0, max_val, width):
+        columns = np.arange(c0, min(c0 + width, max_val))
+        for r0 in range(0, n, height):
+            rows = values[r0 : r0 + height, None]
+            tile = grid[: rows.shape[0], : columns.shape[0]]
+            np.greater(rows, columns, out=tile)
+            rods[c0 : c0 + columns.shape[0]] += np.count_nonzero(tile, axis=0)
+
+    # Row i from the top holds a bead on every rod with at least n - i
+    # beads; rods are non-increasing, so that's a binary search per row
+    heights = n - np.arange(n)
+    counts = np.searchsorted(-rods, -heights, side="right")
+    return counts.astype(values.dtype)
+
+
 if __name__ == "__main__":
     arr = [3, 1, 4, 1, 5, 9, 2, 6]
     print("Bead Sort:", bead_sort(arr))
 
+    if np is not None:
+        data = np.random.default_rng(0).integers(0, 256, size=100_000)
+        start = time.perf_counter()
+        result = bead_sort_array(data)
+        elapsed = time.perf_counter() - start
+        assert np.array_equal(result, np.sort(data))
+        print(f"Bead Sort (ndarray, 100,000 values in [0, 256)): {elapsed:.3f}s")
+
+        try:
+            bead_sort_array(np.array([1, 10**9] * 10), max_cells=10**8)
+        except ValueError as exc:
+            print("Bead Sort (over budget):", exc)
@@ -4,43 +4,162 @@ Bitonic Sort Implementation in Python
 Bitonic sort is a parallel sorting network algorithm. It works by creating
 bitonic sequences (sequences that first increase then decrease, or vice versa).
 
+The list version handles any length by splitting each bitonic merge at the
+greatest power of two below n instead of at n / 2.
+
+With NumPy installed, bitonic_sort_array() runs the network itself: every
+stage is one vectorized compare-exchange (np.minimum / np.maximum) over all
+pairs at that stride, so the Python loop only runs O(log² n) times. min/max
+can't tell -0.0 from 0.0 and may hand back two copies of one zero, so the
+zeros of float rows get their signs back afterwards. Inputs
+are padded to the next power of two, and a 2-D array is sorted row by row
+in a single pass over the network (the batched mode).
+
 Time Complexity: O(log² n) parallel, O(n log² n) sequential
-Space Complexity: O(n log² n)
+Space Complexity: O(1) for the list version, O(n) padding for the ndarray one
 """
 
+import time
+
+from sort_support import np
+
 
 def bitonic_sort(arr, up=True):
-    if len(arr) <= 1:
-        return arr
-    
-    mid = len(arr) // 2
-    left = bitonic_sort(arr[:mid], True)
-    right = bitonic_sort(arr[mid:], False)
-    
-    return bitonic_merge(left + right, up)
-
-
-def bitonic_merge(arr, up):
-    if len(arr) <= 1:
-        return arr
-    
-    arr = bitonic_compare(arr, up)
-    mid = len(arr) // 2
-    left = bitonic_merge(arr[:mid], up)
-    right = bitonic_merge(arr[mid:], up)
-    
-    return left + right
-
-
-def bitonic_compare(arr, up):
-    dist = len(arr) // 2
-    for i in range(dist):
+    """
+    Bitonic Sort - list version for any length
+
+    Returns:
+        List: New sorted list (ascending if up, else descending)
+    """
+    result = list(arr)
+    _bitonic_sort(result, 0, len(result), up)
+    return result
+
+
+def _bitonic_sort(arr, lo, n, up):
+    if n <= 1:
+        return
+    mid = n // 2
+    # Opposite directions make arr[lo:lo + n] bitonic
+    _bitonic_sort(arr, lo, mid, not up)
+    _bitonic_sort(arr, lo + mid, n - mid, up)
+    bitonic_merge(arr, lo, n, up)
+
+
+def bitonic_merge(arr, lo, n, up):
+    if n <= 1:
+        return
+    # Comparing across the greatest power of two below n (not n / 2) keeps
+    # the network correct when n is not a power of two
+    dist = 1 << ((n - 1).bit_length() - 1)
+    bitonic_compare(arr, lo, n, dist, up)
+    bitonic_merge(arr, lo, dist, up)
+    bitonic_merge(arr, lo + dist, n - dist, up)
+
+
+def bitonic_compare(arr, lo, n, dist, up):
+    for i in range(lo, lo + n - dist):
         if (arr[i] > arr[i + dist]) == up:
             arr[i], arr[i + dist] = arr[i + dist], arr[i]
-    return arr
+
+
+def _pad_value(dtype):
+    """A value that sorts after everything else of this dtype."""
+    if dtype.kind == "f":
+        return np.inf
+    if dtype.kind in "iu":
+        return np.iinfo(dtype).max
+    if dtype.kind == "b":
+        return True
+    raise TypeError(f"bitonic_sort_array does not support dtype {dtype}")
+
+
+def _run_network(rows):
+    """Sort each row of a C-contiguous (batch, 2**k) array in place."""
+    batch, width = rows.shape
+    k = 2
+    while k <= width:
+        j = k // 2
+        while j >= 1:
+            # Lay each run of k items out as (k / 2j) groups of two halves
+            # j apart, so both halves of every pair line up as views
+            blocks = rows.reshape(batch, width // k, k // (2 * j), 2, j)
+            if k == width:
+                _compare_exchange(blocks[:, :, :, 0], blocks[:, :, :, 1])
+            else:
+                # Even runs of k sort ascending, odd runs descending
+                _compare_exchange(blocks[:, 0::2, :, 0], blocks[:, 0::2, :, 1])
+                _compare_exchange(blocks[:, 1::2, :, 1], blocks[:, 1::2, :, 0])
+            j //= 2
+        k *= 2
+
+
+def _compare_exchange(low, high):
+    """Put the elementwise min of each pair in low and the max in high."""
+    smaller = np.minimum(low, high)
+    np.maximum(low, high, out=high)
+    low[...] = smaller
+
+
+def bitonic_sort_array(values):
+    """
+    Bitonic Sort - vectorized sorting network (modifies values)
+
+    Args:
+        values: ndarray of ints, floats or bools. A 1-D array is sorted;
+            for 2-D and higher every slice along the last axis is sorted
+            independently (e.g. each row of a matrix). NaN is not supported.
+
+    Returns:
+        ndarray: The same array, sorted
+    """
+    if values.ndim == 0:
+        raise ValueError("bitonic_sort_array expects at least one dimension")
+    n = values.shape[-1]
+    if n <= 1 or values.size == 0:
+        return values
+    negative_zeros = None
+    if values.dtype.kind == "f":
+        if np.isnan(values).any():
+            raise ValueError("bitonic_sort_array cannot sort NaN")
+        if (values == 0).any():
+            negative_zeros = np.sum((values == 0) & np.signbit(values), axis=-1)
+
+    width = 1 << (n - 1).bit_length()
+    if width == n and values.flags.c_contiguous:
+        # Already a power of two: run the network on the array's own memory
+        _run_network(values.reshape(-1, n))
+    else:
+        rows = np.full(
+            (values.size // n, width), _pad_value(values.dtype), values.dtype
+        )
+        rows[:, :n] = values.reshape(-1, n)
+        _run_network(rows)
+        values[...] = rows[:, :n].reshape(values.shape)
+
+    if negative_zeros is not None:
+        # Each row's zeros are now one run: its first negative_zeros are -0.0
+        zeros = values == 0
+        rank = np.cumsum(zeros, axis=-1)
+        values[zeros] = 0.0
+        values[zeros & (rank <= negative_zeros[..., None])] = -0.0
+    return values
 
 
 if __name__ == "__main__":
     arr = [3, 7, 4, 8, 6, 2, 1, 5]
     print("Bitonic Sort:", bitonic_sort(arr.copy()))
+    print("Bitonic Sort (n=7, descending):", bitonic_sort([3, 7, 4, 8, 6, 2, 1], False))
+
+    if np is not None:
+        rng = np.random.default_rng(0)
+        one = rng.integers(0, 100, size=11)
+        print("Bitonic Sort (ndarray, padded):", bitonic_sort_array(one))
 
+        batch = rng.random((200_000, 16))
+        expected = np.sort(batch, axis=1)
+        start = time.perf_counter()
+        bitonic_sort_array(batch)
+        elapsed = time.perf_counter() - start
+        assert np.array_equal(batch, expected)
+        print(f"Bitonic Sort (batched): 200,000 rows of 16 in {elapsed:.3f}s")
@@ -1,38 +1,79 @@
 """
 Block Sort Implementation in Python
 
-Block sort is a stable, cache-efficient mergesort variant. It divides the
-array into blocks and uses a merge operation that's optimized for cache performance.
+Block sort (WikiSort) is a stable, in-place merge sort. Each merge of two
+sorted runs A and B works like this:
+1. pull two internal buffers of about sqrt(|A|) unique values out of the
+   array (one to tag A blocks, one as merge scratch space)
+2. cut A into blocks of about sqrt(|A|) items and tag each block by swapping
+   its first value with a buffer value, so equal blocks keep their order
+3. roll the A blocks through B with block swaps, dropping the smallest A
+   block behind wherever it belongs (found with a binary search + rotation)
+4. merge each dropped A block with the B values after it using the second
+   buffer, the fixed cache or, failing both, rotations
+5. sort the scratch buffer and redistribute both buffers back into place
+
+Ranges are cut with fractional steps (WikiIterator) so every level merges
+runs of near-equal length for any n, not just powers of two. Runs shorter
+than the optional fixed cache are merged through it directly; with
+cache_size=0 the sort uses O(1) extra memory.
 
 Time Complexity: O(n log n)
-Space Complexity: O(n)
+Space Complexity: O(1) (plus the fixed-size cache)
 """
 
-import math
+import argparse
+import random
+import subprocess
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+CACHE_SIZE = 512
+
+
+def block_sort(arr, cache_size=CACHE_SIZE):
+    """
+    Block Sort - returns a new sorted list (original list is not modified)
+    """
+    result = list(arr)
+    block_sort_in_place(result, cache_size)
+    return result
+
 
+def block_sort_in_place(arr, cache_size=CACHE_SIZE):
+    """
+    Block Sort - stable, in-place version (modifies arr)
 
-def block_sort(arr):
-    if len(arr) <= 1:
+    Args:
+        arr: List, array.array or writable 1-D memoryview to sort
+        cache_size: Items in the fixed scratch cache (0 = strictly in place)
+
+    Returns:
+        The same sequence, sorted
+    """
+    size = len(arr)
+    if size < 8:
+        insertion_sort_block(arr, 0, size)
         return arr
-    
-    block_size = int(math.sqrt(len(arr)))
-    sorted_arr = arr.copy()
-    
-    # Sort blocks
-    for i in range(0, len(sorted_arr), block_size):
-        end = min(i + block_size, len(sorted_arr))
-        insertion_sort_block(sorted_arr, i, end)
-    
-    # Merge blocks
-    size = block_size
-    while size < len(sorted_arr):
-        for left in range(0, len(sorted_arr), 2 * size):
-            mid = min(left + size, len(sorted_arr))
-            right = min(left + 2 * size, len(sorted_arr))
-            merge_block(sorted_arr, left, mid, right)
-        size *= 2
-    
-    return sorted_arr
+
+    sorter = _BlockMerger(arr, cache_size)
+    iterator = WikiIterator(size, 4)
+
+    # Sort groups of 4-8 items with insertion sort
+    while not iterator.finished():
+        start, end = iterator.next_range()
+        insertion_sort_block(arr, start, end)
+
+    while True:
+        if iterator.length() < cache_size:
+            sorter.merge_level_cached(iterator)
+        else:
+            sorter.merge_level_in_place(iterator)
+        if not iterator.next_level():
+            break
+    return arr
 
 
 def insertion_sort_block(arr, left, right):
@@ -45,34 +86,633 @@ def insertion_sort_block(arr, left, right):
         arr[j + 1] = key
 
 
-def merge_block(arr, left, mid, right):
-    left_arr = arr[left:mid]
-    right_arr = arr[mid:right]
-    
-    i = j = 0
-    k = left
-    
-    while i < len(left_arr) and j < len(right_arr):
-        if left_arr[i] <= right_arr[j]:
-            arr[k] = left_arr[i]
-            i += 1
+class WikiIterator:
+    """
+    Walks one level of a bottom-up merge sort, cutting [0, size) into runs
+    whose lengths differ by at most one (fixed-point fractional steps).
+    """
+
+    def __init__(self, size, min_level):
+        self.size = size
+        power_of_two = 1 << (size.bit_length() - 1)
+        self.denominator = power_of_two // min_level
+        self.numerator_step = size % self.denominator
+        self.decimal_step = size // self.denominator
+        self.begin()
+
+    def begin(self):
+        self.numerator = self.decimal = 0
+
+    def next_range(self):
+        start = self.decimal
+        self.decimal += self.decimal_step
+        self.numerator += self.numerator_step
+        if self.numerator >= self.denominator:
+            self.numerator -= self.denominator
+            self.decimal += 1
+        return start, self.decimal
+
+    def finished(self):
+        return self.decimal >= self.size
+
+    def next_level(self):
+        self.decimal_step += self.decimal_step
+        self.numerator_step += self.numerator_step
+        if self.numerator_step >= self.denominator:
+            self.numerator_step -= self.denominator
+            self.decimal_step += 1
+        self.begin()
+        return self.decimal_step < self.size
+
+    def length(self):
+        return self.decimal_step
+
+
+# --- Primitive operations on arr[start:end] ranges --------------------------
+
+
+def reverse_range(arr, start, end):
+    end -= 1
+    while start < end:
+        arr[start], arr[end] = arr[end], arr[start]
+        start += 1
+        end -= 1
+
+
+def block_swap(arr, start1, start2, count):
+    for i in range(count):
+        arr[start1 + i], arr[start2 + i] = arr[start2 + i], arr[start1 + i]
+
+
+def find_first_forward(arr, value, start, end, unique):
+    """bisect_left over arr[start:end], galloping in steps of len/unique."""
+    if start == end:
+        return start
+    skip = max((end - start) // unique, 1)
+    index = start + skip
+    while arr[index - 1] < value:
+        if index >= end - skip:
+            return bisect_left(arr, value, index, end)
+        index += skip
+    return bisect_left(arr, value, index - skip, index)
+
+
+def find_last_forward(arr, value, start, end, unique):
+    """bisect_right over arr[start:end], galloping forward."""
+    if start == end:
+        return start
+    skip = max((end - start) // unique, 1)
+    index = start + skip
+    while not value < arr[index - 1]:
+        if index >= end - skip:
+            return bisect_right(arr, value, index, end)
+        index += skip
+    return bisect_right(arr, value, index - skip, index)
+
+
+def find_first_backward(arr, value, start, end, unique):
+    """bisect_left over arr[start:end], galloping backward."""
+    if start == end:
+        return start
+    skip = max((end - start) // unique, 1)
+    index = end - skip
+    while index > start and not arr[index - 1] < value:
+        if index < start + skip:
+            return bisect_left(arr, value, start, index)
+        index -= skip
+    return bisect_left(arr, value, index, index + skip)
+
+
+def find_last_backward(arr, value, start, end, unique):
+    """bisect_right over arr[start:end], galloping backward."""
+    if start == end:
+        return start
+    skip = max((end - start) // unique, 1)
+    index = end - skip
+    while index > start and value < arr[index - 1]:
+        if index < start + skip:
+            return bisect_right(arr, value, start, index)
+        index -= skip
+    return bisect_right(arr, value, index, index + skip)
+
+
+class _Pull:
+    """Where the values of one internal buffer are pulled from and to."""
+
+    __slots__ = ("source", "dest", "count", "start", "end")
+
+    def __init__(self):
+        self.source = self.dest = self.count = self.start = self.end = 0
+
+
+def new_cache(arr, size):
+    """
+    Scratch space of the same kind as arr, so slices can be copied between
+    them: typed buffers (array.array, memoryview) only accept slice
+    assignment from their own type.
+    """
+    if isinstance(arr, memoryview):
+        return memoryview(bytearray(size * arr.itemsize)).cast(arr.format)
+    if isinstance(arr, array):
+        return array(arr.typecode, bytes(size * arr.itemsize))
+    return [None] * size
+
+
+class _BlockMerger:
+    def __init__(self, arr, cache_size):
+        self.arr = arr
+        self.cache_size = cache_size
+        self.cache = new_cache(arr, cache_size)
+
+    def rotate(self, amount, start, end, use_cache=True):
+        """Rotate arr[start:end] left by amount."""
+        arr = self.arr
+        split = start + amount
+        left, right = amount, end - split
+        if left == 0 or right == 0:
+            return
+        chunk = self.cache_size
+        if use_cache and min(left, right) <= chunk:
+            # Park the short side in the cache and slide the long side over
+            # it in cache-sized steps, so no temporary exceeds the cache
+            cache = self.cache
+            if left <= right:
+                cache[:left] = arr[start:split]
+                for offset in range(0, right, chunk):
+                    count = min(chunk, right - offset)
+                    src = split + offset
+                    arr[src - left : src - left + count] = arr[src : src + count]
+                arr[start + right : end] = cache[:left]
+            else:
+                cache[:right] = arr[split:end]
+                for offset in range(left, 0, -chunk):
+                    count = min(chunk, offset)
+                    src = start + offset - count
+                    arr[src + right : src + right + count] = arr[src : src + count]
+                arr[start : start + right] = cache[:right]
+            return
+        reverse_range(arr, start, split)
+        reverse_range(arr, split, end)
+        reverse_range(arr, start, end)
+
+    def merge_external(self, a_start, a_end, b_start, b_end):
+        """Merge A (already copied to the cache) with B into arr[a_start:b_end]."""
+        arr, cache = self.arr, self.cache
+        a_index, a_last = 0, a_end - a_start
+        b_index = b_start
+        insert = a_start
+        if b_end > b_start and a_last > 0:
+            while True:
+                if not arr[b_index] < cache[a_index]:
+                    arr[insert] = cache[a_index]
+                    a_index += 1
+                    insert += 1
+                    if a_index == a_last:
+                        break
+                else:
+                    arr[insert] = arr[b_index]
+                    b_index += 1
+                    insert += 1
+                    if b_index == b_end:
+                        break
+        arr[insert : insert + a_last - a_index] = cache[a_index:a_last]
+
+    def merge_internal(self, a_start, a_end, b_start, b_end, buffer_start):
+        """Merge A (block swapped into the buffer) with B by swapping."""
+        arr = self.arr
+        a_length, b_length = a_end - a_start, b_end - b_start
+        a_count = b_count = insert = 0
+        if b_length > 0 and a_length > 0:
+            while True:
+                if not arr[b_start + b_count] < arr[buffer_start + a_count]:
+                    arr[a_start + insert], arr[buffer_start + a_count] = (
+                        arr[buffer_start + a_count],
+                        arr[a_start + insert],
+                    )
+                    a_count += 1
+                    insert += 1
+                    if a_count >= a_length:
+                        break
+                else:
+                    arr[a_start + insert], arr[b_start + b_count] = (
+                        arr[b_start + b_count],
+                        arr[a_start + insert],
+                    )
+                    b_count += 1
+                    insert += 1
+                    if b_count >= b_length:
+                        break
+        block_swap(arr, buffer_start + a_count, a_start + insert, a_length - a_count)
+
+    def merge_in_place(self, a_start, a_end, b_start, b_end):
+        """Merge with rotations only: no buffer needed, O(n^2) worst case."""
+        arr = self.arr
+        if a_end == a_start or b_end == b_start:
+            return
+        while True:
+            # Rotate A into place before the first B value not less than A[0]
+            mid = bisect_left(arr, arr[a_start], b_start, b_end)
+            amount = mid - a_end
+            self.rotate(a_end - a_start, a_start, mid)
+            if b_end == mid:
+                break
+            b_start = mid
+            a_start, a_end = a_start + amount, b_start
+            a_start = bisect_right(arr, arr[a_start], a_start, a_end)
+            if a_end == a_start:
+                break
+
+    def merge_level_cached(self, iterator):
+        arr, cache = self.arr, self.cache
+        iterator.begin()
+        while not iterator.finished():
+            a_start, a_end = iterator.next_range()
+            b_start, b_end = iterator.next_range()
+            if arr[b_end - 1] < arr[a_start]:
+                # The runs are in reverse order: one rotation fixes them
+                self.rotate(a_end - a_start, a_start, b_end)
+            elif arr[b_start] < arr[a_end - 1]:
+                cache[: a_end - a_start] = arr[a_start:a_end]
+                self.merge_external(a_start, a_end, b_start, b_end)
+
+    def merge_level_in_place(self, iterator):
+        arr = self.arr
+        cache_size = self.cache_size
+        length = iterator.length()
+        block_size = int(length**0.5)
+        buffer_size = length // block_size + 1
+
+        # 1. Find where to pull two internal buffers of buffer_size unique
+        # values from: one contiguous run of 2 * buffer_size unique values,
+        # two separate runs, or failing that the largest run available
+        buffer1 = buffer2 = (0, 0)
+        pulls = [_Pull(), _Pull()]
+        pull_index = 0
+        find = buffer_size + buffer_size
+        find_separately = False
+        if block_size <= cache_size:
+            # Every A block fits in the cache: only the tag buffer is needed
+            find = buffer_size
+        elif find > length:
+            find = buffer_size
+            find_separately = True
+
+        def record_pull(a_start, b_end, count, index, dest):
+            pull = pulls[pull_index]
+            pull.start, pull.end = a_start, b_end
+            pull.count, pull.source, pull.dest = count, index, dest
+
+        iterator.begin()
+        while not iterator.finished():
+            a_start, a_end = iterator.next_range()
+            b_start, b_end = iterator.next_range()
+
+            # Unique values at the start of A (pulled to the start of A)
+            last, count = a_start, 1
+            while count < find:
+                index = find_last_forward(
+                    arr, arr[last], last + 1, a_end, find - count
+                )
+                if index == a_end:
+                    break
+                last = index
+                count += 1
+            index = last
+
+            if count >= buffer_size:
+                record_pull(a_start, b_end, count, index, a_start)
+                pull_index = 1
+                if count == buffer_size + buffer_size:
+                    buffer1 = (a_start, a_start + buffer_size)
+                    buffer2 = (a_start + buffer_size, a_start + count)
+                    break
+                elif find == buffer_size + buffer_size:
+                    buffer1 = (a_start, a_start + count)
+                    find = buffer_size
+                elif block_size <= cache_size:
+                    buffer1 = (a_start, a_start + count)
+                    break
+                elif find_separately:
+                    buffer1 = (a_start, a_start + count)
+                    find_separately = False
+                else:
+                    buffer2 = (a_start, a_start + count)
+                    break
+            elif pull_index == 0 and count > buffer1[1] - buffer1[0]:
+                buffer1 = (a_start, a_start + count)
+                record_pull(a_start, b_end, count, index, a_start)
+
+            # Unique values at the end of B (pulled to the end of B)
+            last, count = b_end - 1, 1
+            while count < find:
+                index = find_first_backward(
+                    arr, arr[last], b_start, last, find - count
+                )
+                if index == b_start:
+                    break
+                last = index - 1
+                count += 1
+            index = last
+
+            if count >= buffer_size:
+                record_pull(a_start, b_end, count, index, b_end)
+                pull_index = 1
+                if count == buffer_size + buffer_size:
+                    buffer1 = (b_end - count, b_end - buffer_size)
+                    buffer2 = (b_end - buffer_size, b_end)
+                    break
+                elif find == buffer_size + buffer_size:
+                    buffer1 = (b_end - count, b_end)
+                    find = buffer_size
+                elif block_size <= cache_size:
+                    buffer1 = (b_end - count, b_end)
+                    break
+                elif find_separately:
+                    buffer1 = (b_end - count, b_end)
+                    find_separately = False
+                else:
+                    # buffer2 comes out of this B, which shrinks the range
+                    # buffer1's values will be redistributed over
+                    if pulls[0].start == a_start:
+                        pulls[0].end -= pulls[1].count
+                    buffer2 = (b_end - count, b_end)
+                    break
+            elif pull_index == 0 and count > buffer1[1] - buffer1[0]:
+                buffer1 = (b_end - count, b_end)
+                record_pull(a_start, b_end, count, index, b_end)
+
+        # 2. Pull the buffer values out with rotations
+        for pull in pulls:
+            length_pulled = pull.count
+            if pull.dest < pull.source:
+                index = pull.source
+                for count in range(1, length_pulled):
+                    index = find_first_backward(
+                        arr,
+                        arr[index - 1],
+                        pull.dest,
+                        pull.source - (count - 1),
+                        length_pulled - count,
+                    )
+                    self.rotate(
+                        pull.source - index - count, index + 1, pull.source + 1
+                    )
+                    pull.source = index + count
+            elif pull.dest > pull.source:
+                index = pull.source + 1
+                for count in range(1, length_pulled):
+                    index = find_last_forward(
+                        arr, arr[index], index, pull.dest, length_pulled - count
+                    )
+                    self.rotate(count, pull.source, index - 1)
+                    pull.source = index - 1 - count
+
+        buffer_size = buffer1[1] - buffer1[0]
+        block_size = length // buffer_size + 1
+        buffer2_length = buffer2[1] - buffer2[0]
+
+        # 3. Merge each A and B pair at this level
+        iterator.begin()
+        while not iterator.finished():
+            a_start, a_end = iterator.next_range()
+            b_start, b_end = iterator.next_range()
+
+            # Skip the parts of A or B holding the internal buffers
+            start = a_start
+            skip = False
+            for pull in pulls:
+                if start == pull.start:
+                    if pull.source > pull.dest:
+                        a_start += pull.count
+                        skip = skip or a_end == a_start
+                    elif pull.source < pull.dest:
+                        b_end -= pull.count
+                        skip = skip or b_end == b_start
+            if skip:
+                continue
+
+            if arr[b_end - 1] < arr[a_start]:
+                self.rotate(a_end - a_start, a_start, b_end)
+            elif arr[a_end] < arr[a_end - 1]:
+                self._merge_blocks(
+                    a_start, a_end, b_start, b_end, block_size, buffer1, buffer2
+                )
+
+        # 4. Sort the scratch buffer and put both buffers back
+        insertion_sort_block(arr, buffer2[0], buffer2[0] + buffer2_length)
+        for pull in pulls:
+            unique = pull.count * 2
+            if pull.source > pull.dest:
+                # Pulled to the left: redistribute to the right
+                buf_start, buf_end = pull.start, pull.start + pull.count
+                while buf_end > buf_start:
+                    index = find_first_forward(
+                        arr, arr[buf_start], buf_end, pull.end, unique
+                    )
+                    amount = index - buf_end
+                    self.rotate(buf_end - buf_start, buf_start, index)
+                    buf_start += amount + 1
+                    buf_end += amount
+                    unique -= 2
+            elif pull.source < pull.dest:
+                # Pulled to the right: redistribute to the left
+                buf_start, buf_end = pull.end - pull.count, pull.end
+                while buf_end > buf_start:
+                    index = find_last_backward(
+                        arr, arr[buf_end - 1], pull.start, buf_start, unique
+                    )
+                    amount = buf_start - index
+                    self.rotate(amount, index, buf_end)
+                    buf_start -= amount
+                    buf_end -= amount + 1
+                    unique -= 2
+
+    def _merge_blocks(
+        self, a_start, a_end, b_start, b_end, block_size, buffer1, buffer2
+    ):
+        arr, cache, cache_size = self.arr, self.cache, self.cache_size
+        buffer2_start = buffer2[0]
+        has_buffer2 = buffer2[1] > buffer2[0]
+
+        # Tag the first value of each full A block with a buffer1 value
+        block_a_start, block_a_end = a_start, a_end
+        first_a_end = a_start + (a_end - a_start) % block_size
+        index_a = buffer1[0]
+        for index in range(first_a_end, block_a_end, block_size):
+            arr[index_a], arr[index] = arr[index], arr[index_a]
+            index_a += 1
+
+        # Roll the A blocks through the B blocks
+        last_a_start, last_a_end = a_start, first_a_end
+        last_b_start = last_b_end = 0
+        block_b_start = b_start
+        block_b_end = b_start + min(block_size, b_end - b_start)
+        block_a_start = first_a_end
+        index_a = buffer1[0]
+
+        last_a_length = last_a_end - last_a_start
+        if last_a_length <= cache_size:
+            cache[:last_a_length] = arr[last_a_start:last_a_end]
+        elif has_buffer2:
+            block_swap(arr, last_a_start, buffer2_start, last_a_length)
+
+        while block_a_end > block_a_start:
+            if (
+                last_b_end > last_b_start and not arr[last_b_end - 1] < arr[index_a]
+            ) or block_b_end == block_b_start:
+                # Drop the smallest A block behind: split the previous B
+                # block where that A block's first value belongs
+                b_split = bisect_left(arr, arr[index_a], last_b_start, last_b_end)
+                b_remaining = last_b_end - b_split
+
+                min_a = block_a_start
+                for find_a in range(min_a + block_size, block_a_end, block_size):
+                    if arr[find_a] < arr[min_a]:
+                        min_a = find_a
+                block_swap(arr, block_a_start, min_a, block_size)
+
+                # Untag it, then merge the previous A block with the B values
+                # that follow it
+                arr[block_a_start], arr[index_a] = arr[index_a], arr[block_a_start]
+                index_a += 1
+                self._merge_last(last_a_start, last_a_end, last_a_end, b_split, buffer2)
+
+                if has_buffer2 or block_size <= cache_size:
+                    # Stash this A block where the next merge expects it;
+                    # its old slots then hold data whose order doesn't
+                    # matter, so a block swap stands in for the rotation
+                    if block_size <= cache_size:
+                        block_end = block_a_start + block_size
+                        cache[:block_size] = arr[block_a_start:block_end]
+                    else:
+                        block_swap(arr, block_a_start, buffer2_start, block_size)
+                    block_swap(
+                        arr,
+                        b_split,
+                        block_a_start + block_size - b_remaining,
+                        b_remaining,
+                    )
+                else:
+                    self.rotate(
+                        block_a_start - b_split, b_split, block_a_start + block_size
+                    )
+
+                last_a_start = block_a_start - b_remaining
+                last_a_end = last_a_start + block_size
+                last_b_start, last_b_end = last_a_end, last_a_end + b_remaining
+                block_a_start += block_size
+            elif block_b_end - block_b_start < block_size:
+                # Move the last, short B block in front of the A blocks
+                # (without the cache, which may hold the previous A block)
+                self.rotate(
+                    block_b_start - block_a_start,
+                    block_a_start,
+                    block_b_end,
+                    use_cache=False,
+                )
+                last_b_start = block_a_start
+                last_b_end = block_a_start + (block_b_end - block_b_start)
+                block_a_start += block_b_end - block_b_start
+                block_a_end += block_b_end - block_b_start
+                block_b_end = block_b_start
+            else:
+                # Roll the leftmost A block past the next B block
+                block_swap(arr, block_a_start, block_b_start, block_size)
+                last_b_start, last_b_end = block_a_start, block_a_start + block_size
+                block_a_start += block_size
+                block_a_end += block_size
+                block_b_start += block_size
+                if block_b_end > b_end - block_size:
+                    block_b_end = b_end
+                else:
+                    block_b_end += block_size
+
+        self._merge_last(last_a_start, last_a_end, last_a_end, b_end, buffer2)
+
+    def _merge_last(self, a_start, a_end, b_start, b_end, buffer2):
+        if a_end - a_start <= self.cache_size:
+            self.merge_external(a_start, a_end, b_start, b_end)
+        elif buffer2[1] > buffer2[0]:
+            self.merge_internal(a_start, a_end, b_start, b_end, buffer2[0])
         else:
-            arr[k] = right_arr[j]
-            j += 1
-        k += 1
-    
-    while i < len(left_arr):
-        arr[k] = left_arr[i]
-        i += 1
-        k += 1
-    
-    while j < len(right_arr):
-        arr[k] = right_arr[j]
-        j += 1
-        k += 1
+            self.merge_in_place(a_start, a_end, b_start, b_end)
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MiB (Unix only)."""
+    import resource  # not available on Windows
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure_sort(n, method="block", cache_size=0, seed=0):
+    """
+    Sort n random ints once and return (seconds, extra peak RSS in MiB).
+    Meant to run in a fresh process, since peak RSS never goes back down.
+    """
+    rng = random.Random(seed)
+    data = [rng.randrange(max(n // 4, 1)) for _ in range(n)]
+    before = peak_rss_mb()
+    start = time.perf_counter()
+    if method == "block":
+        block_sort_in_place(data, cache_size)
+    else:
+        data = sorted(data)
+    elapsed = time.perf_counter() - start
+    extra = peak_rss_mb() - before
+    assert all(data[i] <= data[i + 1] for i in range(n - 1))
+    return elapsed, extra
+
+
+def benchmark_block_sort(sizes=(100_000, 200_000, 400_000), cache_size=0):
+    """
+    Report how far peak RSS rises over the input while sorting it, for
+    block_sort_in_place and for sorted() (which copies the list). Each
+    measurement runs in its own interpreter.
+    """
+    print(
+        f"{'n':>10} {'input MiB':>10} {'block s':>9} {'block +MiB':>11}"
+        f" {'sorted() +MiB':>14}"
+    )
+    for n in sizes:
+        row = {}
+        for method in ("block", "sorted"):
+            command = [sys.executable, __file__, "--measure", method, "--n", str(n)]
+            command += ["--cache-size", str(cache_size)]
+            output = subprocess.run(
+                command, capture_output=True, text=True, check=True
+            )
+            row[method] = [float(x) for x in output.stdout.split()]
+        input_mb = n * 8 / (1024 * 1024)
+        print(
+            f"{n:>10} {input_mb:>10.1f} {row['block'][0]:>9.2f}"
+            f" {row['block'][1]:>11.2f} {row['sorted'][1]:>14.2f}"
+        )
 
 
 if __name__ == "__main__":
-    arr = [64, 34, 25, 12, 22, 11, 90]
-    print("Block Sort:", block_sort(arr))
+    parser = argparse.ArgumentParser(description="Block sort examples")
+    parser.add_argument("--benchmark", action="store_true")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[250_000, 500_000, 1_000_000]
+    )
+    parser.add_argument("--cache-size", type=int, default=0)
+    parser.add_argument(
+        "--measure", choices=["block", "sorted"], help=argparse.SUPPRESS
+    )
+    parser.add_argument("--n", type=int, default=100_000, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(*measure_sort(args.n, args.measure, args.cache_size))
+    elif args.benchmark:
+        benchmark_block_sort(args.sizes, args.cache_size)
+    else:
+        arr = [64, 34, 25, 12, 22, 11, 90]
+        print("Block Sort:", block_sort(arr))
 
+        arr2 = [random.randrange(100) for _ in range(1000)]
+        block_sort_in_place(arr2, cache_size=0)
+        print("Block Sort (in place, no cache):", arr2 == sorted(arr2))
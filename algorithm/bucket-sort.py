@@ -4,36 +4,107 @@ Bucket Sort Implementation in Python
 Bucket sort distributes values into buckets, sorts each bucket, then concatenates.
 Works best when input is uniformly distributed.
 
-Time Complexity: O(n + k) average, O(n²) worst case
+Equal-width buckets let skewed data pile into one bucket, so this version
+sizes the buckets from the data instead: the boundaries are quantiles of a
+sorted sample, and each value finds its bucket by binary search. A bucket
+that still ends up overfull (e.g. a long run of one value next to others)
+is bucketed again over its own, narrower range; past MAX_DEPTH levels it
+falls back to merge sort, so the worst case stays O(n log n).
+
+bucket_sort_array() is the NumPy path for float (or int) arrays: quantile
+boundaries from a sample, one vectorized searchsorted to assign buckets, and
+np.sort on each cache-sized bucket.
+
+Pass stats={} to either function to get bucket occupancy counts back for
+tuning.
+
+Time Complexity: O(n) expected, O(n log n) worst case
 Space Complexity: O(n + k)
 """
 
+import random
+import time
+from bisect import bisect_right
+
+from sort_support import load_sibling, np, scatter_by_bucket
+
+TARGET_BUCKET_SIZE = 16
+INSERTION_LIMIT = 48
+SAMPLE_PER_BUCKET = 2
+NUMPY_SAMPLE_PER_BUCKET = 128
+MAX_DEPTH = 8
+NUMPY_BUCKET_SIZE = 1 << 15
+OVERFULL_FACTOR = 4
+
+
+def _new_stats(stats):
+    if stats is not None:
+        stats.update(bucket_sizes=[], rebucketed=0, fallbacks=0, max_depth=0)
+    return stats
+
+
+def bucket_sort(arr, bucket_count=None, stats=None):
+    """
+    Bucket Sort - adaptive, stable
+
+    Args:
+        arr: List of numbers
+        bucket_count: Top-level bucket count (default: len(arr) /
+            TARGET_BUCKET_SIZE); deeper levels always size themselves
+        stats: Optional dict that receives the top-level "bucket_sizes",
+            how many buckets were "rebucketed", merge sort "fallbacks" and
+            the "max_depth" reached
+
+    Returns:
+        List: Sorted list (original list is not modified)
+    """
+    _new_stats(stats)
+    return _bucket_sort(list(arr), bucket_count, 0, stats, random.Random(0))
+
+
+def _bucket_sort(values, bucket_count, depth, stats, rng):
+    n = len(values)
+    if stats is not None:
+        stats["max_depth"] = max(stats["max_depth"], depth)
+    if n <= INSERTION_LIMIT:
+        insertion_sort_bucket(values)
+        return values
+
+    if min(values) == max(values):
+        return values
+    if depth >= MAX_DEPTH:
+        if stats is not None:
+            stats["fallbacks"] += 1
+        return load_sibling("merge-sort").merge_sort_bottom_up(values)
+
+    # Every SAMPLE_PER_BUCKET-th value of a sorted sample becomes a bucket
+    # boundary, so buckets get roughly equal counts however the values are
+    # spread. Equal values always land in the same bucket (stability)
+    bucket_count = bucket_count or max(2, n // TARGET_BUCKET_SIZE)
+    sample_size = bucket_count * SAMPLE_PER_BUCKET
+    sample = list(values) if n <= sample_size else rng.sample(values, sample_size)
+    sample = load_sibling("merge-sort").merge_sort_bottom_up(sample)
+    step = len(sample) / bucket_count
+    boundaries = [sample[int(i * step)] for i in range(1, bucket_count)]
 
-def bucket_sort(arr, bucket_count=10):
-    if len(arr) == 0:
-        return arr
-    
-    min_val = min(arr)
-    max_val = max(arr)
-    bucket_size = (max_val - min_val) / bucket_count
-    
-    # Create buckets
+    # Create buckets and distribute elements into them
     buckets = [[] for _ in range(bucket_count)]
-    
-    # Distribute elements into buckets
-    for num in arr:
-        bucket_index = min(
-            int((num - min_val) / bucket_size),
-            bucket_count - 1
-        )
-        buckets[bucket_index].append(num)
-    
-    # Sort each bucket and concatenate
+    for num in values:
+        buckets[bisect_right(boundaries, num)].append(num)
+    if stats is not None and depth == 0:
+        stats["bucket_sizes"] = [len(bucket) for bucket in buckets]
+
+    # Sort each bucket and concatenate; overfull ones get bucketed again
     sorted_arr = []
     for bucket in buckets:
-        insertion_sort_bucket(bucket)
+        if len(bucket) > INSERTION_LIMIT:
+            if stats is not None:
+                stats["rebucketed"] += 1
+            bucket = _bucket_sort(bucket, None, depth + 1, stats, rng)
+        else:
+            insertion_sort_bucket(bucket)
         sorted_arr.extend(bucket)
-    
+
     return sorted_arr
 
 
@@ -47,7 +118,96 @@ def insertion_sort_bucket(arr):
         arr[j + 1] = key
 
 
+def bucket_sort_array(values, bucket_count=None, stats=None, seed=0):
+    """
+    Bucket Sort - NumPy version for float or int arrays (stable)
+
+    Args:
+        values: 1-D ndarray; NaNs are placed last
+        bucket_count: Top-level bucket count (default: n / NUMPY_BUCKET_SIZE)
+        stats: Optional dict, filled like bucket_sort's
+
+    Returns:
+        ndarray: New sorted array
+    """
+    values = np.asarray(values)
+    if values.ndim != 1:
+        raise ValueError("bucket_sort_array expects a 1-D array")
+    _new_stats(stats)
+    rng = np.random.default_rng(seed)
+
+    if values.dtype.kind == "f":
+        nan = np.isnan(values)
+        if nan.any():
+            finite = _bucket_sort_array(values[~nan], bucket_count, 0, stats, rng)
+            return np.concatenate((finite, values[nan]))
+    return _bucket_sort_array(values.copy(), bucket_count, 0, stats, rng)
+
+
+def _bucket_sort_array(values, bucket_count, depth, stats, rng):
+    n = values.shape[0]
+    if stats is not None:
+        stats["max_depth"] = max(stats["max_depth"], depth)
+    # Nothing to sort, and np.quantile rejects an empty sample
+    if n < 2:
+        return values
+    bucket_count = bucket_count or n // NUMPY_BUCKET_SIZE
+    if bucket_count < 2 or depth >= MAX_DEPTH:
+        if depth >= MAX_DEPTH and stats is not None:
+            stats["fallbacks"] += 1
+        values.sort(kind="stable")
+        return values
+
+    # Quantiles of a sample become the bucket boundaries
+    sample_size = min(n, bucket_count * NUMPY_SAMPLE_PER_BUCKET)
+    sample = rng.choice(values, size=sample_size)
+    cuts = np.linspace(0, 1, bucket_count + 1)[1:-1]
+    boundaries = np.quantile(sample, cuts, method="inverted_cdf")
+    ids = np.searchsorted(boundaries, values, side="right")
+    counts = np.bincount(ids, minlength=bucket_count)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    values = scatter_by_bucket(values, ids)
+    if stats is not None and depth == 0:
+        stats["bucket_sizes"] = counts.tolist()
+
+    limit = max(OVERFULL_FACTOR * n / bucket_count, NUMPY_BUCKET_SIZE)
+    for b in range(bucket_count):
+        lo, hi = offsets[b], offsets[b + 1]
+        bucket = values[lo:hi]
+        if hi - lo > limit and bucket.min() < bucket.max():
+            if stats is not None:
+                stats["rebucketed"] += 1
+            values[lo:hi] = _bucket_sort_array(bucket, None, depth + 1, stats, rng)
+        else:
+            bucket.sort(kind="stable")
+    return values
+
+
 if __name__ == "__main__":
     arr = [0.42, 0.32, 0.33, 0.52, 0.37, 0.47, 0.51]
     print("Bucket Sort:", bucket_sort(arr))
 
+    rng = random.Random(0)
+    skewed = [rng.expovariate(1.0) ** 4 for _ in range(100_000)]
+    stats = {}
+    start = time.perf_counter()
+    assert bucket_sort(skewed, stats=stats) == sorted(skewed)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Bucket Sort (100,000 skewed floats): {elapsed:.2f}s,"
+        f" largest top-level bucket {max(stats['bucket_sizes'])},"
+        f" rebucketed {stats['rebucketed']}, fallbacks {stats['fallbacks']}"
+    )
+
+    if np is not None:
+        data = np.random.default_rng(0).lognormal(0, 3, size=2_000_000)
+        stats = {}
+        start = time.perf_counter()
+        result = bucket_sort_array(data, stats=stats)
+        elapsed = time.perf_counter() - start
+        assert np.array_equal(result, np.sort(data))
+        print(
+            f"Bucket Sort (ndarray, 2,000,000 lognormal floats): {elapsed:.2f}s,"
+            f" {len(stats['bucket_sizes'])} buckets,"
+            f" largest {max(stats['bucket_sizes'])}"
+        )
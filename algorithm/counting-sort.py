@@ -4,10 +4,24 @@ Counting Sort Implementation in Python
 Counting sort counts occurrences of each value, then reconstructs the sorted array.
 Works best when the range of values is small compared to the number of elements.
 
+When the range is much larger than n (one outlier like 10**9 would need a
+count array of a billion entries), counting_sort() switches to a sparse
+mode that only counts the values that occur: np.unique with NumPy, a dict
+otherwise. CountingHistogram does the same incrementally over a stream and
+emits sorted output lazily, in O(distinct values) memory.
+
 Time Complexity: O(n + k) where k is the range of values
-Space Complexity: O(k) - for the count array
+    Sparse mode: O(n + d log d) for d distinct values
+Space Complexity: O(k) - for the count array (O(d) in sparse mode)
 """
 
+from itertools import repeat
+
+from sort_support import np
+
+# Use the sparse mode once the range is this many times larger than n
+SPARSE_RATIO = 8
+
 
 def counting_sort(arr):
     if len(arr) == 0:
@@ -16,6 +30,8 @@ def counting_sort(arr):
     min_val = min(arr)
     max_val = max(arr)
     range_val = max_val - min_val + 1
+    if range_val > SPARSE_RATIO * len(arr):
+        return sparse_counting_sort(arr)
     
     # Count occurrences of each value
     count = [0] * range_val
@@ -35,7 +51,87 @@ def counting_sort(arr):
     return output
 
 
+def sparse_counting_sort(arr):
+    """
+    Counting Sort - sparse mode: counts only the values that occur
+
+    Returns:
+        List: Sorted list
+    """
+    if len(arr) == 0:
+        return list(arr)
+    if np is not None:
+        # Ints beyond 64 bits become an object array and take the dict path
+        packed = np.asarray(arr)
+        if packed.dtype.kind in "iu":
+            values, counts = np.unique(packed, return_counts=True)
+            return np.repeat(values, counts).tolist()
+
+    return list(CountingHistogram(arr))
+
+
+class CountingHistogram:
+    """
+    Incremental counts of hashable, orderable values (e.g. event codes).
+
+    Feed it from an unbounded stream with add()/update(); iterating over it
+    at any point yields everything seen so far in sorted order, lazily, so
+    memory stays O(distinct values) however many events arrive.
+    """
+
+    def __init__(self, iterable=()):
+        self.counts = {}
+        self.total = 0
+        self.update(iterable)
+
+    def add(self, value, count=1):
+        self.counts[value] = self.counts.get(value, 0) + count
+        self.total += count
+
+    def update(self, iterable):
+        counts = self.counts
+        added = 0
+        for value in iterable:
+            counts[value] = counts.get(value, 0) + 1
+            added += 1
+        self.total += added
+        return self
+
+    def items(self):
+        """(value, count) pairs in ascending value order."""
+        for value in sorted(self.counts):
+            yield value, self.counts[value]
+
+    def __iter__(self):
+        for value, count in self.items():
+            yield from repeat(value, count)
+
+    def __len__(self):
+        return self.total
+
+    def distinct(self):
+        return len(self.counts)
+
+
+def streaming_counting_sort(iterable):
+    """
+    Counting Sort - streaming version
+
+    Consumes the iterable into a CountingHistogram, then yields its values
+    in sorted order one at a time (the input must end before the first
+    value can be emitted).
+    """
+    yield from CountingHistogram(iterable)
+
+
 if __name__ == "__main__":
     arr = [4, 2, 2, 8, 3, 3, 1]
     print("Counting Sort:", counting_sort(arr))
+    print("Counting Sort (sparse, one outlier):", counting_sort([3, 1, 10**9, 2, 1]))
+
+    events = (code for code in [404, 200, 200, 500, 200, 404] * 1000)
+    histogram = CountingHistogram()
+    histogram.update(events)
+    print("Streaming histogram:", list(histogram.items()))
+    print("Streaming sort:", list(streaming_counting_sort(iter([3, 1, 3, 2, 1]))))
 
@@ -8,8 +8,25 @@ Time Complexity: O(n²) in all cases
 Space Complexity: O(1) - sorts in place
 
 Note: Minimizes writes (useful for flash memory)
+
+cycle_sort_in_place() is the minimal-write mode for wear-limited storage: it
+sorts an mmap, array.array, any other writable buffer (or a list) where it
+lives. Instead of scanning for each cycle position, it precomputes where
+every element goes from one O(n log n) stable argsort (the rank array).
+Elements that already sit inside the slots their value ends up in are left
+alone, so each position holding the wrong value is written exactly once,
+which is the minimum, and nothing else is written.
+    Time Complexity: O(n log n)
+    Space Complexity: O(n) for the rank array (in memory, not on storage)
 """
 
+import mmap
+import random
+import struct
+import tempfile
+
+from sort_support import load_sibling, np
+
 
 def cycle_sort(arr):
     sorted_arr = arr.copy()
@@ -56,7 +73,95 @@ def cycle_sort(arr):
     return sorted_arr
 
 
+def cycle_sort_in_place(values, fmt=None):
+    """
+    Cycle Sort - minimal-write, in place
+
+    Args:
+        values: Writable buffer (mmap, array.array, bytearray, ndarray, ...)
+            or a list
+        fmt: Item format for raw buffers such as mmap or bytearray, e.g. "q"
+            or "d" (see buffer-sort.py's writable_view)
+
+    Returns:
+        int: Number of element writes made
+    """
+    try:
+        view = load_sibling("buffer-sort").writable_view(values, fmt)
+    except TypeError:
+        if isinstance(values, memoryview) or not hasattr(values, "__setitem__"):
+            raise
+        view = values  # A list or other mutable sequence
+    destination = write_targets(view)
+
+    writes = 0
+    for start in range(len(view)):
+        if destination[start] == start:
+            continue
+        # Follow the cycle through start: each step writes the element in
+        # hand to its destination and picks up the one it displaces
+        item = view[start]
+        pos = destination[start]
+        while pos != start:
+            displaced = view[pos]
+            view[pos] = item
+            writes += 1
+            item = displaced
+            destination[pos], pos = pos, destination[pos]
+        view[start] = item
+        writes += 1
+        destination[start] = start
+    return writes
+
+
+def write_targets(values):
+    """
+    Rank array: destination[i] is the slot values[i] moves to. Elements
+    already inside the slots of their value in sorted order stay put; the
+    others fill the remaining slots of that run, so no write is wasted on
+    moving an equal value.
+    """
+    n = len(values)
+    if np is not None and isinstance(values, memoryview):
+        order = np.argsort(np.asarray(values), kind="stable").tolist()
+    else:
+        order = load_sibling("sort-api").argsort(values)
+
+    destination = list(range(n))
+    lo = 0
+    while lo < n:
+        # order[lo:hi] are the indices of one value's run of slots
+        value = values[order[lo]]
+        hi = lo + 1
+        while hi < n and values[order[hi]] == value:
+            hi += 1
+        movers = [i for i in order[lo:hi] if not lo <= i < hi]
+        if movers:
+            run = values[lo:hi]
+            free = [lo + k for k in range(hi - lo) if run[k] != value]
+            for i, slot in zip(movers, free):
+                destination[i] = slot
+        lo = hi
+    return destination
+
+
 if __name__ == "__main__":
     arr = [64, 34, 25, 12, 22, 11, 90]
     print("Cycle Sort:", cycle_sort(arr))
 
+    # 100,000 int64 readings in a memory-mapped file, 5% of them out of place
+    n = 100_000
+    rng = random.Random(0)
+    readings = list(range(n))
+    for _ in range(n // 40):
+        i, j = rng.randrange(n), rng.randrange(n)
+        readings[i], readings[j] = readings[j], readings[i]
+    misplaced = sum(value != i for i, value in enumerate(readings))
+    with tempfile.TemporaryFile() as f:
+        f.write(struct.pack(f"<{n}q", *readings))
+        f.flush()
+        with mmap.mmap(f.fileno(), 0) as mapped:
+            writes = cycle_sort_in_place(mapped, "q")
+            assert list(memoryview(mapped).cast("q")) == sorted(readings)
+    print(f"Cycle Sort (mmap, {n:,} int64): {writes} writes for {misplaced} misplaced")
+
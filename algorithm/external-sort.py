@@ -0,0 +1,376 @@
+"""
+External Merge Sort Implementation in Python
+
+External merge sort handles data that doesn't fit in memory. It works in two
+phases:
+1. Run generation: read as many items as fit in the memory budget, sort them
+   in memory (merge sort or block sort from this folder) and write each
+   sorted run to a temp file in a compact binary format.
+2. K-way merge: stream every run back through a heap, reading each run with
+   a small buffer (or through mmap), and write the merged output. If there
+   are more runs than max_fan_in, runs are merged in several passes.
+
+Two record formats are supported:
+- "int64": fixed-width little-endian signed 64-bit integers
+- "lines": newline-separated byte strings, stored in runs as
+  length-prefixed records
+
+Time Complexity: O(n log n) comparisons, O(n log_k(runs)) I/O
+Space Complexity: O(memory_budget) in RAM, O(n) on disk
+"""
+
+import argparse
+import heapq
+import mmap
+import os
+import random
+import shutil
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from itertools import islice
+
+from sort_support import load_sibling
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+DEFAULT_MAX_FAN_IN = 64
+MIN_READ_BUFFER = 64 * 1024
+WRITE_BATCH = 64 * 1024
+LENGTH_PREFIX = struct.Struct("<I")
+
+
+def _merge_run_sort(items):
+    return load_sibling("merge-sort").merge_sort_bottom_up(items)
+
+
+def _block_run_sort(items):
+    return load_sibling("block-sort").block_sort_in_place(items)
+
+
+RUN_SORTERS = {
+    "merge": _merge_run_sort,
+    "block": _block_run_sort,
+}
+
+
+class Int64Format:
+    """Fixed-width little-endian int64 records."""
+
+    @staticmethod
+    def item_cost(item):
+        # list slot + int object + merge buffer slot
+        return 48
+
+    @staticmethod
+    def read_input(path, buffer_bytes):
+        with open(path, "rb") as f:
+            while True:
+                data = f.read(buffer_bytes - buffer_bytes % 8)
+                if not data:
+                    return
+                yield from _int64_array(data)
+
+    @staticmethod
+    def write(items, f):
+        items = iter(items)
+        while batch := _int64_array(islice(items, WRITE_BATCH)):
+            f.write(batch.tobytes())
+
+    @staticmethod
+    def read_run(path, buffer_bytes, use_mmap):
+        # A memoryview cast reads native byte order, so only map on
+        # little-endian hosts
+        if use_mmap and sys.byteorder == "little" and os.path.getsize(path):
+            with open(path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm).cast("q")
+                    try:
+                        yield from view
+                    finally:
+                        view.release()
+            return
+        yield from Int64Format.read_input(path, buffer_bytes)
+
+
+class LinesFormat:
+    """Newline-separated byte strings; runs use length-prefixed records."""
+
+    @staticmethod
+    def item_cost(item):
+        return sys.getsizeof(item) + 16
+
+    @staticmethod
+    def read_input(path, buffer_bytes):
+        with open(path, "rb", buffering=buffer_bytes) as f:
+            for line in f:
+                yield line.rstrip(b"\n")
+
+    @staticmethod
+    def write(items, f):
+        pack = LENGTH_PREFIX.pack
+        f.writelines(pack(len(item)) + item for item in items)
+
+    @staticmethod
+    def read_run(path, buffer_bytes, use_mmap):
+        size = LENGTH_PREFIX.size
+        if use_mmap and os.path.getsize(path):
+            with open(path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    pos, end = 0, len(mm)
+                    while pos < end:
+                        (length,) = LENGTH_PREFIX.unpack_from(mm, pos)
+                        pos += size
+                        yield mm[pos : pos + length]
+                        pos += length
+            return
+        with open(path, "rb", buffering=buffer_bytes) as f:
+            while True:
+                header = f.read(size)
+                if not header:
+                    return
+                (length,) = LENGTH_PREFIX.unpack(header)
+                yield f.read(length)
+
+    @staticmethod
+    def write_output(items, f):
+        f.writelines(item + b"\n" for item in items)
+
+
+FORMATS = {
+    "int64": Int64Format,
+    "lines": LinesFormat,
+}
+
+
+def _int64_array(data):
+    """Build an int64 array from raw little-endian bytes or from ints."""
+    values = array("q")
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        values.frombytes(data)
+    else:
+        values.extend(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class ExternalSorter:
+    """
+    Sorts an iterable of int64s or byte strings in bounded memory.
+
+    Args:
+        fmt: "int64" or "lines"
+        memory_budget: Approximate bytes of Python objects held at once
+        tmp_dir: Where run files go (default: the system temp dir)
+        use_mmap: Read runs through mmap instead of buffered reads
+        run_sort: "merge" or "block", the in-memory sort for each run
+        max_fan_in: Most runs merged in one pass
+    """
+
+    def __init__(
+        self,
+        fmt="int64",
+        memory_budget=DEFAULT_MEMORY_BUDGET,
+        tmp_dir=None,
+        use_mmap=False,
+        run_sort="merge",
+        max_fan_in=DEFAULT_MAX_FAN_IN,
+    ):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format {fmt!r}; use one of {list(FORMATS)}")
+        if run_sort not in RUN_SORTERS:
+            raise ValueError(f"Unknown run_sort {run_sort!r}")
+        if max_fan_in < 2:
+            raise ValueError("max_fan_in must be at least 2")
+        self.format = FORMATS[fmt]
+        self.memory_budget = memory_budget
+        self.tmp_dir = tmp_dir
+        self.use_mmap = use_mmap
+        self.run_sort = RUN_SORTERS[run_sort]
+        self.max_fan_in = max_fan_in
+        self.stats = {"items": 0, "runs": 0, "merge_passes": 0}
+
+    def _read_buffer(self, fan_in):
+        return max(MIN_READ_BUFFER, self.memory_budget // (fan_in + 1))
+
+    def _write_run(self, items, work_dir):
+        fd, path = tempfile.mkstemp(suffix=".run", dir=work_dir)
+        with os.fdopen(fd, "wb") as f:
+            self.format.write(items, f)
+        return path
+
+    def _generate_runs(self, items, work_dir):
+        runs = []
+        chunk = []
+        used = 0
+        cost = self.format.item_cost
+        for item in items:
+            chunk.append(item)
+            used += cost(item)
+            if used >= self.memory_budget:
+                runs.append(self._write_run(self.run_sort(chunk), work_dir))
+                self.stats["items"] += len(chunk)
+                chunk = []
+                used = 0
+        if chunk or not runs:
+            runs.append(self._write_run(self.run_sort(chunk), work_dir))
+            self.stats["items"] += len(chunk)
+        self.stats["runs"] = len(runs)
+        return runs
+
+    def _open_runs(self, runs):
+        buffer_bytes = self._read_buffer(len(runs))
+        return [
+            self.format.read_run(path, buffer_bytes, self.use_mmap) for path in runs
+        ]
+
+    def _reduce_runs(self, runs, work_dir):
+        """Merge groups of max_fan_in runs until one final merge remains."""
+        while len(runs) > self.max_fan_in:
+            merged = []
+            for i in range(0, len(runs), self.max_fan_in):
+                group = runs[i : i + self.max_fan_in]
+                merged.append(
+                    self._write_run(heapq.merge(*self._open_runs(group)), work_dir)
+                )
+                for path in group:
+                    os.remove(path)
+            runs = merged
+            self.stats["merge_passes"] += 1
+        return runs
+
+    def sort(self, items):
+        """
+        Yield the items of an iterable in sorted order.
+
+        Temp files are removed once the generator is exhausted or closed.
+        """
+        work_dir = tempfile.mkdtemp(prefix="external-sort-", dir=self.tmp_dir)
+        try:
+            runs = self._generate_runs(items, work_dir)
+            runs = self._reduce_runs(runs, work_dir)
+            self.stats["merge_passes"] += 1
+            yield from heapq.merge(*self._open_runs(runs))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def sort_file(self, src, dst):
+        """Sort the records in file src into file dst and return stats."""
+        items = self.format.read_input(src, self._read_buffer(1))
+        writer = getattr(self.format, "write_output", self.format.write)
+        batch_size = max(1, self._read_buffer(1) // 64)
+        with open(dst, "wb") as out:
+            batch = []
+            for item in self.sort(items):
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    writer(batch, out)
+                    batch = []
+            writer(batch, out)
+        return dict(self.stats)
+
+
+def external_sort(items, fmt="int64", memory_budget=DEFAULT_MEMORY_BUDGET, **options):
+    """
+    External Merge Sort - iterator API
+
+    Args:
+        items: Any iterable of ints (fmt="int64") or bytes (fmt="lines")
+        memory_budget: Approximate bytes held in memory at once
+        **options: tmp_dir, use_mmap, run_sort, max_fan_in
+
+    Returns:
+        Generator yielding the items in sorted order
+    """
+    return ExternalSorter(fmt, memory_budget, **options).sort(items)
+
+
+def external_sort_file(
+    src, dst, fmt="lines", memory_budget=DEFAULT_MEMORY_BUDGET, **options
+):
+    """
+    External Merge Sort - file API
+
+    Args:
+        src: Input file of newline-separated lines or raw int64 records
+        dst: Output file, written in the same format
+        fmt: "lines" or "int64"
+        memory_budget: Approximate bytes held in memory at once
+
+    Returns:
+        Dict of stats: items, runs, merge_passes
+    """
+    return ExternalSorter(fmt, memory_budget, **options).sort_file(src, dst)
+
+
+def parse_size(text):
+    """Parse sizes like "512K", "64M" or "2G" into bytes."""
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3}
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def benchmark_external_sort(sizes, memory_budget, use_mmap=False, seed=0):
+    """Report external sort throughput for int64 files of several sizes."""
+    rng = random.Random(seed)
+    print(f"external_sort_file (int64), memory budget {memory_budget:,} bytes")
+    print(f"{'items':>12} {'MiB':>8} {'runs':>6} {'seconds':>9} {'MiB/s':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "input.bin")
+        dst = os.path.join(tmp, "output.bin")
+        for n in sizes:
+            with open(src, "wb") as f:
+                for lo in range(0, n, 1 << 16):
+                    count = min(1 << 16, n - lo)
+                    Int64Format.write(
+                        (rng.randrange(-(2**63), 2**63) for _ in range(count)), f
+                    )
+            start = time.perf_counter()
+            stats = external_sort_file(
+                src, dst, fmt="int64", memory_budget=memory_budget, use_mmap=use_mmap
+            )
+            elapsed = time.perf_counter() - start
+            mib = n * 8 / 1024**2
+            print(
+                f"{n:>12,} {mib:>8.1f} {stats['runs']:>6} "
+                f"{elapsed:>9.2f} {mib / elapsed:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="External merge sort")
+    parser.add_argument("src", nargs="?", help="Input file")
+    parser.add_argument("dst", nargs="?", help="Output file")
+    parser.add_argument("--format", choices=list(FORMATS), default="lines")
+    parser.add_argument("--memory", type=parse_size, default=DEFAULT_MEMORY_BUDGET)
+    parser.add_argument("--mmap", action="store_true", help="Read runs via mmap")
+    parser.add_argument("--run-sort", choices=list(RUN_SORTERS), default="merge")
+    parser.add_argument("--benchmark", action="store_true")
+    parser.add_argument(
+        "--sizes",
+        type=lambda s: [int(x) for x in s.split(",")],
+        default=[100_000, 1_000_000, 4_000_000],
+    )
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_external_sort(args.sizes, args.memory, args.mmap)
+    elif args.src and args.dst:
+        stats = external_sort_file(
+            args.src,
+            args.dst,
+            fmt=args.format,
+            memory_budget=args.memory,
+            use_mmap=args.mmap,
+            run_sort=args.run_sort,
+        )
+        print(f"Sorted {stats['items']:,} items using {stats['runs']} run(s)")
+    else:
+        data = [64, 34, 25, 12, 22, 11, 90, -5, 0]
+        # A tiny budget forces several runs and a multi-pass merge
+        result = list(external_sort(data, memory_budget=100, max_fan_in=2))
+        print("External Sort:", result)
@@ -4,6 +4,10 @@ Heap Sort Implementation in Python
 Heap sort uses a binary heap data structure to extract minimum/maximum elements.
 It builds a max heap, then repeatedly extracts the maximum element.
 
+Also includes heap-based streaming tools that accept iterators of unknown
+length: a bounded top-k / bottom-k heap, a lazy k-way merge of sorted
+iterables, and an indexed priority queue with decrease-key.
+
 Time Complexity: O(n log n) in all cases
 Space Complexity: O(1) - sorts in place
 """
@@ -26,22 +30,334 @@ def heap_sort(arr):
 
 
 def heapify(arr, n, i):
-    largest = i
-    left = 2 * i + 1
-    right = 2 * i + 2
-    
-    if left < n and arr[left] > arr[largest]:
-        largest = left
-    
-    if right < n and arr[right] > arr[largest]:
-        largest = right
-    
-    if largest != i:
+    # Sift arr[i] down the max heap arr[:n] (iteratively, so deep heaps
+    # can't hit the recursion limit)
+    while True:
+        largest = i
+        left = 2 * i + 1
+        right = 2 * i + 2
+
+        if left < n and arr[left] > arr[largest]:
+            largest = left
+
+        if right < n and arr[right] > arr[largest]:
+            largest = right
+
+        if largest == i:
+            return
         arr[i], arr[largest] = arr[largest], arr[i]
-        heapify(arr, n, largest)
+        i = largest
+
+
+# --- Streaming heap tools ---------------------------------------------------
+#
+# The helpers below work on min heaps: heap[0] is the smallest entry.
+
+
+def sift_up(heap, pos):
+    """Move heap[pos] up until its parent is not larger."""
+    item = heap[pos]
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        if item < heap[parent]:
+            heap[pos] = heap[parent]
+            pos = parent
+        else:
+            break
+    heap[pos] = item
+
+
+def sift_down(heap, pos):
+    """Move heap[pos] down until neither child is smaller."""
+    n = len(heap)
+    item = heap[pos]
+    child = 2 * pos + 1
+    while child < n:
+        right = child + 1
+        if right < n and heap[right] < heap[child]:
+            child = right
+        if heap[child] < item:
+            heap[pos] = heap[child]
+            pos = child
+            child = 2 * pos + 1
+        else:
+            break
+    heap[pos] = item
+
+
+def heap_push(heap, item):
+    heap.append(item)
+    sift_up(heap, len(heap) - 1)
+
+
+def heap_pop(heap):
+    last = heap.pop()
+    if not heap:
+        return last
+    top = heap[0]
+    heap[0] = last
+    sift_down(heap, 0)
+    return top
+
+
+class Reverse:
+    """Inverts the ordering of a value, turning a min heap into a max heap."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+class BoundedHeap:
+    """
+    Keeps the best k items seen so far from a stream of unknown length.
+
+    The heap root is the worst item kept, so each new item costs one
+    comparison when it doesn't make the cut and O(log k) when it does.
+    Memory stays O(k).
+
+    Args:
+        k: Number of items to keep
+        key: Optional function computing each item's key (called once)
+        largest: Keep the k largest (top-k) or the k smallest (bottom-k)
+
+    Ties keep input order: items() matches
+    sorted(stream, key=key, reverse=largest)[:k].
+    """
+
+    def __init__(self, k, key=None, largest=True):
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        self.k = k
+        self.key = key
+        self.largest = largest
+        self.heap = []
+        self.seen = 0
+
+    def _entry(self, item):
+        value = item if self.key is None else self.key(item)
+        seq = self.seen
+        self.seen += 1
+        # Among equal keys the latest arrival is the worst, so it sits
+        # closest to the root and is evicted first
+        if self.largest:
+            return (value, -seq, item)
+        return (Reverse(value), Reverse(seq), item)
+
+    def push(self, item):
+        """Offer an item; returns True if it is (for now) among the best k."""
+        if self.k == 0:
+            self.seen += 1
+            return False
+        entry = self._entry(item)
+        if len(self.heap) < self.k:
+            heap_push(self.heap, entry)
+            return True
+        if self.heap[0][:2] < entry[:2]:
+            self.heap[0] = entry
+            sift_down(self.heap, 0)
+            return True
+        return False
+
+    def extend(self, iterable):
+        for item in iterable:
+            self.push(item)
+        return self
+
+    def worst(self):
+        """The item that the next better arrival would evict."""
+        return self.heap[0][2]
+
+    def items(self):
+        """The kept items, best first."""
+        heap = list(self.heap)
+        ordered = []
+        while heap:
+            ordered.append(heap_pop(heap)[2])
+        ordered.reverse()
+        return ordered
+
+    def __len__(self):
+        return len(self.heap)
+
+
+def nlargest_stream(iterable, k, key=None):
+    """The k largest items of any iterable, largest first, in O(k) memory."""
+    return BoundedHeap(k, key, largest=True).extend(iterable).items()
+
+
+def nsmallest_stream(iterable, k, key=None):
+    """The k smallest items of any iterable, smallest first, in O(k) memory."""
+    return BoundedHeap(k, key, largest=False).extend(iterable).items()
+
+
+def merge_sorted(*iterables, key=None, reverse=False):
+    """
+    Lazily merge already-sorted iterables into one sorted stream.
+
+    Holds one pending item per input, so memory is O(number of inputs) no
+    matter how long the inputs are. Equal items come out in input order
+    (items from the first iterable first).
+
+    Args:
+        *iterables: Iterables each sorted by key (descending if reverse)
+        key: Optional key function
+        reverse: Inputs are sorted in descending order
+    """
+    heap = []
+
+    def entry(value, source, iterator):
+        k = value if key is None else key(value)
+        return (Reverse(k) if reverse else k, source, value, iterator)
+
+    for source, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for value in iterator:
+            heap.append(entry(value, source, iterator))
+            break
+    for i in range(len(heap) // 2 - 1, -1, -1):
+        sift_down(heap, i)
+
+    while heap:
+        _, source, value, iterator = heap[0]
+        yield value
+        for value in iterator:
+            heap[0] = entry(value, source, iterator)
+            sift_down(heap, 0)
+            break
+        else:
+            heap_pop(heap)
+
+
+class IndexedPriorityQueue:
+    """
+    Min priority queue over hashable items with O(log n) decrease-key.
+
+    A position map from item to heap slot lets an item's priority be
+    changed in place instead of pushing duplicates (as Dijkstra's algorithm
+    does with a plain heap). Equal priorities pop in insertion order.
+    """
+
+    def __init__(self):
+        self.heap = []  # [priority, seq, item]
+        self.position = {}
+        self.seq = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def push(self, item, priority):
+        if item in self.position:
+            raise KeyError(f"{item!r} is already in the queue")
+        self.heap.append([priority, self.seq, item])
+        self.seq += 1
+        self.position[item] = len(self.heap) - 1
+        self._swim(len(self.heap) - 1)
+
+    def priority(self, item):
+        return self.heap[self.position[item]][0]
+
+    def peek(self):
+        """Return (item, priority) with the lowest priority."""
+        priority, _, item = self.heap[0]
+        return item, priority
+
+    def pop(self):
+        """Remove and return (item, priority) with the lowest priority."""
+        if not self.heap:
+            raise IndexError("pop from an empty priority queue")
+        item, priority = self.peek()
+        self._remove_at(0)
+        return item, priority
+
+    def decrease_key(self, item, priority):
+        """Lower an item's priority; raises ValueError if it would increase."""
+        pos = self.position[item]
+        if self.heap[pos][0] < priority:
+            raise ValueError("new priority is greater than the current one")
+        self.heap[pos][0] = priority
+        self._swim(pos)
+
+    def update(self, item, priority):
+        """Set an item's priority (pushing it if absent)."""
+        if item not in self.position:
+            self.push(item, priority)
+            return
+        pos = self.position[item]
+        old = self.heap[pos][0]
+        self.heap[pos][0] = priority
+        if priority < old:
+            self._swim(pos)
+        else:
+            self._sink(pos)
+
+    def remove(self, item):
+        self._remove_at(self.position[item])
+
+    def _remove_at(self, pos):
+        entry = self.heap[pos]
+        del self.position[entry[2]]
+        last = self.heap.pop()
+        if pos < len(self.heap):
+            self.heap[pos] = last
+            self.position[last[2]] = pos
+            self._sink(pos)
+            self._swim(pos)
+
+    def _swap(self, i, j):
+        heap = self.heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.position[heap[i][2]] = i
+        self.position[heap[j][2]] = j
+
+    def _less(self, i, j):
+        a, b = self.heap[i], self.heap[j]
+        return (a[0], a[1]) < (b[0], b[1])
+
+    def _swim(self, pos):
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if not self._less(pos, parent):
+                break
+            self._swap(pos, parent)
+            pos = parent
+
+    def _sink(self, pos):
+        n = len(self.heap)
+        while True:
+            child = 2 * pos + 1
+            if child >= n:
+                break
+            if child + 1 < n and self._less(child + 1, child):
+                child += 1
+            if not self._less(child, pos):
+                break
+            self._swap(pos, child)
+            pos = child
 
 
 if __name__ == "__main__":
     arr = [64, 34, 25, 12, 22, 11, 90]
     print("Heap Sort:", heap_sort(arr))
 
+    stream = iter([5, 1, 9, 3, 7, 9, 2, 8])
+    print("Top 3 (streaming):", nlargest_stream(stream, 3))
+    print("Bottom 3 (streaming):", nsmallest_stream([5, 1, 9, 3, 7, 2], 3))
+    print("Merged:", list(merge_sorted([1, 4, 9], [2, 3, 10], iter([0, 5]))))
+
+    queue = IndexedPriorityQueue()
+    for node, dist in [("a", 7), ("b", 3), ("c", 5)]:
+        queue.push(node, dist)
+    queue.decrease_key("a", 1)
+    print("Indexed PQ pop order:", [queue.pop() for _ in range(len(queue))])
+
@@ -6,8 +6,30 @@ element into its correct position in the sorted portion of the array.
 
 Time Complexity: O(n²) worst/average, O(n) best (already sorted)
 Space Complexity: O(1) - sorts in place
+
+When items arrive one at a time into data that is already sorted, re-running
+insertion_sort costs O(n) per item. SortedChunkList keeps the data as a list
+of short sorted chunks instead (sqrt decomposition), with the last value of
+each chunk in a separate index:
+- a value is found by binary search over the chunk maxima, then inside one
+  chunk: O(log n)
+- insertion / deletion only shifts one chunk of at most 2 * load items
+  (load ~ sqrt(n) for the sizes it is tuned for); full chunks split in two
+  and near-empty ones merge with a neighbour
+- positions come from cumulative chunk offsets, rebuilt lazily after a
+  change, so indexing and slicing need no scan of the items
 """
 
+import argparse
+import random
+import time
+from bisect import bisect_left, bisect_right, insort_right
+from itertools import chain, islice
+
+from sort_support import load_sibling
+
+CHUNK_LOAD = 512
+
 
 def insertion_sort(arr):
     sorted_arr = arr.copy()
@@ -27,7 +49,274 @@ def insertion_sort(arr):
     return sorted_arr
 
 
+class SortedChunkList:
+    """
+    A list that stays sorted under one-at-a-time inserts and deletes.
+
+    Duplicates are allowed and equal values keep their insertion order.
+    Values only need to support <.
+
+        events = SortedChunkList.from_sorted(history)  # O(n), no sorting
+        events.add(timestamp)                          # ~O(sqrt n)
+        events[-10:]                                   # the latest ten
+        list(events.irange(start, end))                # a time window
+    """
+
+    def __init__(self, iterable=(), load=CHUNK_LOAD):
+        self.load = load
+        self._chunks = []
+        self._maxes = []
+        self._offsets = None
+        self._len = 0
+        self.update(iterable)
+
+    @classmethod
+    def from_sorted(cls, iterable, load=CHUNK_LOAD):
+        """Bulk-load already-sorted values in O(n); raises ValueError if not."""
+        self = cls(load=load)
+        values = list(iterable)
+        for i in range(1, len(values)):
+            if values[i] < values[i - 1]:
+                raise ValueError(f"input is not sorted at index {i}")
+        self._load_sorted(values)
+        return self
+
+    def _load_sorted(self, values):
+        load = self.load
+        self._chunks = [values[i : i + load] for i in range(0, len(values), load)]
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+        self._len = len(values)
+        self._offsets = None
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._chunks)
+
+    def __reversed__(self):
+        for chunk in reversed(self._chunks):
+            yield from reversed(chunk)
+
+    def __repr__(self):
+        return f"SortedChunkList({list(self)!r})"
+
+    def __contains__(self, value):
+        k = bisect_left(self._maxes, value)
+        if k == len(self._maxes):
+            return False
+        chunk = self._chunks[k]
+        return not value < chunk[bisect_left(chunk, value)]
+
+    def update(self, iterable):
+        """Add many values: small batches one by one, large ones by re-sorting."""
+        values = list(iterable)
+        if len(values) <= self.load:
+            for value in values:
+                self.add(value)
+            return
+        # The current contents are one sorted run; Tim sort merges it with
+        # the new values instead of sorting everything from scratch
+        tim_sort = load_sibling("tim-sort").tim_sort
+        self._load_sorted(tim_sort(list(self) + values))
+
+    def add(self, value):
+        """Insert value after any equal values already present."""
+        chunks, maxes = self._chunks, self._maxes
+        if not chunks:
+            chunks.append([value])
+            maxes.append(value)
+        else:
+            k = bisect_right(maxes, value)
+            if k == len(maxes):
+                k -= 1
+            chunk = chunks[k]
+            insort_right(chunk, value)
+            maxes[k] = chunk[-1]
+            if len(chunk) > 2 * self.load:
+                # Split a full chunk in two
+                half = chunk[self.load :]
+                del chunk[self.load :]
+                chunks.insert(k + 1, half)
+                maxes[k] = chunk[-1]
+                maxes.insert(k + 1, half[-1])
+        self._len += 1
+        self._offsets = None
+
+    def remove(self, value):
+        """Remove one occurrence of value; raises ValueError if absent."""
+        k = bisect_left(self._maxes, value)
+        if k < len(self._maxes):
+            chunk = self._chunks[k]
+            i = bisect_left(chunk, value)
+            if not value < chunk[i]:
+                self._delete(k, i)
+                return
+        raise ValueError(f"{value!r} not in SortedChunkList")
+
+    def discard(self, value):
+        """Remove one occurrence of value if present."""
+        if value in self:
+            self.remove(value)
+
+    def pop(self, index=-1):
+        """Remove and return the value at index (default: the largest)."""
+        k, i = self._locate(index)
+        value = self._chunks[k][i]
+        self._delete(k, i)
+        return value
+
+    def __delitem__(self, index):
+        self._delete(*self._locate(index))
+
+    def _delete(self, k, i):
+        chunks, maxes = self._chunks, self._maxes
+        chunk = chunks[k]
+        del chunk[i]
+        self._len -= 1
+        self._offsets = None
+        if not chunk:
+            del chunks[k]
+            del maxes[k]
+            return
+        maxes[k] = chunk[-1]
+        if len(chunk) < self.load // 2 and len(chunks) > 1:
+            # Merge a near-empty chunk into a neighbour (and split that
+            # again if it grew too big)
+            if k == len(chunks) - 1:
+                k -= 1
+            merged = chunks[k] + chunks[k + 1]
+            del chunks[k + 1]
+            del maxes[k + 1]
+            chunks[k] = merged
+            maxes[k] = merged[-1]
+            if len(merged) > 2 * self.load:
+                half = len(merged) // 2
+                chunks[k : k + 1] = [merged[:half], merged[half:]]
+                maxes[k : k + 1] = [merged[half - 1], merged[-1]]
+
+    def _offset(self, k):
+        """Position of the first value of chunk k."""
+        if self._offsets is None:
+            offsets = [0]
+            for chunk in self._chunks:
+                offsets.append(offsets[-1] + len(chunk))
+            self._offsets = offsets
+        return self._offsets[k]
+
+    def _locate(self, index):
+        """(chunk, position in chunk) of a list index."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedChunkList index out of range")
+        self._offset(0)
+        k = bisect_right(self._offsets, index) - 1
+        return k, index - self._offsets[k]
+
+    def bisect_left(self, value):
+        """Number of values < value (the insertion point before equals)."""
+        k = bisect_left(self._maxes, value)
+        if k == len(self._maxes):
+            return self._len
+        return self._offset(k) + bisect_left(self._chunks[k], value)
+
+    def bisect_right(self, value):
+        """Number of values <= value (the insertion point after equals)."""
+        k = bisect_right(self._maxes, value)
+        if k == len(self._maxes):
+            return self._len
+        return self._offset(k) + bisect_right(self._chunks[k], value)
+
+    rank = bisect_left
+
+    def count(self, value):
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step < 0:
+                return list(self)[index]
+            return list(islice(self._iter_from(start), max(stop - start, 0)))[::step]
+        k, i = self._locate(index)
+        return self._chunks[k][i]
+
+    def _iter_from(self, start):
+        """Values from list position start onwards."""
+        if start >= self._len:
+            return iter(())
+        k, i = self._locate(start)
+        return chain(self._chunks[k][i:], chain.from_iterable(self._chunks[k + 1 :]))
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """
+        Iterate over values between minimum and maximum in sorted order.
+
+        Args:
+            minimum, maximum: Bounds; None means unbounded
+            inclusive: Whether each bound is itself included
+        """
+        low_inclusive, high_inclusive = inclusive
+        if minimum is None:
+            start = 0
+        elif low_inclusive:
+            start = self.bisect_left(minimum)
+        else:
+            start = self.bisect_right(minimum)
+        if maximum is None:
+            stop = self._len
+        elif high_inclusive:
+            stop = self.bisect_right(maximum)
+        else:
+            stop = self.bisect_left(maximum)
+        return islice(self._iter_from(start), max(stop - start, 0))
+
+
+def benchmark_sorted_inserts(sizes=(1_000, 5_000, 50_000, 200_000), seed=0):
+    """
+    Insert n random values one at a time, keeping the data sorted after
+    each insert: appending and re-running insertion_sort (capped at 5,000,
+    it is quadratic overall) against SortedChunkList.add.
+    """
+    print(f"{'n':>9} {'insertion_sort':>15} {'SortedChunkList':>16}")
+    for n in sizes:
+        rng = random.Random(seed)
+        values = [rng.random() for _ in range(n)]
+
+        naive = "-"
+        if n <= 5_000:
+            start = time.perf_counter()
+            arr = []
+            for value in values:
+                arr.append(value)
+                arr = insertion_sort(arr)
+            naive = f"{time.perf_counter() - start:.3f}s"
+
+        start = time.perf_counter()
+        chunked = SortedChunkList()
+        for value in values:
+            chunked.add(value)
+        elapsed = time.perf_counter() - start
+        assert list(chunked) == sorted(values)
+        print(f"{n:>9,} {naive:>15} {elapsed:>15.3f}s")
+
+
 if __name__ == "__main__":
-    arr = [64, 34, 25, 12, 22, 11, 90]
-    print("Insertion Sort:", insertion_sort(arr))
+    parser = argparse.ArgumentParser(description="Insertion sort examples")
+    parser.add_argument("--benchmark", action="store_true")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_sorted_inserts()
+    else:
+        arr = [64, 34, 25, 12, 22, 11, 90]
+        print("Insertion Sort:", insertion_sort(arr))
+
+        scores = SortedChunkList([64, 34, 25, 12], load=4)
+        for score in (22, 11, 90, 34):
+            scores.add(score)
+        print("SortedChunkList:", list(scores))
+        print("  rank(34) =", scores.rank(34), " [2:5] =", scores[2:5])
+        print("  irange(20, 64) =", list(scores.irange(20, 64)))
 
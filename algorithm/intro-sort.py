@@ -5,14 +5,26 @@ Intro sort (introsort) starts with quicksort, but switches to heapsort if
 the recursion depth becomes too large, and uses insertion sort for small arrays.
 This combines the best of all three algorithms.
 
+The same parts (partition_intro, heap_sort_intro, the insertion-sort cutoff)
+also power selection without a full sort:
+- nth_element(arr, k): introselect, puts the k-th smallest at arr[k]
+- partial_sort(arr, k): the k smallest, sorted, at the front of arr
+- top_k(iterable, k, key=None): the k largest items of a stream
+
 Time Complexity: O(n log n) worst case
 Space Complexity: O(log n)
 """
 
 import math
+import random
+import time
+
+INSERTION_THRESHOLD = 16
 
 
 def intro_sort(arr):
+    if len(arr) <= 1:
+        return arr.copy()
     max_depth = int(math.log2(len(arr))) * 2
     return intro_sort_recursive(arr.copy(), 0, len(arr) - 1, max_depth)
 
@@ -92,7 +104,156 @@ def heapify_intro(arr, n, i, offset):
         heapify_intro(arr, n, largest, offset)
 
 
+def median_of_three_to_high(arr, low, high):
+    """Move the median of arr[low], arr[mid], arr[high] to arr[high]."""
+    mid = (low + high) // 2
+    if arr[mid] < arr[low]:
+        arr[low], arr[mid] = arr[mid], arr[low]
+    if arr[high] < arr[low]:
+        arr[low], arr[high] = arr[high], arr[low]
+    if arr[mid] < arr[high]:
+        arr[mid], arr[high] = arr[high], arr[mid]
+
+
+def nth_element(arr, k, low=0, high=None):
+    """
+    Introselect (modifies arr)
+
+    Rearranges arr[low..high] so that arr[k] holds the element that would be
+    there if the range were sorted, with nothing greater before it and
+    nothing smaller after it. Quickselect with median-of-three pivots and a
+    Hoare partition that stops on equal keys, so heavy duplicates still
+    halve the range each round. If it keeps picking bad pivots it heap
+    sorts the remaining range instead, so the worst case stays O(n log n).
+
+    Returns:
+        The k-th smallest element
+    """
+    if high is None:
+        high = len(arr) - 1
+    if not low <= k <= high:
+        raise IndexError("k is outside the range being selected from")
+
+    max_depth = 2 * int(math.log2(high - low + 1))
+    while high - low + 1 >= INSERTION_THRESHOLD:
+        if max_depth == 0:
+            heap_sort_intro(arr, low, high)
+            return arr[k]
+        max_depth -= 1
+
+        median_of_three_to_high(arr, low, high)
+        pivot = partition_hoare(arr, low, high)
+        if k == pivot:
+            return arr[k]
+        if k < pivot:
+            high = pivot - 1
+        else:
+            low = pivot + 1
+
+    insertion_sort_intro(arr, low, high)
+    return arr[k]
+
+
+def partition_hoare(arr, low, high):
+    """
+    Partition around the pivot at arr[high] (which must not be smaller than
+    arr[low], as median_of_three_to_high ensures). Both scans stop on keys
+    equal to the pivot, so runs of equal keys are split down the middle
+    instead of all landing on one side.
+
+    Returns:
+        The pivot's final index; nothing before it is greater and nothing
+        after it is smaller
+    """
+    pivot = arr[high]
+    i, j = low - 1, high
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < arr[j]:
+            j -= 1
+        if i >= j:
+            break
+        arr[i], arr[j] = arr[j], arr[i]
+    arr[i], arr[high] = arr[high], arr[i]
+    return i
+
+
+def partial_sort(arr, k):
+    """
+    Partial Sort (modifies arr)
+
+    Puts the k smallest elements, in sorted order, at arr[:k]. The rest of
+    the list is left in unspecified order. O(n + k log k) on average.
+
+    Returns:
+        The same list
+    """
+    n = len(arr)
+    k = min(k, n)
+    if k <= 0:
+        return arr
+    if k < n:
+        nth_element(arr, k - 1)
+    if k > 1:
+        intro_sort_recursive(arr, 0, k - 1, 2 * int(math.log2(k)))
+    return arr
+
+
+def top_k(iterable, k, key=None):
+    """
+    The k largest items of an iterable, largest first.
+
+    Items are buffered until the buffer holds 2k of them, then introselect
+    keeps the best k and the rest are dropped. Once a buffer has been cut,
+    its k-th best key is a threshold: anything not above it is rejected
+    with a single comparison. Memory stays O(k) and the whole stream costs
+    O(n) on average; only the final k items are sorted.
+
+    Ties keep input order, so this matches
+    sorted(iterable, key=key, reverse=True)[:k].
+    """
+    if k <= 0:
+        return []
+
+    capacity = max(2 * k, INSERTION_THRESHOLD)
+    buffer = []
+    threshold = None
+    for index, item in enumerate(iterable):
+        value = item if key is None else key(item)
+        # An equal key arrives later than the threshold item, so it ranks
+        # lower and can be rejected too
+        if threshold is not None and not threshold < value:
+            continue
+        # The negated index makes earlier items win ties
+        buffer.append((value, -index, item))
+        if len(buffer) >= capacity:
+            cut = len(buffer) - k
+            nth_element(buffer, cut)
+            del buffer[:cut]
+            threshold = min(buffer)[0]
+
+    if len(buffer) > k:
+        nth_element(buffer, len(buffer) - k)
+        del buffer[: len(buffer) - k]
+    partial_sort(buffer, len(buffer))
+    return [item for _, _, item in reversed(buffer)]
+
+
 if __name__ == "__main__":
     arr = [64, 34, 25, 12, 22, 11, 90]
     print("Intro Sort:", intro_sort(arr))
 
+    arr2 = arr.copy()
+    print("nth_element(k=3):", nth_element(arr2, 3), arr2)
+    print("partial_sort(k=3):", partial_sort(arr.copy(), 3)[:3])
+
+    scores = [random.randrange(10**9) for _ in range(1_000_000)]
+    start = time.perf_counter()
+    best = top_k(scores, 100)
+    elapsed = time.perf_counter() - start
+    assert best == sorted(scores, reverse=True)[:100]
+    print(f"top_k(100) of 1,000,000 in {elapsed:.2f}s:", best[:5], "...")
+
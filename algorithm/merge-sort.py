@@ -4,10 +4,29 @@ Merge Sort Implementation in Python
 Merge sort is a divide-and-conquer algorithm that splits the array in half,
 recursively sorts both halves, then merges them back together.
 
+parallel_merge_sort() splits large inputs across a process pool: each worker
+sorts its chunk of a typed shared-memory buffer, and the parent k-way merges
+the sorted chunks. Inputs below PARALLEL_THRESHOLD use the serial path.
+
 Time Complexity: O(n log n) in all cases
 Space Complexity: O(n) - requires temporary arrays
 """
 
+import argparse
+import heapq
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from sort_support import call_sibling
+
+PARALLEL_THRESHOLD = 100_000
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
 
 def merge_sort(arr):
     if len(arr) <= 1:
@@ -39,7 +58,187 @@ def merge(left, right):
     return result
 
 
+def merge_sort_bottom_up(arr):
+    """
+    Merge Sort - Iterative version (modifies original list)
+
+    Merges runs of width 1, 2, 4, ... back and forth between the list and a
+    single auxiliary buffer, so it allocates O(n) once instead of new lists
+    at every level of recursion.
+
+    Args:
+        arr: List to sort (will be modified)
+
+    Returns:
+        List: The same list, sorted
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    src, dst = arr, [None] * n
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            merge_into(src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+
+    if src is not arr:
+        arr[:] = src
+    return arr
+
+
+def merge_into(src, dst, lo, mid, hi):
+    """Merge src[lo:mid] and src[mid:hi] into dst[lo:hi]."""
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        # Take from the right only when strictly smaller (keeps it stable)
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
+
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+
+
+def shared_typecode(arr):
+    """
+    Pick an array typecode that can hold every element of arr: 'q' for
+    int64, 'd' for float64, or None if the data can't go in a typed buffer.
+    Mixed ints and floats get None: float64 would round large ints and hand
+    every element back as a float.
+    """
+    if isinstance(arr, array):
+        return arr.typecode
+    if all(type(x) is int for x in arr):
+        if len(arr) == 0 or (INT64_MIN <= min(arr) and max(arr) <= INT64_MAX):
+            return "q"
+        return None
+    if all(type(x) is float for x in arr):
+        return "d"
+    return None
+
+
+def _sort_shared_chunk(shm_name, typecode, lo, hi):
+    # Runs in a worker process: attach, sort one slice in place, detach
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf.cast(typecode)
+        chunk = view[lo:hi].tolist()
+        merge_sort_bottom_up(chunk)
+        view[lo:hi] = array(typecode, chunk)
+        view.release()
+    finally:
+        shm.close()
+
+
+def parallel_merge_sort(arr, workers=None, threshold=PARALLEL_THRESHOLD):
+    """
+    Merge Sort - Multi-process version
+
+    The input is copied once into a shared-memory buffer of int64 or
+    float64. Each worker sorts its own contiguous chunk of that buffer in
+    place, so no lists are pickled between processes. The parent then
+    k-way merges the sorted chunks with a heap.
+
+    Args:
+        arr: List (or array.array) of ints or of floats (mixed lists are
+            sorted serially)
+        workers: Number of worker processes (default: os.cpu_count())
+        threshold: Inputs shorter than this are sorted serially
+
+    Returns:
+        List: Sorted list (original is not modified)
+    """
+    n = len(arr)
+    workers = workers or os.cpu_count() or 1
+    typecode = shared_typecode(arr)
+    if n < max(threshold, 2) or workers == 1 or typecode is None:
+        return merge_sort_bottom_up(list(arr))
+
+    itemsize = array(typecode).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=n * itemsize)
+    view = shm.buf.cast(typecode)
+    runs = []
+    try:
+        view[:] = arr if isinstance(arr, array) else array(typecode, arr)
+
+        step = -(-n // workers)
+        bounds = [(lo, min(lo + step, n)) for lo in range(0, n, step)]
+        with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+            # Workers get call_sibling, not _sort_shared_chunk itself, so
+            # they can unpickle it under spawn too (see sort_support.py)
+            futures = [
+                pool.submit(
+                    call_sibling,
+                    "merge-sort",
+                    "_sort_shared_chunk",
+                    shm.name,
+                    typecode,
+                    lo,
+                    hi,
+                )
+                for lo, hi in bounds
+            ]
+            for future in futures:
+                future.result()
+
+        runs = [view[lo:hi] for lo, hi in bounds]
+        return list(heapq.merge(*runs))
+    finally:
+        # Exported views keep shm.close() from unmapping the segment
+        for run in runs:
+            run.release()
+        view.release()
+        shm.close()
+        shm.unlink()
+
+
+def benchmark_parallel_merge_sort(n=10_000_000, max_workers=None, seed=0):
+    """Time parallel_merge_sort on n random int64s with 1..max_workers."""
+    max_workers = max_workers or os.cpu_count() or 1
+    rng = random.Random(seed)
+    data = array("q", (rng.randrange(-(2**62), 2**62) for _ in range(n)))
+    expected = None
+
+    print(f"parallel_merge_sort on {n:,} integers")
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8}")
+    base = None
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        # threshold=0 sends every run above one worker through shared
+        # memory; a single worker is the serial baseline
+        result = parallel_merge_sort(data, workers=workers, threshold=0)
+        elapsed = time.perf_counter() - start
+        if expected is None:
+            expected = sorted(data)
+        assert result == expected
+        base = base or elapsed
+        print(f"{workers:>8} {elapsed:>10.2f} {base / elapsed:>7.2f}x")
+
+
 if __name__ == "__main__":
-    arr = [64, 34, 25, 12, 22, 11, 90]
-    print("Merge Sort:", merge_sort(arr))
+    parser = argparse.ArgumentParser(description="Merge sort examples")
+    parser.add_argument("--benchmark", action="store_true")
+    parser.add_argument("--n", type=int, default=10_000_000)
+    parser.add_argument("--max-workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_parallel_merge_sort(args.n, args.max_workers)
+    else:
+        arr = [64, 34, 25, 12, 22, 11, 90]
+        print("Merge Sort:", merge_sort(arr))
+        print("Merge Sort (bottom-up):", merge_sort_bottom_up(arr.copy()))
+        big = [random.randrange(10**6) for _ in range(200_000)]
+        print("Parallel Merge Sort ok:", parallel_merge_sort(big) == sorted(big))
 
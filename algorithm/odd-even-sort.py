@@ -4,10 +4,31 @@ Odd-Even Sort Implementation in Python
 Odd-even sort is a parallel-friendly variant of bubble sort. It compares
 all odd/even indexed pairs of adjacent elements and swaps them if in wrong order.
 
+parallel_odd_even_sort() is the block version of the same network
+(Baudet-Stevenson odd-even transposition): the array lives in
+multiprocessing.shared_memory, each of p worker processes sorts its own
+block, then p alternating odd/even phases have neighbouring workers
+merge-split their blocks (the lower one keeps the smaller half), with a
+barrier between reading and writing. After p phases the array is sorted.
+
 Time Complexity: O(n²) worst/average
+    Block version: O((n/p) log(n/p) + n) per worker
 Space Complexity: O(1) - sorts in place
 """
 
+import argparse
+import heapq
+import os
+import random
+import time
+from array import array
+from itertools import islice
+from multiprocessing import Barrier, Process, shared_memory
+
+from sort_support import call_sibling, load_sibling
+
+PARALLEL_THRESHOLD = 50_000
+
 
 def odd_even_sort(arr):
     sorted_arr = arr.copy()
@@ -32,7 +53,211 @@ def odd_even_sort(arr):
     return sorted_arr
 
 
+def block_bounds(n, blocks):
+    """Split range(n) into `blocks` contiguous (lo, hi) ranges of near-equal size."""
+    return [(n * i // blocks, n * (i + 1) // blocks) for i in range(blocks)]
+
+
+def merge_split(low, high):
+    """
+    Merge two sorted blocks and split them again: returns the len(low)
+    smallest and len(high) largest items, both sorted. Equal items keep
+    low's before high's, so each one ends up in exactly one half.
+    """
+    if not low or not high or not high[0] < low[-1]:
+        return low, high
+    smaller = list(islice(heapq.merge(low, high), len(low)))
+    # Backwards, high's items come first among equals
+    larger = list(
+        islice(heapq.merge(reversed(high), reversed(low), reverse=True), len(high))
+    )
+    larger.reverse()
+    return smaller, larger
+
+
+def block_odd_even_sort(arr, blocks=4):
+    """
+    Odd-Even Sort - Block version, run serially (returns a new list)
+
+    Sorts each block, then runs odd/even merge-split phases over
+    neighbouring blocks until two phases in a row change nothing. (The
+    parallel version pads to equal blocks, where `blocks` phases are always
+    enough; blocks that differ in size can need a few more.)
+    """
+    # Every block needs at least one item to pass values along the chain
+    blocks = max(1, min(blocks, len(arr)))
+    parts = [sorted(arr[lo:hi]) for lo, hi in block_bounds(len(arr), blocks)]
+    quiet_phases = phase = 0
+    while quiet_phases < 2 and blocks > 1:
+        changed = False
+        for i in range(phase % 2, blocks - 1, 2):
+            low, high = merge_split(parts[i], parts[i + 1])
+            if low is not parts[i]:
+                parts[i], parts[i + 1] = low, high
+                changed = True
+        quiet_phases = 0 if changed else quiet_phases + 1
+        phase += 1
+    return [x for part in parts for x in part]
+
+
+def _pad_value(typecode):
+    """The largest value an array of this typecode can hold."""
+    if typecode in "fd":
+        return float("inf")
+    bits = 8 * array(typecode).itemsize
+    return 2 ** (bits - 1) - 1 if typecode.islower() else 2**bits - 1
+
+
+def _odd_even_worker(shm_name, typecode, bounds, rank, barrier):
+    # Runs in a worker process: owns block `rank`, trades with neighbours
+    shm = shared_memory.SharedMemory(name=shm_name)
+    view = shm.buf.cast(typecode)
+    try:
+        lo, hi = bounds[rank]
+        view[lo:hi] = array(typecode, sorted(view[lo:hi]))
+        barrier.wait()
+
+        workers = len(bounds)
+        for phase in range(workers):
+            # Even phases pair blocks (0, 1), (2, 3), ...; odd ones (1, 2), ...
+            partner = rank + 1 if (rank - phase) % 2 == 0 else rank - 1
+            mine = None
+            if 0 <= partner < workers:
+                p_lo, p_hi = bounds[partner]
+                block, other = view[lo:hi].tolist(), view[p_lo:p_hi].tolist()
+                if partner > rank:
+                    mine, _ = merge_split(block, other)
+                else:
+                    _, mine = merge_split(other, block)
+            # Both neighbours must finish reading before either one writes
+            barrier.wait()
+            if mine is not None:
+                view[lo:hi] = array(typecode, mine)
+            barrier.wait()
+    except BaseException:
+        barrier.abort()
+        raise
+    finally:
+        view.release()
+        shm.close()
+
+
+def parallel_odd_even_sort(arr, workers=None, threshold=PARALLEL_THRESHOLD):
+    """
+    Odd-Even Sort - Multi-process block version
+
+    Args:
+        arr: List (or array.array) of ints or of floats (mixed lists use
+            block_odd_even_sort in this process)
+        workers: Number of worker processes (default: os.cpu_count())
+        threshold: Inputs shorter than this use block_odd_even_sort in
+            this process instead
+
+    Returns:
+        List: Sorted list (original is not modified)
+    """
+    n = len(arr)
+    workers = max(1, min(workers or os.cpu_count() or 1, n))
+    typecode = load_sibling("merge-sort").shared_typecode(arr)
+    if n < max(threshold, 2) or typecode is None:
+        return block_odd_even_sort(list(arr), workers)
+
+    # Blocks must be the same size for `workers` phases to be enough, so
+    # the buffer is padded with the type's maximum, which sorts to the end
+    step = -(-n // workers)
+    size = step * workers
+    itemsize = array(typecode).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=size * itemsize)
+    view = shm.buf.cast(typecode)
+    try:
+        view[:n] = arr if isinstance(arr, array) else array(typecode, arr)
+        view[n:] = array(typecode, [_pad_value(typecode)] * (size - n))
+
+        bounds = block_bounds(size, workers)
+        barrier = Barrier(workers)
+        # Workers get call_sibling, not _odd_even_worker itself, so they
+        # can unpickle it under spawn too (see sort_support.py)
+        processes = [
+            Process(
+                target=call_sibling,
+                args=(
+                    "odd-even-sort",
+                    "_odd_even_worker",
+                    shm.name,
+                    typecode,
+                    bounds,
+                    rank,
+                    barrier,
+                ),
+            )
+            for rank in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        if any(process.exitcode != 0 for process in processes):
+            raise RuntimeError("an odd-even sort worker failed")
+
+        return view[:n].tolist()
+    finally:
+        # An exported view keeps shm.close() from unmapping the segment
+        view.release()
+        shm.close()
+        shm.unlink()
+
+
+def benchmark_parallel_odd_even_sort(
+    sizes=(2_000, 20_000, 200_000, 2_000_000),
+    max_workers=None,
+    serial_cap=5_000,
+    seed=0,
+):
+    """
+    Time odd_even_sort (serial, only up to serial_cap since it is O(n²)),
+    sorted() and parallel_odd_even_sort with 1..max_workers processes.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    rng = random.Random(seed)
+    worker_counts = sorted({1, 2, max_workers} | set(range(4, max_workers, 4)))
+    header = f"{'n':>10} {'odd_even':>9} {'sorted()':>9}"
+    header += "".join(f" {f'p={p}':>8}" for p in worker_counts)
+    print(header)
+
+    for n in sizes:
+        data = array("q", (rng.randrange(-(2**62), 2**62) for _ in range(n)))
+        serial = "-"
+        if n <= serial_cap:
+            start = time.perf_counter()
+            assert odd_even_sort(list(data)) == sorted(data)
+            serial = f"{time.perf_counter() - start:.3f}"
+        start = time.perf_counter()
+        expected = sorted(data)
+        row = f"{n:>10} {serial:>9} {time.perf_counter() - start:>9.3f}"
+        for workers in worker_counts:
+            start = time.perf_counter()
+            # threshold=0 forces the shared-memory path even with one worker
+            result = parallel_odd_even_sort(data, workers=workers, threshold=0)
+            elapsed = time.perf_counter() - start
+            assert result == expected
+            row += f" {elapsed:>8.3f}"
+        print(row)
+
+
 if __name__ == "__main__":
-    arr = [64, 34, 25, 12, 22, 11, 90]
-    print("Odd-Even Sort:", odd_even_sort(arr))
+    parser = argparse.ArgumentParser(description="Odd-even sort examples")
+    parser.add_argument("--benchmark", action="store_true")
+    parser.add_argument("--max-workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_parallel_odd_even_sort(max_workers=args.max_workers)
+    else:
+        arr = [64, 34, 25, 12, 22, 11, 90]
+        print("Odd-Even Sort:", odd_even_sort(arr))
+        print("Odd-Even Sort (blocks):", block_odd_even_sort(arr, blocks=3))
+        print(
+            "Odd-Even Sort (parallel):",
+            parallel_odd_even_sort(arr, workers=3, threshold=0),
+        )
 
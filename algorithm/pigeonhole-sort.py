@@ -4,10 +4,16 @@ Pigeonhole Sort Implementation in Python
 Pigeonhole sort is an extreme version of counting sort. It requires that the
 range of possible values is small and known. Each value gets its own "pigeonhole".
 
+When the range is much larger than n, pigeonholes are only made for the
+values that actually occur (the sparse mode of counting-sort.py), so a
+single outlier can't allocate gigabytes of empty holes.
+
 Time Complexity: O(n + range) where range is the difference between max and min
 Space Complexity: O(range)
 """
 
+from sort_support import load_sibling
+
 
 def pigeonhole_sort(arr):
     if len(arr) == 0:
@@ -16,6 +22,10 @@ def pigeonhole_sort(arr):
     min_val = min(arr)
     max_val = max(arr)
     range_val = max_val - min_val + 1
+    # Shares counting sort's sparse mode and its threshold for switching to it
+    counting = load_sibling("counting-sort")
+    if range_val > counting.SPARSE_RATIO * len(arr):
+        return counting.sparse_counting_sort(arr)
     
     # Create pigeonholes
     holes = [0] * range_val
@@ -37,4 +47,5 @@ def pigeonhole_sort(arr):
 if __name__ == "__main__":
     arr = [8, 3, 2, 7, 4, 6, 8]
     print("Pigeonhole Sort:", pigeonhole_sort(arr))
+    print("Pigeonhole Sort (sparse):", pigeonhole_sort([8, 3, 10**12, -(10**12), 8]))
 
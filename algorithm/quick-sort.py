@@ -4,10 +4,25 @@ Quick Sort Implementation in Python
 Quick sort is a divide-and-conquer algorithm that picks a pivot element,
 partitions the array around the pivot, and recursively sorts the subarrays.
 
+quick_sort_engine() is the production variant: it picks pivots with
+median-of-three or Tukey's ninther, partitions three ways (Dijkstra) so
+duplicates are never revisited, optionally uses Yaroslavskiy's dual-pivot
+partitioning, hands small ranges to insertion sort, and replaces recursion
+with an explicit stack that always continues with the smaller side, so the
+stack never holds more than O(log n) ranges.
+
 Time Complexity: O(n log n) average, O(n²) worst case
 Space Complexity: O(log n) average (recursion stack)
 """
 
+import argparse
+import math
+import random
+import time
+
+INSERTION_CUTOFF = 16
+NINTHER_THRESHOLD = 40
+
 
 def quick_sort(arr):
     if len(arr) <= 1:
@@ -46,9 +61,206 @@ def partition(arr, low, high):
     return i + 1
 
 
+def quick_sort_engine(
+    arr, low=0, high=None, dual_pivot=False, pivot="ninther", cutoff=INSERTION_CUTOFF
+):
+    """
+    Quick Sort - Iterative three-way / dual-pivot version (modifies arr)
+
+    Args:
+        arr: List to sort (will be modified)
+        low, high: Optional inclusive range to sort
+        dual_pivot: Use Yaroslavskiy's dual-pivot partitioning
+        pivot: "median3" or "ninther" (ninther falls back to median-of-three
+            on ranges shorter than NINTHER_THRESHOLD)
+        cutoff: Ranges of this size or smaller are insertion sorted
+
+    Returns:
+        List: The same list, sorted
+    """
+    if pivot not in ("median3", "ninther"):
+        raise ValueError("pivot must be 'median3' or 'ninther'")
+    if high is None:
+        high = len(arr) - 1
+    cutoff = max(cutoff, 2)
+
+    stack = [(low, high)]
+    while stack:
+        lo, hi = stack.pop()
+        while hi - lo + 1 > cutoff:
+            if dual_pivot:
+                ranges = partition_dual_pivot(arr, lo, hi, pivot)
+            else:
+                ranges = partition_three_way(arr, lo, hi, pivot)
+
+            # Defer the larger ranges and keep going on the smallest one
+            ranges = sorted(ranges, key=lambda r: r[1] - r[0])
+            stack.extend(reversed(ranges[1:]))
+            lo, hi = ranges[0]
+        insertion_sort_range(arr, lo, hi)
+    return arr
+
+
+def median_of_three(arr, a, b, c):
+    """Index of the median of arr[a], arr[b], arr[c]."""
+    x, y, z = arr[a], arr[b], arr[c]
+    if x < y:
+        if y < z:
+            return b
+        return c if x < z else a
+    if x < z:
+        return a
+    return c if y < z else b
+
+
+def choose_pivot(arr, lo, hi, pivot="ninther"):
+    """Index of a pivot for arr[lo..hi]."""
+    mid = lo + (hi - lo) // 2
+    if pivot == "ninther" and hi - lo + 1 >= NINTHER_THRESHOLD:
+        step = (hi - lo + 1) // 8
+        return median_of_three(
+            arr,
+            median_of_three(arr, lo, lo + step, lo + 2 * step),
+            median_of_three(arr, mid - step, mid, mid + step),
+            median_of_three(arr, hi - 2 * step, hi - step, hi),
+        )
+    return median_of_three(arr, lo, mid, hi)
+
+
+def partition_three_way(arr, lo, hi, pivot="ninther"):
+    """
+    Dijkstra's Dutch national flag partition of arr[lo..hi] into
+    < pivot | == pivot | > pivot.
+
+    Returns:
+        The (low, high) ranges still to be sorted on either side
+    """
+    p = choose_pivot(arr, lo, hi, pivot)
+    arr[lo], arr[p] = arr[p], arr[lo]
+    v = arr[lo]
+
+    lt, i, gt = lo, lo + 1, hi
+    while i <= gt:
+        x = arr[i]
+        if x < v:
+            arr[lt], arr[i] = x, arr[lt]
+            lt += 1
+            i += 1
+        elif v < x:
+            arr[i], arr[gt] = arr[gt], x
+            gt -= 1
+        else:
+            i += 1
+    return [(lo, lt - 1), (gt + 1, hi)]
+
+
+def partition_dual_pivot(arr, lo, hi, pivot="ninther"):
+    """
+    Yaroslavskiy's dual-pivot partition of arr[lo..hi] into
+    < p | p <= x <= q | > q, with pivots p <= q taken from a sample of five.
+
+    Returns:
+        The (low, high) ranges still to be sorted
+    """
+    # Sort five evenly spaced samples and use the 2nd and 4th as pivots
+    step = (hi - lo) // 6
+    samples = [lo + step * k for k in range(1, 6)]
+    insertion_sort_indices(arr, samples)
+    arr[lo], arr[samples[1]] = arr[samples[1]], arr[lo]
+    arr[hi], arr[samples[3]] = arr[samples[3]], arr[hi]
+
+    p, q = arr[lo], arr[hi]
+    if not p < q:
+        # Equal pivots would put every duplicate on one side; a three-way
+        # split around the single value handles that case in one pass
+        return partition_three_way(arr, lo, hi, pivot)
+
+    less, great, k = lo + 1, hi - 1, lo + 1
+    while k <= great:
+        x = arr[k]
+        if x < p:
+            arr[k], arr[less] = arr[less], x
+            less += 1
+        elif q < x:
+            while q < arr[great] and k < great:
+                great -= 1
+            arr[k], arr[great] = arr[great], x
+            great -= 1
+            if arr[k] < p:
+                arr[k], arr[less] = arr[less], arr[k]
+                less += 1
+        k += 1
+
+    less -= 1
+    great += 1
+    arr[lo], arr[less] = arr[less], arr[lo]
+    arr[hi], arr[great] = arr[great], arr[hi]
+    return [(lo, less - 1), (less + 1, great - 1), (great + 1, hi)]
+
+
+def insertion_sort_indices(arr, indices):
+    """Sort the values at the given (ascending) indices among themselves."""
+    for i in range(1, len(indices)):
+        key = arr[indices[i]]
+        j = i - 1
+        while j >= 0 and key < arr[indices[j]]:
+            arr[indices[j + 1]] = arr[indices[j]]
+            j -= 1
+        arr[indices[j + 1]] = key
+
+
+def insertion_sort_range(arr, lo, hi):
+    for i in range(lo + 1, hi + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and key < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+def benchmark_quick_sort_engine(sizes=(10_000, 40_000, 160_000), seed=0):
+    """
+    Time quick_sort_engine on inputs that make naive quicksort quadratic.
+    The last column (time / n log2 n) stays roughly flat when it doesn't.
+    """
+    rng = random.Random(seed)
+    inputs = {
+        "random": lambda n: [rng.randrange(n) for _ in range(n)],
+        "sorted": lambda n: list(range(n)),
+        "reversed": lambda n: list(range(n, 0, -1)),
+        "organ_pipe": lambda n: [min(i, n - 1 - i) for i in range(n)],
+        "few_unique": lambda n: [rng.randrange(16) for _ in range(n)],
+    }
+    print(f"{'mode':<12} {'input':<12} {'n':>9} {'seconds':>9} {'ns/(n lg n)':>12}")
+    for dual_pivot in (False, True):
+        mode = "dual-pivot" if dual_pivot else "three-way"
+        for name, make in inputs.items():
+            for n in sizes:
+                data = make(n)
+                expected = sorted(data)
+                start = time.perf_counter()
+                quick_sort_engine(data, dual_pivot=dual_pivot)
+                elapsed = time.perf_counter() - start
+                assert data == expected
+                per = elapsed / (n * math.log2(n)) * 1e9
+                print(f"{mode:<12} {name:<12} {n:>9} {elapsed:>9.3f} {per:>12.1f}")
+
+
 if __name__ == "__main__":
-    arr = [64, 34, 25, 12, 22, 11, 90]
-    print("Quick Sort:", quick_sort(arr))
-    arr2 = [64, 34, 25, 12, 22, 11, 90]
-    print("Quick Sort (in-place):", quick_sort_in_place(arr2))
+    parser = argparse.ArgumentParser(description="Quick sort examples")
+    parser.add_argument("--benchmark", action="store_true")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_quick_sort_engine()
+    else:
+        arr = [64, 34, 25, 12, 22, 11, 90]
+        print("Quick Sort:", quick_sort(arr))
+        arr2 = [64, 34, 25, 12, 22, 11, 90]
+        print("Quick Sort (in-place):", quick_sort_in_place(arr2))
+
+        arr3 = [5, 1, 5, 3, 5, 2, 5, 4, 5, 0] * 4
+        print("Quick Sort (three-way):", quick_sort_engine(arr3.copy()))
+        print("Quick Sort (dual-pivot):", quick_sort_engine(arr3, dual_pivot=True))
 
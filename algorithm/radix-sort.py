@@ -4,46 +4,465 @@ Radix Sort Implementation in Python
 Radix sort sorts digits/characters by place value, starting from least significant
 digit to most significant digit. Uses counting sort as a subroutine.
 
+This version works on bytes (base 256) or 16-bit digits (base 65536) rather
+than decimal digits. Keys are first mapped to unsigned integers whose order
+matches the original order:
+- signed ints: offset by the minimum (or flip the sign bit for fixed width)
+- IEEE floats: flip every bit of negatives, only the sign bit of positives
+
+With NumPy installed, radix_argsort()/radix_sort_array() run each digit pass
+as one vectorized stable counting pass over a whole ndarray, which sorts tens
+of millions of 64-bit keys in a few seconds. Without NumPy the list API falls
+back to a pure-Python bucket pass per byte. Lists that mix ints and floats
+are argsorted on their float64 keys and read back from the original list,
+so every element comes back unchanged; ints too large for a float to tell
+apart are put in exact order within their run of equal keys.
+
+Strings (URLs, log keys, ...) are sorted most significant digit first by
+radix_sort_strings(), on their UTF-8 bytes (whose order is code point
+order, the same as comparing the str objects):
+- each large bucket is split on the next DIGIT_BYTES bytes, and each
+  sub-bucket continues that many bytes deeper; a bucket whose keys all
+  share the next bytes jumps straight past that common prefix
+- buckets of at most MULTIKEY_LIMIT keys finish with multikey (three-way
+  radix) quicksort, and the smallest with insertion sort
+- the depth at which two neighbours were split apart is their longest common
+  prefix, so the LCP array comes for free
+
 Time Complexity: O(d * (n + k)) where d is number of digits, k is base
+    Strings: O(D + n log σ) where D is the total length of the
+    distinguishing prefixes and σ the alphabet size
 Space Complexity: O(n + k)
 """
 
+import argparse
+import os
+import random
+import struct
+import sys
+import time
+from itertools import chain
+
+from sort_support import load_sibling, np
+
+RADIX_BITS = 16
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+DIGIT_BYTES = 2
+MULTIKEY_LIMIT = 64
+STRING_INSERTION_LIMIT = 8
+
 
 def radix_sort(arr):
+    """
+    Radix Sort - list API
+
+    Args:
+        arr: List of ints and/or floats (negative values are fine), or a
+            list of str or of bytes
+
+    Returns:
+        List: Sorted list (original list is not modified)
+    """
     if len(arr) == 0:
         return arr
-    
-    max_val = max(arr)
-    max_digits = len(str(abs(max_val)))
-    
-    for exp in range(max_digits):
-        arr = counting_sort_by_digit(arr, 10 ** exp)
-    
-    return arr
-
-
-def counting_sort_by_digit(arr, exp):
-    output = [0] * len(arr)
-    count = [0] * 10
-    
-    # Count occurrences
-    for i in range(len(arr)):
-        count[(arr[i] // exp) % 10] += 1
-    
-    # Change count to positions
-    for i in range(1, 10):
-        count[i] += count[i - 1]
-    
-    # Build output array
-    for i in range(len(arr) - 1, -1, -1):
-        digit = (arr[i] // exp) % 10
-        output[count[digit] - 1] = arr[i]
-        count[digit] -= 1
-    
-    return output
+    if isinstance(arr[0], (str, bytes)):
+        return radix_sort_strings(arr)
+
+    if np is not None:
+        values = _as_numpy(arr)
+        if values is not None:
+            return values[radix_argsort(values)].tolist()
+
+    return [arr[i] for i in argsort_numbers(arr)]
+
+
+def argsort_numbers(arr):
+    """
+    Stable radix argsort of a list of ints and/or floats.
+
+    Returns:
+        List of indices such that [arr[i] for i in result] is sorted
+    """
+    mixed = not (
+        all(type(x) is int for x in arr) or all(type(x) is float for x in arr)
+    )
+    if np is None:
+        order = radix_argsort_list(arr)
+    else:
+        values = np.array(arr, dtype=np.float64) if mixed else _as_numpy(arr)
+        if values is None:
+            order = radix_argsort_list(arr)
+        else:
+            order = radix_argsort(values).tolist()
+    if mixed:
+        _order_equal_keys(arr, order)
+    return order
+
+
+def _order_equal_keys(arr, order):
+    """
+    Float keys keep the order of different values (rounding is monotonic)
+    but can tie distinct ones, e.g. 2**53 and 2**53 + 1; insertion sort each
+    run of equal keys on the exact values.
+    """
+    i = 0
+    while i < len(order):
+        key = float(arr[order[i]])
+        j = i + 1
+        while j < len(order) and float(arr[order[j]]) == key:
+            index = order[j]
+            k = j - 1
+            while k >= i and arr[order[k]] > arr[index]:
+                order[k + 1] = order[k]
+                k -= 1
+            order[k + 1] = index
+            j += 1
+        i = j
+
+
+def radix_argsort_list(arr, radix_bits=8):
+    """
+    Pure-Python stable argsort of ints/floats, one bucket pass per digit.
+
+    Returns:
+        List of indices such that [arr[i] for i in result] is sorted
+    """
+    keys, bits = _unsigned_keys(arr)
+    mask = (1 << radix_bits) - 1
+    order = list(range(len(arr)))
+
+    for shift in range(0, bits, radix_bits):
+        buckets = [[] for _ in range(mask + 1)]
+        for i in order:
+            buckets[(keys[i] >> shift) & mask].append(i)
+        # All keys share this digit: the pass would not move anything
+        if any(len(bucket) == len(order) for bucket in buckets):
+            continue
+        order = list(chain.from_iterable(buckets))
+
+    return order
+
+
+def _unsigned_keys(arr):
+    """Map ints/floats to non-negative ints with the same order."""
+    if all(type(x) is int for x in arr):
+        low = min(arr)
+        keys = [x - low for x in arr]
+        return keys, max(keys).bit_length()
+
+    keys = []
+    for x in arr:
+        # + 0.0 turns -0.0 into 0.0, which compares equal to it
+        (u,) = struct.unpack("<Q", struct.pack("<d", float(x) + 0.0))
+        keys.append(u ^ 0xFFFFFFFFFFFFFFFF if u >> 63 else u | (1 << 63))
+    return keys, 64
+
+
+def _as_numpy(arr):
+    """
+    Convert an all-int list to int64 or an all-float list to float64, or
+    return None (ints past int64, mixed or non-numeric lists).
+    """
+    if isinstance(arr, np.ndarray):
+        return arr
+    if all(type(x) is int for x in arr):
+        if INT64_MIN <= min(arr) and max(arr) <= INT64_MAX:
+            return np.array(arr, dtype=np.int64)
+        return None
+    if all(type(x) is float for x in arr):
+        return np.array(arr, dtype=np.float64)
+    return None
+
+
+def to_unsigned(values):
+    """
+    Reinterpret an integer/float/bool ndarray as unsigned integers of the
+    same width whose unsigned order equals the original order.
+
+    Floats sort as -inf < negatives < zeros < positives < inf; -0.0 and
+    0.0 compare equal, so they share a key and keep their input order.
+    NaNs with the sign bit clear go last, those with it set go first.
+    """
+    kind = values.dtype.kind
+    if kind == "f":
+        # -0.0 + 0.0 is 0.0 (and NaNs keep their sign)
+        values = values + values.dtype.type(0)
+    if kind == "b":
+        return values.view(np.uint8)
+    if kind == "u":
+        return values
+
+    width = values.dtype.itemsize
+    utype = np.dtype(f"u{width}")
+    u = values.view(utype)
+    sign = utype.type(1 << (8 * width - 1))
+
+    if kind == "i":
+        return u ^ sign
+    if kind == "f":
+        negative = (u & sign) != 0
+        return np.where(negative, ~u, u | sign)
+    raise TypeError(f"radix sort does not support dtype {values.dtype}")
+
+
+def radix_argsort(values, radix_bits=RADIX_BITS):
+    """
+    Vectorized LSD radix argsort (stable).
+
+    Args:
+        values: 1-D ndarray of ints, unsigned ints, floats or bools
+        radix_bits: 8 (base 256) or 16 (base 65536) bits per pass
+
+    Returns:
+        ndarray of int64 indices; values[result] is sorted. Use it to reorder
+        any number of parallel arrays the same way.
+    """
+    if radix_bits not in (8, 16):
+        raise ValueError("radix_bits must be 8 or 16")
+
+    values = np.ascontiguousarray(values)
+    if values.ndim != 1:
+        raise ValueError("radix_argsort expects a 1-D array")
+    n = values.shape[0]
+    perm = np.arange(n, dtype=np.int64)
+    if n < 2:
+        return perm
+
+    keys = to_unsigned(values)
+    # Offsetting by the minimum drops the passes over leading digits that
+    # every key shares (e.g. small int64s only need one or two passes)
+    low = keys.min()
+    keys = (keys - low).astype(np.uint64, copy=False)
+    bits = int(keys.max()).bit_length()
+
+    digit_type = np.uint8 if radix_bits == 8 else np.uint16
+    mask = (1 << radix_bits) - 1
+    for shift in range(0, bits, radix_bits):
+        digits = ((keys >> shift) & mask).astype(digit_type)
+        # Stable sort on a 8/16-bit digit: NumPy runs this as a counting
+        # (radix) pass, so each pass is O(n)
+        order = np.argsort(digits, kind="stable")
+        keys = keys[order]
+        perm = perm[order]
+
+    return perm
+
+
+def radix_sort_array(values, radix_bits=RADIX_BITS):
+    """
+    Radix Sort - ndarray fast path
+
+    Returns:
+        New sorted ndarray of the same dtype
+    """
+    values = np.asarray(values)
+    return values[radix_argsort(values, radix_bits)]
+
+
+def radix_sort_strings(strings, return_lcp=False):
+    """
+    MSD Radix Sort - strings
+
+    Args:
+        strings: List of str (ordered by code point, like sorted()) or a
+            list of bytes
+        return_lcp: Also return the LCP array
+
+    Returns:
+        List: Sorted list (original list is not modified), or a
+        (sorted list, lcp) pair where lcp[i] is the length of the longest
+        common prefix of result[i - 1] and result[i] (lcp[0] = 0), in
+        characters for str and in bytes for bytes
+    """
+    text = len(strings) > 0 and isinstance(strings[0], str)
+    keys = [s.encode("utf-8") for s in strings] if text else list(strings)
+    lcp = [0] * len(keys)
+    _msd_radix_sort(keys, lcp)
+
+    if not text:
+        return (keys, lcp) if return_lcp else keys
+    result = [key.decode("utf-8") for key in keys]
+    if not return_lcp:
+        return result
+    # Byte LCPs to character LCPs; a prefix ending inside a multi-byte
+    # character does not count that character
+    for i, key in enumerate(keys):
+        if lcp[i] and not key.isascii():
+            lcp[i] = len(key[: lcp[i]].decode("utf-8", "ignore"))
+    return result, lcp
+
+
+def _msd_radix_sort(a, lcp):
+    # Each stack entry is a bucket a[lo:hi] whose keys share their first
+    # d bytes; lcp[lo] was already set by whoever split it off
+    stack = [(0, len(a), 0)]
+    while stack:
+        lo, hi, d = stack.pop()
+        if hi - lo < 2:
+            continue
+        if hi - lo <= MULTIKEY_LIMIT:
+            _multikey_quicksort(a, lo, hi, d, lcp)
+            continue
+
+        # Skip the prefix shared by the whole bucket (that of its min and
+        # max) in one step, so every pass below splits the bucket
+        bucket = a[lo:hi]
+        low, high = min(bucket), max(bucket)
+        if low == high:
+            lcp[lo + 1 : hi] = [len(low)] * (hi - lo - 1)
+            continue
+        d = len(os.path.commonprefix((low, high)))
+
+        # Split on DIGIT_BYTES bytes at a time. A shorter digit means the
+        # key ends inside it, and bytes order puts it first (b"a" < b"ab"),
+        # so the groups come out in key order
+        end = d + DIGIT_BYTES
+        groups = {}
+        for key in bucket:
+            digit = key[d:end]
+            try:
+                groups[digit].append(key)
+            except KeyError:
+                groups[digit] = [key]
+
+        pos = lo
+        previous = None
+        for digit in sorted(groups):
+            group = groups[digit]
+            stop = pos + len(group)
+            a[pos:stop] = group
+            if previous is not None:
+                lcp[pos] = d
+                if previous[:1] == digit[:1]:
+                    lcp[pos] += len(os.path.commonprefix((previous, digit)))
+            if len(digit) == DIGIT_BYTES:
+                stack.append((pos, stop, end))
+            else:
+                # Keys that end inside this digit are all equal
+                lcp[pos + 1 : stop] = [d + len(digit)] * (stop - pos - 1)
+            previous = digit
+            pos = stop
+
+
+def _multikey_quicksort(a, lo, hi, d, lcp):
+    """
+    Bentley-Sedgewick three-way radix quicksort of a[lo:hi], whose keys
+    share their first d bytes: partition on one byte, then only the keys
+    equal to the pivot byte move on to the next one.
+    """
+    stack = [(lo, hi, d)]
+    while stack:
+        lo, hi, d = stack.pop()
+        if hi - lo <= STRING_INSERTION_LIMIT:
+            _insertion_sort_strings(a, lo, hi, d, lcp)
+            continue
+
+        # Median of three bytes (-1 marks a key that ends at depth d)
+        samples = (a[lo], a[(lo + hi) // 2], a[hi - 1])
+        pivot = sorted(key[d] if d < len(key) else -1 for key in samples)[1]
+
+        lt, i, gt = lo, lo, hi - 1
+        while i <= gt:
+            key = a[i]
+            byte = key[d] if d < len(key) else -1
+            if byte < pivot:
+                a[lt], a[i] = key, a[lt]
+                lt += 1
+                i += 1
+            elif byte > pivot:
+                a[gt], a[i] = key, a[gt]
+                gt -= 1
+            else:
+                i += 1
+
+        # a[lo:lt] < pivot byte, a[lt:gt + 1] == pivot byte, a[gt + 1:hi] >
+        if lt > lo:
+            lcp[lt] = d
+        if gt + 1 < hi:
+            lcp[gt + 1] = d
+        stack.append((lo, lt, d))
+        stack.append((gt + 1, hi, d))
+        if pivot >= 0:
+            stack.append((lt, gt + 1, d + 1))
+        else:
+            lcp[lt + 1 : gt + 1] = [d] * (gt - lt)
+
+
+def _insertion_sort_strings(a, lo, hi, d, lcp):
+    for i in range(lo + 1, hi):
+        key = a[i]
+        j = i - 1
+        while j >= lo and a[j] > key:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = key
+
+    # Neighbours share at least d bytes; count the rest
+    for i in range(lo + 1, hi):
+        prev, key = a[i - 1], a[i]
+        common = d
+        limit = min(len(prev), len(key))
+        while common < limit and prev[common] == key[common]:
+            common += 1
+        lcp[i] = common
+
+
+def benchmark_string_sort(n=1_000_000, seed=0):
+    """
+    Time radix_sort_strings against this folder's comparison sorts (and the
+    built-in sorted() for reference) on URL-like keys with long shared
+    prefixes.
+    """
+    rng = random.Random(seed)
+    hosts = [f"https://{name}.example.com" for name in ("api", "cdn", "www", "docs")]
+    sections = ["users", "orders", "items", "search", "static/img", "static/js"]
+    urls = [
+        f"{rng.choice(hosts)}/{rng.choice(sections)}/{rng.randrange(10**7)}"
+        f"?page={rng.randrange(50)}"
+        for _ in range(n)
+    ]
+    expected = sorted(urls)
+
+    quick_sort_engine = load_sibling("quick-sort").quick_sort_engine
+    merge_sort_bottom_up = load_sibling("merge-sort").merge_sort_bottom_up
+    contenders = {
+        "radix_sort_strings": radix_sort_strings,
+        "quick_sort_engine": lambda keys: quick_sort_engine(list(keys)),
+        "merge_sort_bottom_up": merge_sort_bottom_up,
+        "sorted() (C)": sorted,
+    }
+    print(f"{n:,} URL keys")
+    for name, sort in contenders.items():
+        start = time.perf_counter()
+        result = sort(urls)
+        elapsed = time.perf_counter() - start
+        assert result == expected
+        print(f"{name:<22} {elapsed:>7.2f}s")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Radix sort examples")
+    parser.add_argument("--benchmark", action="store_true")
+    parser.add_argument("--n", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_string_sort(args.n)
+        sys.exit()
+
     arr = [170, 45, 75, 90, 802, 24, 2, 66]
     print("Radix Sort:", radix_sort(arr.copy()))
+    print("Radix Sort (negatives):", radix_sort([5, -3, 0, -120, 42, -3]))
+    print("Radix Sort (floats):", radix_sort([2.5, -0.5, 3.25, -7.0, 0.0]))
+    words = ["banana", "band", "ban", "apple", "bandana", "ban"]
+    print("Radix Sort (strings, LCP):", radix_sort_strings(words, return_lcp=True))
 
+    if np is not None:
+        rng = np.random.default_rng(0)
+        keys = rng.integers(-(2**62), 2**62, size=10_000_000, dtype=np.int64)
+        start = time.perf_counter()
+        result = radix_sort_array(keys)
+        elapsed = time.perf_counter() - start
+        assert np.array_equal(result, np.sort(keys))
+        print(f"Radix Sort (ndarray): 10,000,000 int64 keys in {elapsed:.2f}s")
@@ -0,0 +1,237 @@
+"""
+Sample Sort Implementation in Python
+
+Sample sort generalizes quick sort's partition step to many pivots at once:
+1. sort a random oversample of the input and take every `oversample`-th
+   element as a splitter, giving p - 1 splitters for p buckets
+2. send each element to the bucket between its two splitters (a binary
+   search, vectorized with np.searchsorted)
+3. sort the buckets independently and concatenate them
+
+Heavy duplication would put every copy of a repeated value into a single
+bucket, so elements are bucketed as (value, index) pairs: the sample and
+splitters are pairs too, and equal values are split by position. A value
+that makes up 40% of the input then fills 40% of the buckets, and buckets
+stay balanced even if every element is the same.
+
+parallel_sample_sort() scatters an ndarray into a shared-memory buffer,
+bucket after bucket, and a process pool sorts each bucket in place, so the
+buffer ends up as one contiguous sorted array.
+
+Time Complexity: O(n log n) expected, O(n log n / p) per worker
+Space Complexity: O(n)
+"""
+
+import argparse
+import os
+import random
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from sort_support import call_sibling, load_sibling, np, scatter_by_bucket
+
+OVERSAMPLE = 256
+BUCKET_SIZE = 4096
+PARALLEL_THRESHOLD = 1_000_000
+
+
+def choose_splitters(sample, buckets, oversample=OVERSAMPLE):
+    """Every oversample-th element of a sorted sample: buckets - 1 splitters."""
+    return sample[oversample::oversample][: buckets - 1]
+
+
+def sample_sort(arr, buckets=None, oversample=OVERSAMPLE, seed=0):
+    """
+    Sample Sort - list version
+
+    Args:
+        arr: List to sort
+        buckets: Number of buckets (default: about len(arr) / BUCKET_SIZE)
+        oversample: Sample elements drawn per bucket when picking splitters
+
+    Returns:
+        List: Sorted list (original list is not modified)
+    """
+    n = len(arr)
+    buckets = buckets or max(1, n // BUCKET_SIZE)
+    quick_sort_engine = load_sibling("quick-sort").quick_sort_engine
+    if buckets == 1 or n <= buckets * oversample:
+        return quick_sort_engine(list(arr))
+
+    rng = random.Random(seed)
+    picks = rng.choices(range(n), k=buckets * oversample)
+    sample = quick_sort_engine([(arr[i], i) for i in picks])
+    splitters = choose_splitters(sample, buckets, oversample)
+
+    parts = [[] for _ in range(buckets)]
+    for i, x in enumerate(arr):
+        parts[bisect_left(splitters, (x, i))].append(x)
+
+    result = []
+    for part in parts:
+        result.extend(quick_sort_engine(part))
+    return result
+
+
+def bucket_ids(values, split_values, split_index):
+    """
+    Bucket of every element of values (vectorized): the number of splitter
+    pairs (split_values[j], split_index[j]) below (values[i], i).
+    """
+    ids = np.searchsorted(split_values, values, side="left")
+    # Only values equal to a splitter need the index comparison. Keying
+    # them and the splitters by (first equal splitter, index) turns that
+    # into one more searchsorted
+    tied = np.flatnonzero(np.searchsorted(split_values, values, side="right") > ids)
+    if tied.size:
+        scale = len(values) + 1
+        first = np.searchsorted(split_values, split_values, side="left")
+        split_keys = first * scale + split_index
+        ids[tied] = np.searchsorted(split_keys, ids[tied] * scale + tied)
+    return ids
+
+
+def _sort_shared_bucket(shm_name, dtype, n, lo, hi):
+    # Runs in a worker process: attach, sort one bucket in place, detach
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        data = np.ndarray((n,), dtype=dtype, buffer=shm.buf)
+        data[lo:hi].sort()
+        del data
+    finally:
+        shm.close()
+
+
+def parallel_sample_sort(
+    values,
+    workers=None,
+    oversample=OVERSAMPLE,
+    threshold=PARALLEL_THRESHOLD,
+    seed=0,
+    stats=None,
+):
+    """
+    Sample Sort - Multi-process ndarray version
+
+    Args:
+        values: 1-D ndarray (or list) of numbers
+        workers: Worker processes, one bucket each (default: os.cpu_count())
+        oversample: Sample elements drawn per bucket when picking splitters
+        threshold: Inputs shorter than this are sorted with np.sort
+        stats: Optional dict that receives the bucket sizes
+
+    Returns:
+        ndarray: New contiguous sorted array of the same dtype
+    """
+    values = np.ascontiguousarray(values)
+    if values.ndim != 1:
+        raise ValueError("parallel_sample_sort expects a 1-D array")
+    n = values.shape[0]
+    workers = workers or os.cpu_count() or 1
+    if n < threshold or n <= workers * oversample:
+        return np.sort(values)
+
+    rng = np.random.default_rng(seed)
+    picks = rng.choice(n, size=workers * oversample)
+    order = np.lexsort((picks, values[picks]))
+    split = choose_splitters(picks[order], workers, oversample)
+
+    ids = bucket_ids(values, values[split], split)
+    counts = np.bincount(ids, minlength=workers)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    if stats is not None:
+        stats["bucket_sizes"] = counts.tolist()
+
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    scattered = np.ndarray((n,), dtype=values.dtype, buffer=shm.buf)
+    try:
+        scattered[:] = scatter_by_bucket(values, ids)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Workers get call_sibling, not _sort_shared_bucket itself, so
+            # they can unpickle it under spawn too (see sort_support.py)
+            futures = [
+                pool.submit(
+                    call_sibling,
+                    "sample-sort",
+                    "_sort_shared_bucket",
+                    shm.name,
+                    values.dtype.str,
+                    n,
+                    offsets[b],
+                    offsets[b + 1],
+                )
+                for b in range(workers)
+                if counts[b] > 1
+            ]
+            for future in futures:
+                future.result()
+
+        return scattered.copy()
+    finally:
+        # The array exports shm's buffer; drop it before closing
+        del scattered
+        shm.close()
+        shm.unlink()
+
+
+def benchmark_parallel_sample_sort(n=10_000_000, max_workers=None, seed=0):
+    """
+    Time parallel_sample_sort against np.sort on uniform, heavily skewed
+    (Zipf) and all-equal inputs, and show the worst bucket's size relative
+    to a perfect split (1.00 = perfectly balanced).
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    rng = np.random.default_rng(seed)
+    inputs = {
+        "uniform": lambda: rng.integers(-(2**62), 2**62, size=n),
+        "zipf": lambda: rng.zipf(1.3, size=n).astype(np.int64),
+        "all_equal": lambda: np.full(n, 7, dtype=np.int64),
+    }
+    print(
+        f"{'input':<10} {'workers':>8} {'seconds':>9} {'np.sort':>9}"
+        f" {'max/ideal':>10}"
+    )
+    for name, make in inputs.items():
+        data = make()
+        start = time.perf_counter()
+        expected = np.sort(data)
+        baseline = time.perf_counter() - start
+        for workers in sorted({1, 2, max_workers}):
+            stats = {}
+            start = time.perf_counter()
+            result = parallel_sample_sort(
+                data, workers=workers, threshold=0, stats=stats
+            )
+            elapsed = time.perf_counter() - start
+            assert np.array_equal(result, expected)
+            balance = max(stats.get("bucket_sizes", [n])) / (n / workers)
+            print(
+                f"{name:<10} {workers:>8} {elapsed:>9.2f} {baseline:>9.2f}"
+                f" {balance:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sample sort examples")
+    parser.add_argument("--benchmark", action="store_true")
+    parser.add_argument("--n", type=int, default=10_000_000)
+    parser.add_argument("--max-workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_parallel_sample_sort(args.n, args.max_workers)
+    else:
+        arr = [64, 34, 25, 12, 22, 11, 90]
+        print("Sample Sort:", sample_sort(arr))
+        skewed = [5] * 20_000 + list(range(5_000))
+        print("Sample Sort (skewed):", sample_sort(skewed, buckets=8) == sorted(skewed))
+
+        if np is not None:
+            data = np.random.default_rng(0).zipf(1.5, size=200_000)
+            stats = {}
+            result = parallel_sample_sort(data, workers=4, threshold=0, stats=stats)
+            assert np.array_equal(result, np.sort(data))
+            print("Sample Sort (parallel, Zipf) bucket sizes:", stats["bucket_sizes"])
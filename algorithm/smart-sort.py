@@ -0,0 +1,367 @@
+"""
+Smart Sort - adaptive dispatcher in Python
+
+smart_sort() looks at a cheap sample of its input and hands it to whichever
+sort in this folder was fastest on similar data:
+1. profile: length, element kind (int / float / str / other), presortedness
+   (inversion ratio of random pairs, mean run length in a few windows),
+   key range relative to n and the duplicate ratio of a sample
+2. bucket the profile into a cell such as "int/large/random/dense/distinct"
+3. look the cell up in a decision table (smart-sort.json) and run that sort
+
+The table is calibrated, not hand-written: `python smart-sort.py --calibrate`
+generates inputs for every cell, times each candidate (counting, radix,
+Tim, insertion and quick sort) on them and stores the winner, along with the
+timings, so the choice can be re-checked on another machine.
+
+Every decision is logged on the "smart_sort" logger (profile, cell, chosen
+sort and the time it took), so mis-dispatches can be audited:
+
+    logging.basicConfig(level=logging.INFO)
+
+Time Complexity: O(sample) to profile, plus the chosen sort
+Space Complexity: O(sample), plus the chosen sort
+"""
+
+import argparse
+import json
+import logging
+import platform
+import random
+import time
+from pathlib import Path
+
+from sort_support import ALGORITHM_DIR, load_sibling
+
+TABLE_PATH = ALGORITHM_DIR / "smart-sort.json"
+DEFAULT_ALGORITHM = "tim_sort"
+
+SAMPLE_SIZE = 1024
+RUN_WINDOWS = 4
+RUN_WINDOW_SIZE = 256
+
+# Profile -> cell thresholds
+TINY_N = 64
+SMALL_N = 4096
+SORTED_INVERSIONS = 0.001
+LONG_RUN = 16
+DENSE_RANGE = 4
+DUPLICATE_RATIO = 0.5
+
+COMPARISON_CANDIDATES = ["tim_sort", "insertion_sort", "quick_sort_engine"]
+CANDIDATES = {
+    "int": ["counting_sort", "radix_sort"] + COMPARISON_CANDIDATES,
+    "float": ["radix_sort"] + COMPARISON_CANDIDATES,
+    "str": ["radix_sort"] + COMPARISON_CANDIDATES,
+}
+CALIBRATION_SIZES = {"tiny": 48, "small": 2_000, "large": 100_000}
+QUADRATIC = {"insertion_sort"}
+
+logger = logging.getLogger("smart_sort")
+
+
+# --- Profiling -------------------------------------------------------------
+
+
+def element_kind(sample):
+    types = {type(x) for x in sample}
+    if types == {int}:
+        return "int"
+    if types and types <= {int, float}:
+        return "float"
+    if types == {str}:
+        return "str"
+    return "other"
+
+
+def profile(arr, sample_size=SAMPLE_SIZE, seed=0):
+    """
+    Cheap summary of arr, from O(sample_size) positions (plus a C-speed
+    min/max pass for ints).
+
+    Returns:
+        dict with n, kind, inversions (fraction of sampled unequal pairs
+        i < j with arr[i] > arr[j]: 0 sorted, ~0.5 random, 1 reversed), mean_run
+        (mean ascending run length in a few windows), range_ratio
+        ((max - min + 1) / n, ints only) and duplicates (1 - distinct /
+        sampled)
+    """
+    n = len(arr)
+    rng = random.Random(seed)
+    if n <= sample_size:
+        sample = list(arr)
+    else:
+        sample = [arr[i] for i in rng.sample(range(n), sample_size)]
+    info = {
+        "n": n,
+        "kind": element_kind(sample),
+        "inversions": 0.0,
+        "mean_run": float(n),
+        "range_ratio": None,
+        "duplicates": None,
+    }
+    if n < 2 or info["kind"] == "other":
+        return info
+
+    # Ties are neither inversions nor in order, so they are left out: a
+    # reversed list with duplicates still scores 1
+    inverted = ordered = 0
+    for _ in range(sample_size):
+        i, j = sorted((rng.randrange(n), rng.randrange(n)))
+        if arr[i] > arr[j]:
+            inverted += 1
+        elif arr[i] < arr[j]:
+            ordered += 1
+    info["inversions"] = inverted / max(inverted + ordered, 1)
+
+    window = min(RUN_WINDOW_SIZE, n)
+    descents = 0
+    for _ in range(RUN_WINDOWS):
+        start = rng.randrange(n - window + 1)
+        for i in range(start + 1, start + window):
+            if arr[i - 1] > arr[i]:
+                descents += 1
+    info["mean_run"] = RUN_WINDOWS * window / (descents + RUN_WINDOWS)
+
+    if info["kind"] == "int":
+        try:
+            info["range_ratio"] = (max(arr) - min(arr) + 1) / n
+        except TypeError:
+            # Not all ints after all (the sample missed the odd one out)
+            info["kind"] = "other"
+            return info
+    info["duplicates"] = 1 - len(set(sample)) / len(sample)
+    return info
+
+
+def cell(info):
+    """Decision table key for a profile, e.g. "int/large/random/dense/distinct"."""
+    n, kind = info["n"], info["kind"]
+    size = "tiny" if n <= TINY_N else "small" if n <= SMALL_N else "large"
+    if kind == "other" or n < 2:
+        return f"other/{size}"
+
+    inversions = info["inversions"]
+    if inversions <= SORTED_INVERSIONS:
+        order = "sorted"
+    elif inversions >= 1 - SORTED_INVERSIONS:
+        order = "reversed"
+    elif info["mean_run"] >= LONG_RUN:
+        order = "runs"
+    else:
+        order = "random"
+
+    if info["range_ratio"] is None:
+        spread = "-"
+    else:
+        spread = "dense" if info["range_ratio"] <= DENSE_RANGE else "sparse"
+    duplicates = "dups" if info["duplicates"] >= DUPLICATE_RATIO else "distinct"
+    return f"{kind}/{size}/{order}/{spread}/{duplicates}"
+
+
+# --- Dispatch ----------------------------------------------------------------
+
+
+def load_table(path=TABLE_PATH):
+    """The decision table, or an empty one (everything goes to the default)."""
+    path = Path(path)
+    if not path.exists():
+        logger.warning("no decision table at %s; using %s", path, DEFAULT_ALGORITHM)
+        return {"default": DEFAULT_ALGORITHM, "cells": {}}
+    return json.loads(path.read_text())
+
+
+_table_cache = {}
+
+
+def _table(table):
+    if isinstance(table, dict):
+        return table
+    path = Path(table or TABLE_PATH)
+    if path not in _table_cache:
+        _table_cache[path] = load_table(path)
+    return _table_cache[path]
+
+
+def choose(arr, table=None):
+    """
+    Pick a sort for arr without running it.
+
+    Returns:
+        dict with the profile, its cell and the chosen algorithm name
+    """
+    table = _table(table)
+    info = profile(arr)
+    key = cell(info)
+    entry = table["cells"].get(key)
+    if entry:
+        algorithm = entry["algorithm"]
+    else:
+        algorithm = table.get("default", DEFAULT_ALGORITHM)
+    return {
+        "profile": info,
+        "cell": key,
+        "algorithm": algorithm,
+        "calibrated": entry is not None,
+    }
+
+
+def smart_sort(arr, table=None):
+    """
+    Sort arr with the algorithm the decision table picks for data like it.
+
+    Args:
+        arr: List (or any sequence) to sort
+        table: Decision table dict, or a path to one (default: smart-sort.json)
+
+    Returns:
+        List: Sorted list (original list is not modified)
+    """
+    decision = choose(arr, table)
+    get_sort = load_sibling("sort-api").get_sort
+    start = time.perf_counter()
+    try:
+        result = get_sort(decision["algorithm"])(list(arr))
+    except (TypeError, ValueError):
+        # The sample missed an element the chosen sort can't handle (e.g. a
+        # float among ints for counting sort, or a lone surrogate that radix
+        # sort can't encode; UnicodeError is a ValueError)
+        logger.warning(
+            "%s failed on cell %s; falling back to %s",
+            decision["algorithm"],
+            decision["cell"],
+            DEFAULT_ALGORITHM,
+        )
+        decision["algorithm"] = DEFAULT_ALGORITHM
+        result = get_sort(DEFAULT_ALGORITHM)(list(arr))
+    elapsed = time.perf_counter() - start
+
+    info = decision["profile"]
+    logger.info(
+        "n=%d cell=%s -> %s%s in %.4fs (%s)",
+        info["n"],
+        decision["cell"],
+        decision["algorithm"],
+        "" if decision["calibrated"] else " (uncalibrated default)",
+        elapsed,
+        " ".join(
+            f"{name}={value:.3g}"
+            for name, value in info.items()
+            if isinstance(value, float)
+        ),
+    )
+    return result
+
+
+# --- Calibration -------------------------------------------------------------
+
+
+def _values(kind, n, sparse, dups, rng):
+    """n values of one kind: few distinct values if dups; ints dense or not."""
+    if kind == "int":
+        high = 2**40 if sparse else n
+        pool = [rng.randrange(high) for _ in range(16)] if dups else None
+        if pool:
+            return [rng.choice(pool) for _ in range(n)]
+        if sparse:
+            return [rng.randrange(high) for _ in range(n)]
+        return rng.sample(range(n), n)
+    if kind == "float":
+        pool = [rng.uniform(-1e6, 1e6) for _ in range(16)] if dups else None
+        if pool:
+            return [rng.choice(pool) for _ in range(n)]
+        return [rng.uniform(-1e6, 1e6) for _ in range(n)]
+    hosts = ["api", "cdn", "www", "docs"]
+    if dups:
+        pool = [f"{rng.choice(hosts)}/item/{rng.randrange(10**6)}" for _ in range(16)]
+        return [rng.choice(pool) for _ in range(n)]
+    return [f"{rng.choice(hosts)}/item/{rng.randrange(10**9)}" for _ in range(n)]
+
+
+def _arrange(values, order, rng):
+    if order == "random":
+        rng.shuffle(values)
+        return values
+    values.sort(reverse=order == "reversed")
+    if order == "runs":
+        # Sorted with 1% of the elements swapped at random
+        for _ in range(max(1, len(values) // 100)):
+            i, j = rng.randrange(len(values)), rng.randrange(len(values))
+            values[i], values[j] = values[j], values[i]
+    return values
+
+
+def calibration_inputs(seed=0):
+    """Yield (kind, size label, data) for every generated input shape."""
+    rng = random.Random(seed)
+    for kind in CANDIDATES:
+        for size, n in CALIBRATION_SIZES.items():
+            for order in ("sorted", "reversed", "runs", "random"):
+                for sparse in (False, True) if kind == "int" else (False,):
+                    for dups in (False, True):
+                        values = _values(kind, n, sparse, dups, rng)
+                        yield kind, size, _arrange(values, order, rng)
+
+
+def calibrate(seed=0, repeat=3, progress=None):
+    """
+    Time every candidate sort on generated inputs and keep, for each cell
+    the inputs profile into, the fastest one.
+
+    Returns:
+        dict: A decision table ready to be saved as JSON
+    """
+    get_sort = load_sibling("sort-api").get_sort
+    time_sort = load_sibling("sort-benchmark").time_sort
+    cells = {}
+    for kind, size, data in calibration_inputs(seed):
+        key = cell(profile(data))
+        expected = sorted(data)
+        seconds = {}
+        for name in CANDIDATES[kind]:
+            if name in QUADRATIC and size == "large":
+                continue
+            runs = repeat if size != "large" else 1
+            elapsed, result = time_sort(get_sort(name), data, runs)
+            if result == expected:
+                seconds[name] = round(elapsed, 6)
+        best = min(seconds, key=seconds.get)
+        # Several inputs can land in one cell; the fastest run decides it
+        previous = cells.get(key)
+        if previous is None or seconds[best] < min(previous["seconds"].values()):
+            cells[key] = {"algorithm": best, "seconds": seconds}
+        if progress:
+            progress(key, best, seconds)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "sizes": CALIBRATION_SIZES,
+        },
+        "default": DEFAULT_ALGORITHM,
+        "cells": dict(sorted(cells.items())),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Adaptive sort dispatcher")
+    parser.add_argument("--calibrate", action="store_true")
+    parser.add_argument("--output", default=str(TABLE_PATH))
+    args = parser.parse_args()
+
+    if args.calibrate:
+        table = calibrate(
+            progress=lambda key, best, seconds: print(f"{key:<40} {best}", flush=True)
+        )
+        Path(args.output).write_text(json.dumps(table, indent=2) + "\n")
+        print(f"\nSaved {len(table['cells'])} cells to {args.output}")
+    else:
+        logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+        rng = random.Random(0)
+        smart_sort([rng.randrange(1000) for _ in range(100_000)])
+        smart_sort(list(range(50_000)) + [3])
+        smart_sort([f"user-{rng.randrange(10**6)}" for _ in range(20_000)])
+        smart_sort([rng.random() for _ in range(30)])
+        smart_sort([(2, "b"), (1, "a")])
@@ -0,0 +1,270 @@
+"""
+Uniform Sort API in Python
+
+Every sort in this folder has its own signature: most return a sorted copy,
+a few only sort in place, and the non-comparison sorts only accept numbers.
+sort() puts one interface in front of all of them:
+
+    sort(records, algorithm="merge_sort", key=lambda r: r["score"], reverse=True)
+
+Keys are computed exactly once per element (decorate-sort-undecorate), so an
+expensive key function costs O(n) calls rather than one per comparison:
+- comparison sorts see (key, index) pairs, which also makes every one of
+  them stable, since no two pairs compare equal
+- value sorts (counting, radix, bucket, ...) sort the bare keys, and the
+  records are then handed back out in their original order per key
+
+With reverse=True, records with equal keys keep their original order, the
+same as list.sort(reverse=True).
+
+For columnar data kept as parallel lists, argsort() returns the permutation
+instead of the records (stable for every algorithm, by the same rules), and
+apply_permutation() reorders any number of columns in place from it, so rows
+never have to be zipped into tuples:
+
+    order = argsort(ages, "radix")
+    apply_permutation(order, ages, names, cities)
+
+Radix argsorts of plain numbers run on radix-sort.py's own stable argsort
+(vectorized when NumPy is installed). rank() gives dense ranks.
+"""
+
+from collections import defaultdict, deque
+
+from sort_support import load_sibling
+
+COMPARISON = "comparison"
+VALUE = "value"
+
+# name -> (module stem, kind). Value sorts do arithmetic on the elements, so
+# they can only be handed plain numeric keys.
+SORTS = {
+    "bubble_sort": ("bubble-sort", COMPARISON),
+    "selection_sort": ("selection-sort", COMPARISON),
+    "insertion_sort": ("insertion-sort", COMPARISON),
+    "merge_sort": ("merge-sort", COMPARISON),
+    "quick_sort": ("quick-sort", COMPARISON),
+    "quick_sort_engine": ("quick-sort", COMPARISON),
+    "heap_sort": ("heap-sort", COMPARISON),
+    "shell_sort": ("shell-sort", COMPARISON),
+    "tree_sort": ("tree-sort", COMPARISON),
+    "cycle_sort": ("cycle-sort", COMPARISON),
+    "cocktail_shaker_sort": ("cocktail-shaker-sort", COMPARISON),
+    "comb_sort": ("comb-sort", COMPARISON),
+    "gnome_sort": ("gnome-sort", COMPARISON),
+    "odd_even_sort": ("odd-even-sort", COMPARISON),
+    "bitonic_sort": ("bitonic-sort", COMPARISON),
+    "odd_even_merge_sort": ("odd-even-merge-sort", COMPARISON),
+    "spaghetti_sort": ("spaghetti-sort", COMPARISON),
+    "intro_sort": ("intro-sort", COMPARISON),
+    "tim_sort": ("tim-sort", COMPARISON),
+    "block_sort": ("block-sort", COMPARISON),
+    "sample_sort": ("sample-sort", COMPARISON),
+    "counting_sort": ("counting-sort", VALUE),
+    "radix_sort": ("radix-sort", VALUE),
+    "bucket_sort": ("bucket-sort", VALUE),
+    "pigeonhole_sort": ("pigeonhole-sort", VALUE),
+    "flash_sort": ("flash-sort", VALUE),
+    "bead_sort": ("bead-sort", VALUE),
+}
+
+DEFAULT_ALGORITHM = "tim_sort"
+
+
+def resolve(algorithm):
+    """Accept "merge_sort", "merge-sort" or "merge" and return the full name."""
+    name = algorithm.replace("-", "_")
+    if name not in SORTS and f"{name}_sort" in SORTS:
+        name = f"{name}_sort"
+    if name not in SORTS:
+        raise ValueError(
+            f"Unknown algorithm {algorithm!r}; choose from {', '.join(SORTS)}"
+        )
+    return name
+
+
+def get_sort(algorithm):
+    """Return the underlying sort function for an algorithm name."""
+    name = resolve(algorithm)
+    stem, _ = SORTS[name]
+    return getattr(load_sibling(stem), name)
+
+
+def _order_comparison(func, keys, reverse):
+    # The index breaks ties, so records themselves are never compared and
+    # equal keys keep their input order. Negating it for reverse=True keeps
+    # that order once the ascending result is flipped.
+    sign = -1 if reverse else 1
+    decorated = func([(k, sign * i) for i, k in enumerate(keys)])
+    order = [sign * i for _, i in decorated]
+    if reverse:
+        order.reverse()
+    return order
+
+
+def _order_value(func, keys, reverse):
+    sorted_keys = func(list(keys))
+    if reverse:
+        sorted_keys = sorted_keys[::-1]
+    # Hand indices back out per key in their original order (stable)
+    pending = defaultdict(deque)
+    for i, k in enumerate(keys):
+        pending[k].append(i)
+    return [pending[k].popleft() for k in sorted_keys]
+
+
+def _order_radix(keys, reverse):
+    """radix-sort.py's stable argsort, or None if the keys aren't numbers."""
+    if not all(type(k) in (int, float) for k in keys):
+        return None
+    radix = load_sibling("radix-sort")
+    # Argsorting the reversed keys and flipping the result gives a
+    # descending order in which equal keys still keep their input order
+    if reverse:
+        keys = keys[::-1]
+    order = radix.argsort_numbers(keys)
+    if reverse:
+        last = len(keys) - 1
+        order = [last - i for i in reversed(order)]
+    return order
+
+
+def _order(name, keys, reverse):
+    if not keys:
+        return []
+    if name == "radix_sort":
+        order = _order_radix(keys, reverse)
+        if order is not None:
+            return order
+    func = get_sort(name)
+    if SORTS[name][1] == COMPARISON:
+        return _order_comparison(func, keys, reverse)
+    return _order_value(func, keys, reverse)
+
+
+def argsort(arr, algorithm=DEFAULT_ALGORITHM, key=None, reverse=False):
+    """
+    Stable argsort with any algorithm in this folder.
+
+    Args:
+        arr: List (or any sequence) to sort
+        algorithm: Sort name, e.g. "merge_sort", "counting", "radix"
+        key: Function of one argument used to extract a comparison key;
+            called exactly once per element
+        reverse: Sort in descending order (equal keys keep input order)
+
+    Returns:
+        List: Indices such that [arr[i] for i in result] is sorted
+    """
+    values = list(arr)
+    keys = values if key is None else [key(v) for v in values]
+    return _order(resolve(algorithm), keys, reverse)
+
+
+def rank(arr, algorithm=DEFAULT_ALGORITHM, key=None, reverse=False):
+    """
+    Dense ranks: equal keys share a rank and ranks have no gaps.
+
+    Returns:
+        List: result[i] is the number of distinct keys that sort before
+        arr[i]'s key (0 for the smallest)
+    """
+    values = list(arr)
+    keys = values if key is None else [key(v) for v in values]
+    ranks = [0] * len(keys)
+    current = -1
+    previous = None
+    for position, i in enumerate(_order(resolve(algorithm), keys, reverse)):
+        if position == 0 or keys[i] != previous:
+            current += 1
+            previous = keys[i]
+        ranks[i] = current
+    return ranks
+
+
+def apply_permutation(order, *columns):
+    """
+    Reorder each column in place so that column[i] becomes the old
+    column[order[i]], e.g. with order from argsort().
+
+    Follows the cycles of the permutation, holding one element per column
+    at a time, so no row tuples or column copies are built. Works on
+    lists, array.array, NumPy arrays or any mutable sequence.
+    """
+    n = len(order)
+    for column in columns:
+        if len(column) != n:
+            raise ValueError("every column must be as long as the permutation")
+    done = bytearray(n)
+    for start in range(n):
+        if done[start] or order[start] == start:
+            continue
+        held = [column[start] for column in columns]
+        slot = start
+        while True:
+            done[slot] = 1
+            source = order[slot]
+            if source == start:
+                for column, value in zip(columns, held):
+                    column[slot] = value
+                break
+            for column in columns:
+                column[slot] = column[source]
+            slot = source
+
+
+def sort(arr, algorithm=DEFAULT_ALGORITHM, key=None, reverse=False, inplace=False):
+    """
+    Sort with any algorithm in this folder.
+
+    Args:
+        arr: List (or any sequence) to sort
+        algorithm: Sort name, e.g. "tim_sort", "radix", "quick-sort"
+        key: Function of one argument used to extract a comparison key;
+            called exactly once per element
+        reverse: Sort in descending order (stable, like list.sort)
+        inplace: Write the result back into arr and return None
+
+    Returns:
+        List: Sorted list, or None when inplace=True
+    """
+    name = resolve(algorithm)
+    values = list(arr)
+
+    if key is None and not reverse:
+        result = get_sort(name)(list(values))
+    else:
+        keys = values if key is None else [key(v) for v in values]
+        result = [values[i] for i in _order(name, keys, reverse)]
+
+    if inplace:
+        arr[:] = result
+        return None
+    return result
+
+
+if __name__ == "__main__":
+    records = [
+        {"name": "ada", "score": 91},
+        {"name": "bob", "score": 78},
+        {"name": "cy", "score": 91},
+        {"name": "dee", "score": 65},
+    ]
+
+    by_score = sort(records, "merge_sort", key=lambda r: r["score"], reverse=True)
+    print("Merge Sort (key, reverse):", [r["name"] for r in by_score])
+
+    by_score = sort(records, "counting", key=lambda r: r["score"])
+    print("Counting Sort (key):", [r["name"] for r in by_score])
+
+    words = ["pear", "fig", "banana", "kiwi"]
+    sort(words, "quick_sort", key=len, inplace=True)
+    print("Quick Sort (in place, key=len):", words)
+
+    ages = [34, 27, 34, 19]
+    names = ["ada", "bob", "cy", "dee"]
+    cities = ["Oslo", "Lima", "Pune", "Kyiv"]
+    order = argsort(ages, "radix")
+    print("Radix argsort:", order, "dense ranks:", rank(ages, "radix"))
+    apply_permutation(order, ages, names, cities)
+    print("Columns reordered in place:", ages, names, cities)
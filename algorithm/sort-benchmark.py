@@ -0,0 +1,421 @@
+"""
+Sort Benchmark Suite in Python
+
+Runs every sort in this folder (plus the built-in ``sorted()`` as a reference)
+over a set of generated input distributions and reports wall time,
+comparisons and element writes per element and peak auxiliary memory for
+each input size.
+
+Results can be saved to JSON and compared against a previous run to flag
+regressions:
+
+    python sort-benchmark.py --output baseline.json
+    python sort-benchmark.py --baseline baseline.json --output latest.json
+
+Quadratic sorts are capped at a smaller input size so the whole suite still
+finishes when the largest size is 10^6 elements.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from sort_support import ALGORITHM_DIR, load_sibling
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+QUADRATIC_CAP = 2_000
+SUBQUADRATIC_CAP = 100_000
+COMPARISON_LIMIT = 100_000
+
+# Largest input each sort is run on, keyed by its worst realistic behavior
+# on the distributions below. Anything not listed is O(n log n) or better.
+SIZE_CAPS = {
+    "bubble_sort": QUADRATIC_CAP,
+    "selection_sort": QUADRATIC_CAP,
+    "insertion_sort": QUADRATIC_CAP,
+    "cocktail_shaker_sort": QUADRATIC_CAP,
+    "gnome_sort": QUADRATIC_CAP,
+    "odd_even_sort": QUADRATIC_CAP,
+    "cycle_sort": QUADRATIC_CAP,
+    "spaghetti_sort": QUADRATIC_CAP,
+    "bead_sort": QUADRATIC_CAP,
+    "shell_sort": SUBQUADRATIC_CAP,
+    "comb_sort": SUBQUADRATIC_CAP,
+    "bitonic_sort": SUBQUADRATIC_CAP,
+    "odd_even_merge_sort": SUBQUADRATIC_CAP,
+}
+
+# Sorts whose memory or running time grows with the value range rather than
+# the input size; they are skipped on the large-range distribution. (Counting
+# and pigeonhole sort switch to a sparse mode there instead.)
+RANGE_LIMITED = {"bead_sort"}
+
+# Entry points that live alongside a module's main sort
+EXTRA_SORTS = {
+    "quick_sort_engine": "quick-sort",
+}
+
+EXCLUDED = {
+    "sleep_sort": "timing-based; runtime grows with the largest value",
+    "external_sort": "streams through temp files; see external-sort.py --benchmark",
+}
+
+
+def discover_sorts():
+    """Return ``{name: function}`` for every ``*-sort.py`` entry point."""
+    sorts = {}
+    for path in sorted(ALGORITHM_DIR.glob("*-sort.py")):
+        name = path.stem.replace("-", "_")
+        if name in EXCLUDED:
+            continue
+        func = getattr(load_sibling(path.stem), name, None)
+        if callable(func):
+            sorts[name] = func
+    for name, stem in EXTRA_SORTS.items():
+        sorts[name] = getattr(load_sibling(stem), name)
+    sorts["builtin_sorted"] = sorted
+    return sorts
+
+
+# --- Input distributions ---------------------------------------------------
+
+
+def gen_random(n, rng):
+    return [rng.randrange(n) for _ in range(n)]
+
+
+def gen_sorted(n, rng):
+    return list(range(n))
+
+
+def gen_reversed(n, rng):
+    return list(range(n, 0, -1))
+
+
+def gen_few_unique(n, rng):
+    return [rng.randrange(16) for _ in range(n)]
+
+
+def gen_organ_pipe(n, rng):
+    return [min(i, n - 1 - i) for i in range(n)]
+
+
+def gen_nearly_sorted(n, rng):
+    data = list(range(n))
+    for _ in range(max(1, n // 100)):
+        i = rng.randrange(n)
+        j = rng.randrange(n)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+def gen_large_range(n, rng):
+    return [rng.randrange(2**62) for _ in range(n)]
+
+
+DISTRIBUTIONS = {
+    "random": gen_random,
+    "sorted": gen_sorted,
+    "reversed": gen_reversed,
+    "few_unique": gen_few_unique,
+    "organ_pipe": gen_organ_pipe,
+    "nearly_sorted": gen_nearly_sorted,
+    "large_range": gen_large_range,
+}
+
+
+# --- Measurements ----------------------------------------------------------
+
+
+class CountingKey:
+    """
+    Wraps a value and counts every comparison made against it. Comparing it
+    with anything but another CountingKey raises TypeError, as comparing
+    unrelated types does.
+    """
+
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def _other(self, other):
+        if not isinstance(other, CountingKey):
+            raise TypeError(f"cannot compare CountingKey with {type(other).__name__}")
+        CountingKey.comparisons += 1
+        return other.value
+
+    def __lt__(self, other):
+        return self.value < self._other(other)
+
+    def __le__(self, other):
+        return self.value <= self._other(other)
+
+    def __gt__(self, other):
+        return self.value > self._other(other)
+
+    def __ge__(self, other):
+        return self.value >= self._other(other)
+
+    def __eq__(self, other):
+        return self.value == self._other(other)
+
+    def __ne__(self, other):
+        return self.value != self._other(other)
+
+    __hash__ = None
+
+
+def time_sort(func, data, repeat):
+    """Best wall time over ``repeat`` runs, plus the last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        work = list(data)
+        start = time.perf_counter()
+        result = func(work)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def count_comparisons(func, data):
+    """Comparisons per element, or None for non-comparison sorts."""
+    wrapped = [CountingKey(x) for x in data]
+    CountingKey.comparisons = 0
+    try:
+        func(wrapped)
+    except TypeError:
+        # Arithmetic on the keys (counting, radix, bucket, ...), or comparing
+        # them with bare numbers, fails on the wrapper, which is exactly the
+        # set of sorts that do not compare.
+        return None
+    return CountingKey.comparisons / max(1, len(data))
+
+
+def count_writes(func, data):
+    """
+    Element writes per element into the input (see sort-probe.py), or None
+    for sorts that build their result in new lists.
+    """
+    probe = load_sibling("sort-probe").Probe(
+        comparisons=False, depth=False, memory=False
+    )
+    probe.run(func, data)
+    writes = probe.report()["writes"]
+    return None if writes is None else writes / max(1, len(data))
+
+
+def peak_memory(func, data):
+    """Peak bytes allocated by the sort itself, excluding the input."""
+    work = list(data)
+    tracemalloc.start()
+    try:
+        func(work)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def skip_reason(name, distribution, n, quadratic_cap):
+    cap = SIZE_CAPS.get(name)
+    if cap == QUADRATIC_CAP:
+        cap = quadratic_cap
+    if cap is not None and n > cap:
+        return "capped"
+    if distribution == "large_range" and name in RANGE_LIMITED:
+        return "unsupported"
+    return None
+
+
+def run_suite(
+    sorts,
+    sizes=DEFAULT_SIZES,
+    distributions=DISTRIBUTIONS,
+    repeat=1,
+    quadratic_cap=QUADRATIC_CAP,
+    comparison_limit=COMPARISON_LIMIT,
+    measure_memory=True,
+    seed=0,
+    progress=None,
+):
+    """
+    Run every sort over every distribution and size.
+
+    Returns:
+        List of result dicts, one per (algorithm, distribution, n).
+    """
+    results = []
+    for n in sizes:
+        for dist_name in distributions:
+            data = DISTRIBUTIONS[dist_name](n, random.Random(seed))
+            expected = sorted(data)
+            for name, func in sorts.items():
+                row = {
+                    "algorithm": name,
+                    "distribution": dist_name,
+                    "n": n,
+                    "seconds": None,
+                    "comparisons_per_element": None,
+                    "writes_per_element": None,
+                    "peak_bytes": None,
+                    "status": "ok",
+                }
+                reason = skip_reason(name, dist_name, n, quadratic_cap)
+                if reason:
+                    row["status"] = reason
+                    results.append(row)
+                    continue
+                try:
+                    seconds, result = time_sort(func, data, repeat)
+                    row["seconds"] = seconds
+                    if result != expected:
+                        row["status"] = "incorrect"
+                    if n <= comparison_limit:
+                        row["comparisons_per_element"] = count_comparisons(
+                            func, data
+                        )
+                        row["writes_per_element"] = count_writes(func, data)
+                    if measure_memory:
+                        row["peak_bytes"] = peak_memory(func, data)
+                except (RecursionError, MemoryError, ValueError, IndexError) as exc:
+                    row["status"] = f"error: {type(exc).__name__}"
+                results.append(row)
+                if progress:
+                    progress(row)
+    return results
+
+
+def find_regressions(results, baseline, tolerance=0.25, min_seconds=1e-3):
+    """
+    Compare a run against a baseline run.
+
+    A row regresses if it used to be correct and now is not, or if it got
+    slower by more than ``tolerance`` (ignoring timings below ``min_seconds``,
+    which are mostly noise).
+    """
+    previous = {
+        (r["algorithm"], r["distribution"], r["n"]): r for r in baseline["results"]
+    }
+    regressions = []
+    for row in results:
+        old = previous.get((row["algorithm"], row["distribution"], row["n"]))
+        if old is None or old["status"] != "ok":
+            continue
+        if row["status"] not in ("ok", "capped", "unsupported"):
+            regressions.append((row, f"status {old['status']} -> {row['status']}"))
+        elif row["seconds"] is not None and old["seconds"] is not None:
+            if old["seconds"] >= min_seconds and row["seconds"] > old["seconds"] * (
+                1 + tolerance
+            ):
+                ratio = row["seconds"] / old["seconds"]
+                regressions.append((row, f"{ratio:.2f}x slower"))
+    return regressions
+
+
+def format_row(row):
+    seconds = "-" if row["seconds"] is None else f"{row['seconds']:.4f}s"
+    cmp = row["comparisons_per_element"]
+    cmp = "-" if cmp is None else f"{cmp:.1f}"
+    writes = row.get("writes_per_element")
+    writes = "-" if writes is None else f"{writes:.1f}"
+    peak = row["peak_bytes"]
+    peak = "-" if peak is None else f"{peak / 1024:.0f}KiB"
+    return (
+        f"{row['algorithm']:<24} {row['distribution']:<14} {row['n']:>9} "
+        f"{seconds:>11} {cmp:>9} {writes:>9} {peak:>12}  {row['status']}"
+    )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Benchmark every sort in algorithm/ against sorted()."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda s: [int(x) for x in s.split(",")],
+        default=DEFAULT_SIZES,
+        help="Comma-separated input sizes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--distributions",
+        type=lambda s: s.split(","),
+        default=list(DISTRIBUTIONS),
+        help="Comma-separated subset of: " + ", ".join(DISTRIBUTIONS),
+    )
+    parser.add_argument(
+        "--only",
+        type=lambda s: s.split(","),
+        default=None,
+        help="Comma-separated sort names to run, e.g. tim_sort,merge_sort",
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--quadratic-cap", type=int, default=QUADRATIC_CAP)
+    parser.add_argument("--comparison-limit", type=int, default=COMPARISON_LIMIT)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Flag regressions against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    return parser
+
+
+def main(argv):
+    args = build_parser().parse_args(argv)
+
+    unknown = set(args.distributions) - set(DISTRIBUTIONS)
+    if unknown:
+        raise SystemExit(f"Unknown distribution(s): {', '.join(sorted(unknown))}")
+
+    sorts = discover_sorts()
+    if args.only:
+        sorts = {name: sorts[name] for name in args.only if name in sorts}
+
+    print(
+        f"{'algorithm':<24} {'distribution':<14} {'n':>9} "
+        f"{'time':>11} {'cmp/elem':>9} {'wr/elem':>9} {'peak mem':>12}  status"
+    )
+    results = run_suite(
+        sorts,
+        sizes=args.sizes,
+        distributions=args.distributions,
+        repeat=args.repeat,
+        quadratic_cap=args.quadratic_cap,
+        comparison_limit=args.comparison_limit,
+        measure_memory=not args.no_memory,
+        seed=args.seed,
+        progress=lambda row: print(format_row(row), flush=True),
+    )
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\nSaved {len(results)} results to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = find_regressions(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for row, reason in regressions:
+                print(f"  {format_row(row)}  <- {reason}")
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
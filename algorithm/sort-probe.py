@@ -0,0 +1,328 @@
+"""
+Sort Probe - instrumentation for any sort in this folder
+
+A Probe measures one run of a sort without the sort knowing about it, so the
+sorts themselves carry no hooks and cost nothing when nothing is probed:
+- element reads, writes and swaps: the input is handed over as a ProbedList,
+  a list subclass that counts every index access (and .copy() / slices stay
+  probed, so sorts that work on a copy are still observed)
+- comparisons: every element is wrapped in a ProbedKey that counts each
+  comparison made against it (value sorts, which do arithmetic on the
+  elements, reject the wrapper and report comparisons as None)
+- recursion depth: a sys.setprofile hook tracks how deeply calls to
+  functions from this folder nest
+- auxiliary allocations: the tracemalloc peak during the sort
+- a sampled trace: every trace_every-th event written to a file as JSON lines
+
+Writes are counted on the probed list only. Sorts that build their result in
+fresh lists (merge sort, counting sort, ...) report writes as None, since
+their writes never touch the input; in-place sorts report exactly what they
+would write to storage, which is what matters for flash-backed data (and
+cycle sort's selling point).
+
+Usage:
+
+    probe = Probe(trace="events.jsonl", trace_every=100)
+    result = probe.run(get_sort("cycle_sort"), data)
+    probe.report()  # {"comparisons": ..., "writes": ..., "swaps": ...}
+"""
+
+import argparse
+import json
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+from sort_support import ALGORITHM_DIR, load_sibling
+
+PROBE_FILE = str(Path(__file__).resolve())
+
+
+class ProbedKey:
+    """
+    Wraps an element and reports every comparison made against it.
+    Comparing it with anything but another ProbedKey raises TypeError, as
+    comparing unrelated types does.
+    """
+
+    __slots__ = ("value", "probe")
+
+    def __init__(self, value, probe):
+        self.value = value
+        self.probe = probe
+
+    def _other(self, other, op):
+        if not isinstance(other, ProbedKey):
+            raise TypeError(f"cannot compare ProbedKey with {type(other).__name__}")
+        self.probe.event("compare", op)
+        return other.value
+
+    def __lt__(self, other):
+        return self.value < self._other(other, "<")
+
+    def __le__(self, other):
+        return self.value <= self._other(other, "<=")
+
+    def __gt__(self, other):
+        return self.value > self._other(other, ">")
+
+    def __ge__(self, other):
+        return self.value >= self._other(other, ">=")
+
+    def __eq__(self, other):
+        return self.value == self._other(other, "==")
+
+    def __ne__(self, other):
+        return self.value != self._other(other, "!=")
+
+    __hash__ = None
+
+
+class ProbedList(list):
+    """
+    A list that reports element reads and writes to its probe. A write of
+    arr[i] followed by one of arr[j], with each value just read from the
+    other index (arr[i], arr[j] = arr[j], arr[i]), also counts as a swap.
+    """
+
+    def __init__(self, iterable=(), probe=None):
+        super().__init__(iterable)
+        self.probe = probe
+        self._reads = [(None, None), (None, None)]
+        self._last_write = None
+
+    def __getitem__(self, index):
+        value = super().__getitem__(index)
+        if isinstance(index, slice):
+            self.probe.event("read", index, len(value))
+            return ProbedList(value, self.probe)
+        index %= len(self)
+        self.probe.event("read", index)
+        self._reads = [self._reads[1], (index, value)]
+        return value
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        if isinstance(index, slice):
+            self.probe.event("write", index, len(range(*index.indices(len(self)))))
+            self._last_write = None
+            return
+        index %= len(self)
+        self.probe.event("write", index)
+        # Which index (if any) the value was just read from
+        source = None
+        for read_index, read_value in self._reads:
+            if read_value is value:
+                source = read_index
+        if source is not None and self._last_write == (source, index):
+            self.probe.event("swap", index)
+            self._last_write = None
+        elif source is not None:
+            self._last_write = (index, source)
+        else:
+            self._last_write = None
+
+    def copy(self):
+        return ProbedList(self, self.probe)
+
+
+class Probe:
+    """
+    Counters for one or more sort runs.
+
+    Args:
+        comparisons: Wrap elements to count comparisons
+        accesses: Count reads, writes and swaps through a ProbedList
+        depth: Track recursion depth (slows the sort down considerably)
+        memory: Record peak auxiliary bytes with tracemalloc
+        trace: Path or open text file for a sampled JSON-lines event trace
+        trace_every: Write one event out of every trace_every
+    """
+
+    def __init__(
+        self,
+        comparisons=True,
+        accesses=True,
+        depth=True,
+        memory=True,
+        trace=None,
+        trace_every=1000,
+    ):
+        self.options = {
+            "comparisons": comparisons,
+            "accesses": accesses,
+            "depth": depth,
+            "memory": memory,
+        }
+        self.trace = trace
+        self.trace_every = max(1, trace_every)
+        self._trace_file = None
+        self.reset()
+
+    def reset(self):
+        self.counts = {"compare": 0, "read": 0, "write": 0, "swap": 0}
+        self.events = 0
+        self.max_depth = 0
+        self.peak_aux_bytes = None
+        self.observed_writes = False
+        self.compared = False
+
+    def event(self, op, detail=None, count=1):
+        """Count an event; detail is the index (or slice, or comparison)."""
+        self.counts[op] += count
+        self.events += 1
+        if self._trace_file is not None and self.events % self.trace_every == 0:
+            if isinstance(detail, slice):
+                detail = [detail.start, detail.stop, detail.step]
+            record = {"event": self.events, "op": op, "detail": detail, "count": count}
+            self._trace_file.write(json.dumps(record) + "\n")
+
+    def run(self, func, data):
+        """
+        Run func on a probed copy of data.
+
+        Returns:
+            The sort's result, unwrapped back to plain values
+        """
+        self.reset()
+        items = list(data)
+        if self.options["comparisons"]:
+            try:
+                return self._run(func, [ProbedKey(x, self) for x in items], True)
+            except TypeError:
+                # Value sorts do arithmetic on the elements, or compare them
+                # with bare numbers; run them bare
+                self.reset()
+        return self._run(func, items, False)
+
+    def _run(self, func, items, wrapped):
+        work = ProbedList(items, self) if self.options["accesses"] else items
+        close = False
+        if self.trace is not None:
+            if hasattr(self.trace, "write"):
+                self._trace_file = self.trace
+            else:
+                self._trace_file = open(self.trace, "w")
+                close = True
+        depth_hook = self._depth_hook() if self.options["depth"] else None
+        # Leave cProfile, coverage or a tracemalloc session of the caller's
+        # running: restore the previous profiler, and stop tracemalloc only
+        # if it was started here
+        started_tracing = self.options["memory"] and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif self.options["memory"]:
+            tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0] if self.options["memory"] else 0
+        previous_profile = sys.getprofile()
+        try:
+            if depth_hook:
+                sys.setprofile(depth_hook)
+            try:
+                result = func(work)
+            finally:
+                sys.setprofile(previous_profile)
+            if self.options["memory"]:
+                self.peak_aux_bytes = tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+            if close:
+                self._trace_file.close()
+            self._trace_file = None
+
+        if result is None:
+            result = work
+        self.compared = wrapped
+        self.observed_writes = isinstance(result, ProbedList)
+        if wrapped:
+            return [x.value for x in result]
+        return list(result)
+
+    def _depth_hook(self):
+        depth = 0
+
+        def hook(frame, event, arg):
+            nonlocal depth
+            if event not in ("call", "return"):
+                return
+            filename = frame.f_code.co_filename
+            if filename == PROBE_FILE or not filename.startswith(str(ALGORITHM_DIR)):
+                return
+            if event == "call":
+                depth += 1
+                self.max_depth = max(self.max_depth, depth)
+            else:
+                depth -= 1
+
+        return hook
+
+    def report(self):
+        """Counters from the last run; None where they weren't measured."""
+        accesses = self.options["accesses"]
+        return {
+            "comparisons": self.counts["compare"] if self.compared else None,
+            "reads": self.counts["read"] if accesses else None,
+            "writes": self.counts["write"] if self.observed_writes else None,
+            "swaps": self.counts["swap"] if self.observed_writes else None,
+            "max_depth": self.max_depth if self.options["depth"] else None,
+            "peak_aux_bytes": self.peak_aux_bytes,
+        }
+
+
+def probe_sort(algorithm, data, **options):
+    """
+    Probe one sort by name (see sort-api.py's names).
+
+    Returns:
+        (sorted list, report dict)
+    """
+    func = load_sibling("sort-api").get_sort(algorithm)
+    probe = Probe(**options)
+    result = probe.run(func, data)
+    return result, probe.report()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Probe sorts in this folder")
+    parser.add_argument("--n", type=int, default=500)
+    parser.add_argument("--trace", help="Write a sampled event trace here")
+    parser.add_argument("--trace-every", type=int, default=100)
+    parser.add_argument(
+        "--only",
+        type=lambda s: s.split(","),
+        default=[
+            "cycle_sort",
+            "selection_sort",
+            "insertion_sort",
+            "heap_sort",
+            "tim_sort",
+            "merge_sort",
+            "quick_sort_engine",
+            "counting_sort",
+        ],
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    data = [rng.randrange(args.n) for _ in range(args.n)]
+    print(
+        f"{'algorithm':<20} {'compares':>9} {'reads':>8} {'writes':>8}"
+        f" {'swaps':>7} {'depth':>6} {'aux KiB':>8}"
+    )
+    for name in args.only:
+        options = {}
+        if args.trace:
+            options = {"trace": f"{args.trace}.{name}", "trace_every": args.trace_every}
+        result, stats = probe_sort(name, data, **options)
+        assert result == sorted(data)
+        cells = [
+            "-" if stats[k] is None else stats[k]
+            for k in ("comparisons", "reads", "writes", "swaps", "max_depth")
+        ]
+        aux = stats["peak_aux_bytes"] / 1024
+        print(
+            f"{name:<20} {cells[0]:>9} {cells[1]:>8} {cells[2]:>8}"
+            f" {cells[3]:>7} {cells[4]:>6} {aux:>8.1f}"
+        )
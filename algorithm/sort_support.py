@@ -0,0 +1,59 @@
+"""
+Shared helpers for the Python sorts in this folder
+
+Not a sort itself. The sort files have hyphenated names (merge-sort.py), so
+those that build on each other can't use a plain import statement; they
+load their siblings with load_sibling() instead. NumPy is optional for every
+sort: modules take np from here and fall back to pure Python when it is None.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+ALGORITHM_DIR = Path(__file__).resolve().parent
+
+
+def load_sibling(stem):
+    """Import a hyphen-named module from this folder, e.g. ``merge-sort``."""
+    name = stem.replace("-", "_")
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, ALGORITHM_DIR / f"{stem}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def call_sibling(stem, name, *args):
+    """
+    Call function name of sibling stem with args.
+
+    Worker processes are handed this function instead of a sibling's own:
+    load_sibling registers modules under names like ``merge_sort`` that a
+    spawned (or forkserver) worker can't import, so their functions can't
+    be unpickled there. This module can, since workers inherit sys.path.
+    """
+    return getattr(load_sibling(stem), name)(*args)
+
+
+def scatter_by_bucket(values, ids):
+    """
+    Group an ndarray by small integer bucket ids, keeping the input order
+    within each bucket. NumPy's stable argsort of small integers is a radix
+    (counting) sort, so this is a counting scatter, not an O(n log n) sort.
+    """
+    return values[np.argsort(ids, kind="stable")]
+
+
+if __name__ == "__main__":
+    merge_sort = load_sibling("merge-sort")
+    print("merge-sort.py loaded as", merge_sort.__name__)
+    print("Merge Sort:", merge_sort.merge_sort([38, 27, 43, 3, 9, 82, 10]))
+    print("NumPy available:", np is not None)
@@ -0,0 +1,14 @@
+"""Shared fixtures for the algorithm tests."""
+
+import multiprocessing
+
+import pytest
+
+
+@pytest.fixture
+def spawn():
+    """Start worker processes with spawn, the default on macOS and Windows."""
+    method = multiprocessing.get_start_method(allow_none=True)
+    multiprocessing.set_start_method("spawn", force=True)
+    yield
+    multiprocessing.set_start_method(method, force=True)
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from sort_support import load_sibling, np
+
+bead_sort = load_sibling("bead-sort")
+needs_numpy = pytest.mark.skipif(np is None, reason="needs NumPy")
+
+
+def small_int_lists(seed, count=60):
+    """Non-negative ints with zeros, duplicates and a few larger values."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        top = rng.choice([1, 3, 50, 1_000])
+        yield [rng.randrange(top + 1) for _ in range(rng.randrange(0, 200))]
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure"])
+def use_numpy(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(bead_sort, "np", None)
+    elif np is None:
+        pytest.skip("needs NumPy")
+
+
+@pytest.mark.usefixtures("use_numpy")
+@pytest.mark.parametrize("tile_cells", [7, 500, bead_sort.TILE_CELLS])
+def test_bead_sort_matches_sorted(tile_cells):
+    for data in small_int_lists(0):
+        result = bead_sort.bead_sort(list(data), tile_cells)
+        assert result == sorted(data)
+        assert all(type(x) is int for x in result)
+
+
+@pytest.mark.usefixtures("use_numpy")
+def test_bead_sort_refuses_what_it_cannot_sort():
+    with pytest.raises(ValueError):
+        bead_sort.bead_sort([3, -1, 2])
+    with pytest.raises(TypeError):
+        bead_sort.bead_sort([1.5, 0.0])
+    for huge in (2**62, 2**63 - 1, 2**64):
+        with pytest.raises(ValueError):
+            bead_sort.bead_sort([1, huge, 0])
+
+
+@needs_numpy
+@pytest.mark.parametrize("dtype", ["uint8", "int16", "int64", "uint64"])
+def test_bead_sort_array_matches_np_sort(dtype):
+    rng = np.random.default_rng(1)
+    for tile_cells in (50, 10_000, bead_sort.TILE_CELLS):
+        values = rng.integers(0, 120, size=3_000).astype(dtype)
+        values[::9] = 0
+        result = bead_sort.bead_sort_array(values, tile_cells)
+        assert result.dtype == values.dtype
+        assert np.array_equal(result, np.sort(values))
+
+
+@needs_numpy
+def test_bead_sort_array_budget_and_types():
+    with pytest.raises(ValueError):
+        bead_sort.bead_sort_array(np.array([0, 2**63 - 1], dtype=np.int64))
+    with pytest.raises(ValueError):
+        bead_sort.bead_sort_array(np.array([2, -(2**63)], dtype=np.int64))
+    with pytest.raises(TypeError):
+        bead_sort.bead_sort_array(np.array([0.0, -0.0]))
+    empty = bead_sort.bead_sort_array(np.array([], dtype=np.uint64))
+    assert empty.dtype == np.uint64 and empty.size == 0
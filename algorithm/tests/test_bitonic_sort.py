@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from sort_support import load_sibling, np
+
+bitonic_sort = load_sibling("bitonic-sort")
+needs_numpy = pytest.mark.skipif(np is None, reason="needs NumPy")
+
+
+def number_lists(seed, count=100):
+    """Lists with duplicates, ±0.0 and int64 extremes, of any length."""
+    rng = random.Random(seed)
+    pools = [
+        lambda: rng.randrange(-3, 3),
+        lambda: rng.choice([0.0, -0.0, 1.5, float("inf")]),
+        lambda: rng.choice([2**53, 2**53 + 1, -(2**63), 2**63 - 1]),
+        lambda: rng.randrange(-(2**63), 2**63),
+    ]
+    for _ in range(count):
+        kinds = rng.sample(pools, rng.randint(1, len(pools)))
+        yield [rng.choice(kinds)() for _ in range(rng.randrange(0, 70))]
+
+
+@pytest.mark.parametrize("up", [True, False])
+def test_bitonic_sort_matches_sorted(up):
+    for data in number_lists(0):
+        assert bitonic_sort.bitonic_sort(list(data), up) == sorted(data, reverse=not up)
+
+
+@needs_numpy
+@pytest.mark.parametrize("dtype", ["int8", "int64", "uint64", "float32", "float64"])
+@pytest.mark.parametrize("shape", [(0,), (1,), (13,), (64,), (9, 33), (3, 2, 16)])
+def test_bitonic_sort_array_matches_np_sort(dtype, shape):
+    rng = np.random.default_rng(1)
+    if np.dtype(dtype).kind in "iu":
+        info = np.iinfo(dtype)
+        values = rng.integers(info.min, info.max, size=shape, dtype=dtype)
+        values.flat[::3] = info.max
+        values.flat[1::5] = info.min
+    else:
+        pool = [0.0, -0.0, 1.0, -2.5, np.inf, -np.inf, 2.0**53]
+        values = rng.choice(pool, size=shape).astype(dtype)
+    result = bitonic_sort.bitonic_sort_array(values.copy())
+    expected = np.sort(values, axis=-1)
+    assert np.array_equal(result, expected)
+    # Same zeros as the input, row by row: -0.0 is not turned into 0.0
+    assert np.array_equal(
+        np.signbit(result).sum(axis=-1), np.signbit(values).sum(axis=-1)
+    )
+
+
+@needs_numpy
+def test_bitonic_sort_array_rejects_nan():
+    with pytest.raises(ValueError):
+        bitonic_sort.bitonic_sort_array(np.array([1.0, np.nan, 0.0]))
@@ -0,0 +1,49 @@
+import random
+from array import array
+
+import pytest
+
+from sort_support import load_sibling
+
+block_sort = load_sibling("block-sort")
+
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+
+
+def number_lists(seed, count=60):
+    """Lists with duplicates, ±0.0, int/float ties and int64 extremes."""
+    rng = random.Random(seed)
+    pools = [
+        lambda: rng.randrange(-3, 3),
+        lambda: rng.choice([0.0, -0.0, 0, 1, 1.0]),
+        lambda: rng.choice([2**53, 2**53 + 1, INT64_MIN, INT64_MAX]),
+        lambda: rng.randrange(INT64_MIN, 2**63),
+    ]
+    for _ in range(count):
+        kinds = rng.sample(pools, rng.randint(1, len(pools)))
+        data = [rng.choice(kinds)() for _ in range(rng.randrange(0, 600))]
+        if rng.random() < 0.2:
+            data.sort(reverse=rng.random() < 0.5)
+        yield data
+
+
+@pytest.mark.parametrize("cache_size", [0, 8, block_sort.CACHE_SIZE])
+def test_block_sort_matches_sorted(cache_size):
+    for data in number_lists(0):
+        # reprs: block sort is stable, so equal values keep their order
+        assert [repr(x) for x in block_sort.block_sort(data, cache_size)] == [
+            repr(x) for x in sorted(data)
+        ]
+
+
+@pytest.mark.parametrize("cache_size", [0, block_sort.CACHE_SIZE])
+def test_block_sort_in_place_on_buffers(cache_size):
+    rng = random.Random(1)
+    data = [rng.choice([INT64_MIN, INT64_MAX, 0, rng.randrange(9)]) for _ in range(999)]
+    values = array("q", data)
+    assert block_sort.block_sort_in_place(values, cache_size) is values
+    assert values.tolist() == sorted(data)
+
+    values = array("q", data)
+    block_sort.block_sort_in_place(memoryview(values), cache_size)
+    assert values.tolist() == sorted(data)
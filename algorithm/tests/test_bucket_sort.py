@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from sort_support import load_sibling, np
+
+bucket_sort = load_sibling("bucket-sort")
+needs_numpy = pytest.mark.skipif(np is None, reason="needs NumPy")
+
+
+def number_lists(seed, count=100):
+    """Lists with duplicates, ±0.0, int/float ties, int64 extremes and skew."""
+    rng = random.Random(seed)
+    pools = [
+        lambda: rng.randrange(-3, 3),
+        lambda: rng.choice([0.0, -0.0, 0, 1, 1.0, float("inf")]),
+        lambda: rng.choice([2**53, 2**53 + 1, -(2**63), 2**63 - 1, 2**64]),
+        lambda: rng.randrange(-(2**63), 2**63),
+        lambda: rng.expovariate(1.0) ** 8,
+    ]
+    for _ in range(count):
+        kinds = rng.sample(pools, rng.randint(1, len(pools)))
+        yield [rng.choice(kinds)() for _ in range(rng.randrange(0, 400))]
+
+
+@pytest.mark.parametrize("bucket_count", [None, 2, 7])
+def test_bucket_sort_matches_sorted(bucket_count):
+    for data in number_lists(0):
+        result = bucket_sort.bucket_sort(data, bucket_count)
+        # reprs: bucket sort is stable, so equal values keep their order
+        assert [repr(x) for x in result] == [repr(x) for x in sorted(data)]
+
+
+def test_bucket_sort_rebuckets_runs_of_one_value():
+    data = [5] * 500 + list(range(500)) + [2**63 - 1] * 100
+    stats = {}
+    assert bucket_sort.bucket_sort(data, stats=stats) == sorted(data)
+    assert stats["rebucketed"] > 0
+
+
+def bits(values):
+    if values.dtype.kind == "f":
+        return values.view(f"u{values.dtype.itemsize}")
+    return values
+
+
+@needs_numpy
+@pytest.mark.parametrize("dtype", ["int64", "uint64", "float32", "float64"])
+@pytest.mark.parametrize("bucket_count", [None, 4, 64])
+def test_bucket_sort_array_matches_stable_np_sort(dtype, bucket_count):
+    rng = np.random.default_rng(1)
+    n = 20_000
+    if np.dtype(dtype).kind in "iu":
+        info = np.iinfo(dtype)
+        values = rng.integers(info.min, info.max, size=n, dtype=dtype)
+        values[::7] = info.max
+        values[1::11] = info.min
+        values[2::13] = 2**53 + 1
+    else:
+        values = rng.lognormal(0, 4, size=n).astype(dtype)
+        values[::3] *= -1
+        picks = rng.integers(0, n, size=n // 4)
+        specials = [0.0, -0.0, np.inf, -np.inf, np.nan]
+        values[picks] = rng.choice(specials, size=picks.size)
+    result = bucket_sort.bucket_sort_array(values, bucket_count)
+    # Same bits as a stable sort: ±0.0 keep their order, NaNs go last
+    assert np.array_equal(bits(result), bits(np.sort(values, kind="stable")))
+
+
+@needs_numpy
+def test_bucket_sort_array_small_and_empty():
+    for data in ([], [1.0], [np.nan, -0.0, 0.0], [0.0, -0.0]):
+        values = np.array(data, dtype=np.float64)
+        result = bucket_sort.bucket_sort_array(values)
+        assert np.array_equal(bits(result), bits(np.sort(values, kind="stable")))
@@ -0,0 +1,59 @@
+import random
+import struct
+from array import array
+
+import pytest
+
+from sort_support import load_sibling
+
+buffer_sort = load_sibling("buffer-sort")
+
+TIMESTAMPS = [1760000000000000100, 1760000000000000000, 1760000000000000050]
+
+
+@pytest.mark.parametrize("algorithm", ["flash", "block"])
+@pytest.mark.parametrize(
+    "typecode, values",
+    [
+        ("q", TIMESTAMPS * 50),
+        ("Q", [2**64 - 1, 2**64 - 5, 2**63, 0] * 50),
+        ("q", [2**63 - 1, -(2**63), 0, -1] * 10),
+        ("d", [0.0, -0.0, 1.5, -float("inf"), float("inf")] * 10),
+        ("i", []),
+    ],
+)
+def test_sort_buffer_matches_sorted(algorithm, typecode, values):
+    buf = array(typecode, values)
+    buffer_sort.sort_buffer(buf, algorithm=algorithm)
+    assert buf.tolist() == sorted(values)
+
+
+def test_sort_buffer_bytearray_as_int64():
+    raw = bytearray(struct.pack("<3q", *TIMESTAMPS))
+    buffer_sort.sort_buffer(raw, "q")
+    assert list(memoryview(raw).cast("q")) == sorted(TIMESTAMPS)
+
+
+@pytest.mark.parametrize("key_format", ["<l", "<L", ">q", "<d", "8s", "<H"])
+def test_sort_records_stable_by_key(key_format):
+    rng = random.Random(0)
+    key_size = struct.calcsize(key_format)
+    record_size = key_size + 4
+    records = []
+    for i in range(300):
+        if key_format.endswith("s"):
+            key = bytes(rng.randrange(3) for _ in range(key_size))
+        elif key_format.endswith("d"):
+            key = rng.choice([0.0, -0.0, rng.random(), -1e300])
+        else:
+            signed = key_format[-1].islower()
+            low = -(2 ** (8 * key_size - 1)) if signed else 0
+            key = rng.choice([low, low + 1, low + 2 ** (8 * key_size) - 1])
+        records.append(struct.pack(key_format, key) + struct.pack("<I", i))
+    buf = bytearray(b"".join(records))
+    buffer_sort.sort_records(buf, record_size, key_format)
+
+    def key(record):
+        return struct.unpack_from(key_format, record)[0]
+
+    assert bytes(buf) == b"".join(sorted(records, key=key))
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from sort_support import load_sibling, np
+
+counting_sort = load_sibling("counting-sort")
+pigeonhole_sort = load_sibling("pigeonhole-sort")
+
+
+def int_lists(seed, count=150):
+    """Dense and sparse int lists with duplicates and 64-bit extremes."""
+    rng = random.Random(seed)
+    pools = [
+        lambda: rng.randrange(-3, 3),
+        lambda: rng.randrange(100),
+        lambda: rng.choice([2**53, 2**53 + 1, -(2**63), 2**63 - 1, 2**63, 2**64]),
+        lambda: rng.randrange(-(2**63), 2**63),
+    ]
+    for _ in range(count):
+        kinds = rng.sample(pools, rng.randint(1, len(pools)))
+        yield [rng.choice(kinds)() for _ in range(rng.randrange(0, 200))]
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure"])
+def use_numpy(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(counting_sort, "np", None)
+    elif np is None:
+        pytest.skip("needs NumPy")
+
+
+@pytest.mark.usefixtures("use_numpy")
+def test_counting_sorts_match_sorted():
+    for data in int_lists(0):
+        expected = sorted(data)
+        assert counting_sort.counting_sort(list(data)) == expected
+        assert counting_sort.sparse_counting_sort(list(data)) == expected
+        assert pigeonhole_sort.pigeonhole_sort(list(data)) == expected
+        assert list(counting_sort.streaming_counting_sort(iter(data))) == expected
+
+
+@pytest.mark.usefixtures("use_numpy")
+def test_sparse_results_are_python_ints():
+    result = counting_sort.counting_sort([3, 10**12, -(2**63), 3])
+    assert result == [-(2**63), 3, 3, 10**12]
+    assert all(type(x) is int for x in result)
+
+
+def test_counting_histogram_is_incremental():
+    rng = random.Random(1)
+    histogram = counting_sort.CountingHistogram()
+    seen = []
+    for data in int_lists(2, count=20):
+        histogram.update(iter(data))
+        seen.extend(data)
+        value = rng.randrange(-(2**63), 2**63)
+        histogram.add(value, 3)
+        seen.extend([value] * 3)
+        assert list(histogram) == sorted(seen)
+        assert len(histogram) == len(seen)
+        assert histogram.distinct() == len(set(seen))
+        assert list(histogram.items()) == sorted(
+            (value, seen.count(value)) for value in set(seen)
+        )
@@ -0,0 +1,87 @@
+import mmap
+import random
+from array import array
+
+import pytest
+
+from sort_support import load_sibling, np
+
+cycle_sort = load_sibling("cycle-sort")
+
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+
+
+def int64_list(rng, n):
+    pool = [INT64_MIN, INT64_MAX, 0, 1, 2**53 + 1]
+    return [
+        rng.choice(pool) if rng.random() < 0.5 else rng.randrange(INT64_MIN, 2**63)
+        for _ in range(n)
+    ]
+
+
+def float_list(rng, n):
+    pool = [0.0, -0.0, 1.5, -2.0, float("inf"), -float("inf"), 2.0**53]
+    return [rng.choice(pool) for _ in range(n)]
+
+
+def nearly_sorted(data, rng):
+    data = sorted(data)
+    for _ in range(len(data) // 10):
+        i, j = rng.randrange(len(data)), rng.randrange(len(data))
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+def inputs(make, seed, count=40):
+    rng = random.Random(seed)
+    for _ in range(count):
+        data = make(rng, rng.randrange(0, 300))
+        yield nearly_sorted(data, rng) if rng.random() < 0.5 else data
+
+
+def min_writes(data):
+    """Positions whose value differs from the sorted one: each needs a write."""
+    return sum(a != b for a, b in zip(data, sorted(data)))
+
+
+def check(values, data, as_list, fmt=None):
+    writes = cycle_sort.cycle_sort_in_place(values, fmt)
+    result = as_list(values)
+    assert result == sorted(data)
+    assert writes == min_writes(data)
+    # Same elements, e.g. a -0.0 is moved, never overwritten by a 0.0
+    assert sorted(map(repr, result)) == sorted(map(repr, data))
+
+
+def test_lists():
+    for data in inputs(int64_list, 0):
+        check(list(data), data, list)
+    for data in inputs(float_list, 1):
+        check(list(data), data, list)
+
+
+@pytest.mark.parametrize("typecode", ["q", "d"])
+def test_array_and_bytearray(typecode):
+    make = int64_list if typecode == "q" else float_list
+    for data in inputs(make, 2):
+        check(array(typecode, data), data, array.tolist)
+        raw = bytearray(array(typecode, data).tobytes())
+        check(raw, data, lambda b: memoryview(b).cast(typecode).tolist(), typecode)
+
+
+def test_mmap():
+    rng = random.Random(3)
+    data = nearly_sorted(int64_list(rng, 2_000), rng)
+    with mmap.mmap(-1, 8 * len(data)) as mapped:
+        memoryview(mapped).cast("q")[:] = array("q", data)
+        check(mapped, data, lambda m: memoryview(m).cast("q").tolist(), "q")
+
+
+@pytest.mark.skipif(np is None, reason="needs NumPy")
+@pytest.mark.parametrize("dtype", ["int64", "uint64", "float64"])
+def test_ndarray(dtype):
+    make = float_list if dtype == "float64" else int64_list
+    for data in inputs(make, 5, count=10):
+        values = np.array(data).astype(dtype)
+        data = values.tolist()
+        check(values, data, np.ndarray.tolist)
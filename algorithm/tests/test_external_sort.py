@@ -0,0 +1,63 @@
+import random
+import struct
+
+import pytest
+
+from sort_support import load_sibling
+
+external_sort = load_sibling("external-sort")
+
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+
+
+def int64_list(seed, n):
+    rng = random.Random(seed)
+    pool = [INT64_MIN, INT64_MAX, 0, -1, 2**53, 2**53 + 1]
+    return [
+        rng.choice(pool) if rng.random() < 0.3 else rng.randrange(INT64_MIN, 2**63)
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.parametrize("run_sort", ["merge", "block"])
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_external_sort_matches_sorted(tmp_path, run_sort, use_mmap):
+    data = int64_list(0, 5_000)
+    sorter = external_sort.ExternalSorter(
+        memory_budget=4096,
+        tmp_dir=tmp_path,
+        use_mmap=use_mmap,
+        run_sort=run_sort,
+        max_fan_in=2,
+    )
+    assert list(sorter.sort(data)) == sorted(data)
+    assert sorter.stats["runs"] > 2
+    assert sorter.stats["merge_passes"] > 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_external_sort_empty_and_duplicates():
+    assert list(external_sort.external_sort([])) == []
+    data = [3, INT64_MIN, 3, INT64_MAX, 3] * 100
+    assert list(external_sort.external_sort(data, memory_budget=256)) == sorted(data)
+
+
+def test_external_sort_file_int64(tmp_path):
+    data = int64_list(1, 3_000)
+    src, dst = tmp_path / "in.bin", tmp_path / "out.bin"
+    src.write_bytes(struct.pack(f"<{len(data)}q", *data))
+    external_sort.external_sort_file(src, dst, fmt="int64", memory_budget=2048)
+    assert list(struct.unpack(f"<{len(data)}q", dst.read_bytes())) == sorted(data)
+
+
+def test_external_sort_file_lines(tmp_path):
+    rng = random.Random(2)
+    lines = [
+        "".join(rng.choice("ab\t é") for _ in range(rng.randrange(6))).encode()
+        for _ in range(2_000)
+    ]
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_bytes(b"\n".join(lines) + b"\n")
+    stats = external_sort.external_sort_file(src, dst, memory_budget=4096)
+    assert stats["items"] == len(lines)
+    assert dst.read_bytes() == b"".join(line + b"\n" for line in sorted(lines))
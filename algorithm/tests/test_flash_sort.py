@@ -0,0 +1,63 @@
+import random
+from array import array
+
+import pytest
+
+from sort_support import np, load_sibling
+
+flash_sort = load_sibling("flash-sort")
+needs_numpy = pytest.mark.skipif(np is None, reason="needs NumPy")
+
+CLOSE_INT64 = [1760000000000000100, 1760000000000000000, 1760000000000000050]
+CLOSE_UINT64 = [2**64 - 1, 2**64 - 5, 2**64 - 3, 2**63 + 1, 2**63]
+
+
+@pytest.mark.parametrize(
+    "typecode, values",
+    [
+        ("q", CLOSE_INT64),
+        ("q", [2**63 - 1, -(2**63), 0, 2**63 - 2, -(2**63) + 1]),
+        ("Q", CLOSE_UINT64),
+        ("d", [float("inf"), 1.0, -float("inf"), -0.0, 0.0]),
+        ("d", [1e308, -1e308, 0.5]),
+    ],
+)
+def test_flash_sort_in_place_extreme_ranges(typecode, values):
+    assert flash_sort.flash_sort_in_place(array(typecode, values)).tolist() == sorted(
+        values
+    )
+
+
+def test_flash_sort_in_place_without_numpy(monkeypatch):
+    monkeypatch.setattr(flash_sort, "np", None)
+    for typecode, values in [("q", CLOSE_INT64), ("Q", CLOSE_UINT64)]:
+        result = flash_sort.flash_sort_in_place(array(typecode, values))
+        assert result.tolist() == sorted(values)
+
+
+@needs_numpy
+@pytest.mark.parametrize("dtype", ["int8", "int64", "uint64", "float32", "float64"])
+def test_flash_sort_in_place_matches_np_sort(dtype):
+    rng = np.random.default_rng(0)
+    info = np.iinfo(dtype) if np.dtype(dtype).kind in "iu" else None
+    for n in (0, 1, 2, 100, 5_000):
+        if info is not None:
+            values = rng.integers(
+                info.min, info.max, size=n, dtype=dtype, endpoint=True
+            )
+        else:
+            values = rng.standard_normal(n).astype(dtype)
+            values[::7] = 0.0
+            values[::11] = -0.0
+        expected = np.sort(values)
+        assert np.array_equal(flash_sort.flash_sort_in_place(values), expected)
+
+
+def test_flash_sort_matches_sorted():
+    rng = random.Random(0)
+    for n in range(0, 60):
+        data = [
+            rng.choice([rng.randrange(4), rng.random(), -0.0, 2**62])
+            for _ in range(n)
+        ]
+        assert flash_sort.flash_sort(data) == sorted(data)
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from sort_support import load_sibling
+
+heap_sort = load_sibling("heap-sort")
+
+
+def number_lists(seed, count=100):
+    """Lists with duplicates, ±0.0, int/float ties and int64 extremes."""
+    rng = random.Random(seed)
+    pools = [
+        lambda: rng.randrange(-3, 3),
+        lambda: rng.choice([0.0, -0.0, 0, 1, 1.0]),
+        lambda: rng.choice([2**53, 2**53 + 1, -(2**63), 2**63 - 1, 2**64]),
+        lambda: rng.randrange(-(2**63), 2**63),
+    ]
+    for _ in range(count):
+        kinds = rng.sample(pools, rng.randint(1, len(pools)))
+        yield [rng.choice(kinds)() for _ in range(rng.randrange(0, 80))]
+
+
+def reprs(values):
+    return [repr(x) for x in values]
+
+
+def test_heap_sort_matches_sorted():
+    for data in number_lists(0):
+        assert heap_sort.heap_sort(list(data)) == sorted(data)
+
+
+@pytest.mark.parametrize("k", [0, 1, 5, 100])
+def test_bounded_heaps_match_sorted(k):
+    for data in number_lists(1):
+        # reprs: ties must come out in input order, as with sorted()
+        assert reprs(heap_sort.nlargest_stream(iter(data), k)) == reprs(
+            sorted(data, reverse=True)[:k]
+        )
+        assert reprs(heap_sort.nsmallest_stream(iter(data), k)) == reprs(
+            sorted(data)[:k]
+        )
+
+
+def test_bounded_heap_key():
+    rng = random.Random(2)
+    records = [(rng.randrange(5), i) for i in range(200)]
+    for largest in (True, False):
+        kept = heap_sort.BoundedHeap(7, key=lambda r: r[0], largest=largest)
+        kept.extend(records)
+        assert kept.items() == sorted(records, key=lambda r: r[0], reverse=largest)[:7]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_merge_sorted_matches_sorted(reverse):
+    rng = random.Random(3)
+    for data in number_lists(4, count=30):
+        parts = [[] for _ in range(rng.randint(1, 5))]
+        for x in data:
+            rng.choice(parts).append(x)
+        inputs = [iter(sorted(part, reverse=reverse)) for part in parts]
+        merged = heap_sort.merge_sorted(*inputs, reverse=reverse)
+        # Equal items come from the earlier input first, which is also the
+        # order of a stable sort of the inputs concatenated
+        expected = sorted(
+            [x for part in parts for x in sorted(part, reverse=reverse)],
+            reverse=reverse,
+        )
+        assert reprs(merged) == reprs(expected)
+
+
+def test_indexed_priority_queue_pops_in_order():
+    rng = random.Random(5)
+    for data in number_lists(6, count=30):
+        queue = heap_sort.IndexedPriorityQueue()
+        priorities = {}
+        for item, priority in enumerate(data):
+            queue.push(item, priority)
+            priorities[item] = priority
+        for item in rng.sample(range(len(data)), len(data) // 3):
+            priorities[item] = rng.randrange(-(2**63), 2**63)
+            queue.update(item, priorities[item])
+        for item in rng.sample(range(len(data)), len(data) // 4):
+            queue.remove(item)
+            del priorities[item]
+        popped = [queue.pop() for _ in range(len(queue))]
+        assert popped == sorted(priorities.items(), key=lambda p: p[1])
@@ -0,0 +1,85 @@
+import random
+from bisect import bisect_left, bisect_right, insort_right
+
+import pytest
+
+from sort_support import load_sibling
+
+insertion_sort = load_sibling("insertion-sort")
+SortedChunkList = insertion_sort.SortedChunkList
+
+
+def number_lists(seed, count=40):
+    """Lists with duplicates, ±0.0, int/float ties and int64 extremes."""
+    rng = random.Random(seed)
+    pools = [
+        lambda: rng.randrange(-3, 3),
+        lambda: rng.choice([0.0, -0.0, 0, 1, 1.0]),
+        lambda: rng.choice([2**53, 2**53 + 1, -(2**63), 2**63 - 1, 2**64]),
+        lambda: rng.randrange(-(2**63), 2**63),
+    ]
+    for _ in range(count):
+        kinds = rng.sample(pools, rng.randint(1, len(pools)))
+        yield [rng.choice(kinds)() for _ in range(rng.randrange(0, 300))]
+
+
+def reprs(values):
+    return [repr(x) for x in values]
+
+
+def test_insertion_sort_matches_sorted():
+    for data in number_lists(0):
+        assert reprs(insertion_sort.insertion_sort(data)) == reprs(sorted(data))
+
+
+@pytest.mark.parametrize("load", [2, 5, insertion_sort.CHUNK_LOAD])
+def test_sorted_chunk_list_tracks_a_sorted_list(load):
+    rng = random.Random(load)
+    for data in number_lists(1):
+        items = SortedChunkList(load=load)
+        model = []
+        for x in data:
+            roll = rng.random()
+            if model and roll < 0.15:
+                victim = rng.choice(model)
+                items.remove(victim)
+                model.remove(victim)
+            elif model and roll < 0.25:
+                i = rng.randrange(-len(model), len(model))
+                assert items.pop(i) == model.pop(i)
+            items.add(x)
+            insort_right(model, x)
+        if data and rng.random() < 0.5:
+            # A large batch goes through tim_sort instead of add()
+            batch = [rng.choice(data) for _ in range(3 * load)]
+            items.update(batch)
+            model = sorted(model + batch)
+
+        # reprs: equal values stay in insertion order, as in the model
+        assert reprs(items) == reprs(model)
+        assert reprs(reversed(items)) == reprs(reversed(model))
+        assert len(items) == len(model)
+        for i in range(-len(model), len(model)):
+            assert items[i] == model[i]
+        assert items[3:-2:2] == model[3:-2:2]
+        assert items[::-3] == model[::-3]
+        for x in data[:20] + [0, 2**63]:
+            assert items.bisect_left(x) == bisect_left(model, x)
+            assert items.bisect_right(x) == bisect_right(model, x)
+            assert items.count(x) == model.count(x)
+            assert (x in items) == (x in model)
+        if len(data) >= 2:
+            low, high = sorted(rng.sample(data, 2))
+            assert list(items.irange(low, high)) == [
+                x for x in model if low <= x <= high
+            ]
+            assert list(items.irange(low, high, (False, False))) == [
+                x for x in model if low < x < high
+            ]
+
+
+def test_from_sorted():
+    data = sorted([0.0, -0.0, 1, 1.0, -(2**63), 2**63 - 1] * 50, key=float)
+    assert reprs(SortedChunkList.from_sorted(data, load=4)) == reprs(data)
+    with pytest.raises(ValueError):
+        SortedChunkList.from_sorted([1, 0])
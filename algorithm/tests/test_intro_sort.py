@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from sort_support import load_sibling
+
+intro_sort = load_sibling("intro-sort")
+
+
+def inputs(seed):
+    rng = random.Random(seed)
+    for n in (1, 2, 15, 16, 17, 100, 1000):
+        yield [rng.randrange(-(2**63), 2**63) for _ in range(n)]
+        yield [rng.randrange(3) for _ in range(n)]
+        yield [rng.choice([0.0, -0.0, 1.0, float("inf")]) for _ in range(n)]
+        yield [5] * n
+        yield list(range(n, 0, -1))
+
+
+def test_nth_element_selects_kth_smallest():
+    rng = random.Random(0)
+    for data in inputs(0):
+        expected = sorted(data)
+        for k in {0, len(data) - 1, len(data) // 2, rng.randrange(len(data))}:
+            work = list(data)
+            assert intro_sort.nth_element(work, k) == expected[k]
+            assert all(x <= work[k] for x in work[:k])
+            assert all(work[k] <= x for x in work[k + 1 :])
+            assert sorted(work) == expected
+
+
+def test_nth_element_equal_keys_never_fall_back_to_heap_sort(monkeypatch):
+    def fail(*args):
+        raise AssertionError("quickselect ran out of depth")
+
+    monkeypatch.setattr(intro_sort, "heap_sort_intro", fail)
+    rng = random.Random(1)
+    for data in ([7] * 100_000, [rng.randrange(2) for _ in range(100_000)]):
+        assert intro_sort.nth_element(list(data), 50_000) == sorted(data)[50_000]
+
+
+def test_nth_element_rejects_k_outside_range():
+    with pytest.raises(IndexError):
+        intro_sort.nth_element([3, 1, 2], 3)
+
+
+def test_partial_sort_and_top_k_match_sorted():
+    rng = random.Random(2)
+    for data in inputs(2):
+        k = rng.randrange(len(data) + 2)
+        assert intro_sort.partial_sort(list(data), k)[:k] == sorted(data)[:k]
+        pairs = [(x, i) for i, x in enumerate(data)]
+        top = intro_sort.top_k(pairs, k, key=lambda p: p[0])
+        assert top == sorted(pairs, key=lambda p: p[0], reverse=True)[:k]
+
+
+def test_intro_sort_matches_sorted():
+    for data in inputs(3):
+        assert intro_sort.intro_sort(list(data)) == sorted(data)
@@ -0,0 +1,54 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sort_support import load_sibling
+
+merge_sort = load_sibling("merge-sort")
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 1000])
+def test_parallel_merge_sort_small_inputs(n):
+    data = [random.Random(n).randrange(-50, 50) for _ in range(n)]
+    assert merge_sort.parallel_merge_sort(data, workers=2, threshold=0) == sorted(data)
+
+
+def test_parallel_merge_sort_mixed_ints_and_floats():
+    data = [2**60 + 1, 2**60, 0.5, -0.0, 0] * 2000
+    result = merge_sort.parallel_merge_sort(data, workers=2, threshold=0)
+    assert result == sorted(data)
+    assert [type(x) for x in result] == [type(x) for x in sorted(data)]
+
+
+def test_parallel_merge_sort_spawn(spawn):
+    rng = random.Random(0)
+    data = [rng.randrange(-(2**62), 2**62) for _ in range(20_000)]
+    assert merge_sort.parallel_merge_sort(data, workers=2, threshold=0) == sorted(data)
+
+
+def test_parallel_merge_sort_worker_error_propagates(monkeypatch):
+    # Threads stand in for processes so the patched chunk sort is seen; the
+    # error must not be masked by a BufferError from closing shared memory
+    def fail(*args):
+        raise ValueError("worker failed")
+
+    monkeypatch.setattr(merge_sort, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(merge_sort, "_sort_shared_chunk", fail)
+    with pytest.raises(ValueError, match="worker failed"):
+        merge_sort.parallel_merge_sort(list(range(100)), workers=2, threshold=0)
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_parallel_merge_sort_typed_extremes(workers):
+    rng = random.Random(1)
+    ints = [
+        rng.choice([2**63 - 1, -(2**63), 0, rng.randrange(-(2**63), 2**63)])
+        for _ in range(5_001)
+    ]
+    assert merge_sort.parallel_merge_sort(ints, workers, threshold=0) == sorted(ints)
+
+    floats = [rng.choice([0.0, -0.0, 1.5, float("inf"), -1e308]) for _ in range(5_001)]
+    result = merge_sort.parallel_merge_sort(floats, workers, threshold=0)
+    # reprs: the merge is stable, so -0.0 and 0.0 keep their input order
+    assert [repr(x) for x in result] == [repr(x) for x in sorted(floats)]
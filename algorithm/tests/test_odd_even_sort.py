@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from sort_support import load_sibling
+
+odd_even_sort = load_sibling("odd-even-sort")
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 301])
+def test_parallel_odd_even_sort_small_inputs(n):
+    data = [random.Random(n).randrange(-50, 50) for _ in range(n)]
+    result = odd_even_sort.parallel_odd_even_sort(data, workers=2, threshold=0)
+    assert result == sorted(data)
+
+
+def test_parallel_odd_even_sort_mixed_ints_and_floats():
+    data = [2**60 + 1, 2**60, 0.5, -0.0, 0] * 100
+    result = odd_even_sort.parallel_odd_even_sort(data, workers=2, threshold=0)
+    assert result == sorted(data)
+    assert [type(x) for x in result] == [type(x) for x in sorted(data)]
+
+
+def test_parallel_odd_even_sort_spawn(spawn):
+    rng = random.Random(0)
+    data = [rng.randrange(-(2**62), 2**62) for _ in range(5_000)]
+    result = odd_even_sort.parallel_odd_even_sort(data, workers=2, threshold=0)
+    assert result == sorted(data)
+
+
+def test_block_odd_even_sort_matches_sorted():
+    rng = random.Random(1)
+    for workers in (1, 2, 3, 7):
+        data = [rng.choice([rng.randrange(5), rng.random(), -0.0]) for _ in range(200)]
+        assert odd_even_sort.block_odd_even_sort(list(data), workers) == sorted(data)
+
+
+def reprs(values):
+    return [repr(x) for x in values]
+
+
+def test_merge_split_keeps_every_item():
+    # 5.0 and 5 are equal but distinct: neither may be dropped or copied
+    assert reprs(sum(odd_even_sort.merge_split([5.0, 6], [1, 5]), [])) == reprs(
+        [1, 5.0, 5, 6]
+    )
+
+
+def test_block_odd_even_sort_is_stable():
+    rng = random.Random(2)
+    pool = [0, 0.0, -0.0, 1, 1.0, 2**63 - 1, -(2**63), 2**64]
+    for workers in (2, 3, 5):
+        for _ in range(50):
+            data = [rng.choice(pool) for _ in range(rng.randrange(40))]
+            result = odd_even_sort.block_odd_even_sort(list(data), workers)
+            assert reprs(result) == reprs(sorted(data))
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_parallel_odd_even_sort_typed_extremes(workers):
+    rng = random.Random(3)
+    ints = [
+        rng.choice([2**63 - 1, -(2**63), 0, rng.randrange(-(2**63), 2**63)])
+        for _ in range(3_001)
+    ]
+    result = odd_even_sort.parallel_odd_even_sort(ints, workers, threshold=0)
+    assert result == sorted(ints)
+
+    floats = [rng.choice([0.0, -0.0, 1.5, float("inf"), -1e308]) for _ in range(3_001)]
+    result = odd_even_sort.parallel_odd_even_sort(floats, workers, threshold=0)
+    # Sorting moves zeros between blocks but must not flip their signs
+    assert result == sorted(floats)
+    assert sorted(reprs(result)) == sorted(reprs(floats))
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from sort_support import load_sibling
+
+quick_sort = load_sibling("quick-sort")
+
+
+def number_lists(seed, count=100):
+    """Lists with heavy duplicates, ±0.0, int64 extremes and sorted stretches."""
+    rng = random.Random(seed)
+    pools = [
+        lambda: rng.randrange(3),
+        lambda: rng.choice([0.0, -0.0, 0, 1.5]),
+        lambda: rng.choice([2**53, 2**53 + 1, -(2**63), 2**63 - 1, 2**64]),
+        lambda: rng.randrange(-(2**63), 2**63),
+    ]
+    for _ in range(count):
+        kinds = rng.sample(pools, rng.randint(1, len(pools)))
+        data = [rng.choice(kinds)() for _ in range(rng.randrange(0, 300))]
+        if rng.random() < 0.3:
+            data.sort(reverse=rng.random() < 0.5)
+        yield data
+
+
+@pytest.mark.parametrize("dual_pivot", [False, True])
+@pytest.mark.parametrize("pivot", ["median3", "ninther"])
+@pytest.mark.parametrize("cutoff", [2, 16])
+def test_quick_sort_engine_matches_sorted(dual_pivot, pivot, cutoff):
+    for data in number_lists(0):
+        arr = list(data)
+        quick_sort.quick_sort_engine(
+            arr, dual_pivot=dual_pivot, pivot=pivot, cutoff=cutoff
+        )
+        assert arr == sorted(data)
+
+
+@pytest.mark.parametrize("dual_pivot", [False, True])
+def test_quick_sort_engine_range(dual_pivot):
+    for data in number_lists(1, count=30):
+        arr = list(data)
+        low, high = len(arr) // 4, len(arr) - len(arr) // 4 - 1
+        quick_sort.quick_sort_engine(arr, low, high, dual_pivot=dual_pivot)
+        assert arr == data[:low] + sorted(data[low : high + 1]) + data[high + 1 :]
+
+
+def test_quick_sort_engine_rejects_unknown_pivot():
+    with pytest.raises(ValueError):
+        quick_sort.quick_sort_engine([2, 1], pivot="random")
@@ -0,0 +1,116 @@
+import random
+from os.path import commonprefix
+
+import pytest
+
+from sort_support import np, load_sibling
+
+radix_sort = load_sibling("radix-sort")
+needs_numpy = pytest.mark.skipif(np is None, reason="needs NumPy")
+
+
+def stable_order(data):
+    return sorted(range(len(data)), key=data.__getitem__)
+
+
+def number_lists(seed, count=200):
+    """Random lists mixing duplicates, ±0.0, int64 extremes and big ints."""
+    rng = random.Random(seed)
+    pools = [
+        lambda: rng.randrange(-3, 3),
+        lambda: rng.randrange(-(2**63), 2**63),
+        lambda: rng.choice([2**53, 2**53 + 1, -(2**63), 2**63 - 1, 2**70]),
+        lambda: rng.choice([0.0, -0.0, 0.5, -1.5, float("inf"), -float("inf")]),
+        lambda: rng.uniform(-1e300, 1e300),
+    ]
+    for _ in range(count):
+        kinds = rng.sample(pools, rng.randint(1, len(pools)))
+        yield [rng.choice(kinds)() for _ in range(rng.randrange(0, 40))]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_radix_sort_matches_sorted(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(radix_sort, "np", None)
+    elif np is None:
+        pytest.skip("needs NumPy")
+    for data in number_lists(0):
+        result = radix_sort.radix_sort(list(data))
+        assert result == sorted(data)
+        assert [type(x) for x in result] == [type(data[i]) for i in stable_order(data)]
+        if data:
+            assert radix_sort.argsort_numbers(data) == stable_order(data)
+
+
+def test_signed_zeros_keep_input_order():
+    assert radix_sort.argsort_numbers([0.0, -0.0]) == [0, 1]
+    assert radix_sort.argsort_numbers([-0.0, 0, 0.0]) == [0, 1, 2]
+    assert radix_sort.radix_argsort_list([0.0, -0.0, 0.0]) == [0, 1, 2]
+
+
+@needs_numpy
+@pytest.mark.parametrize("dtype", ["int8", "int64", "uint64", "float32", "float64"])
+def test_radix_argsort_is_stable(dtype):
+    rng = np.random.default_rng(0)
+    if np.dtype(dtype).kind in "iu":
+        info = np.iinfo(dtype)
+        values = rng.integers(info.min, info.max, size=3_000, dtype=dtype)
+        values[::5] = info.max
+    else:
+        values = rng.choice([0.0, -0.0, 1.0, -2.5, np.inf], size=3_000).astype(dtype)
+    order = radix_sort.radix_argsort(values)
+    assert np.array_equal(order, np.argsort(values, kind="stable"))
+
+
+@needs_numpy
+def test_radix_sort_array_places_nan_by_sign():
+    values = np.array([np.nan, 1.0, -np.nan, -0.0, 0.0, -np.inf])
+    result = radix_sort.radix_sort_array(values)
+    assert np.isnan(result[0]) and np.isnan(result[-1])
+    assert result[1:-1].tolist() == [-np.inf, -0.0, 0.0, 1.0]
+
+
+def test_radix_sort_strings_matches_sorted():
+    rng = random.Random(0)
+    words = ["", "", "b", "ba", "a" * 70, "a" * 70 + "é", "é"]
+    for _ in range(200):
+        words.append("".join(rng.choice("abé") for _ in range(rng.randrange(10))))
+    result, lcp = radix_sort.radix_sort_strings(list(words), return_lcp=True)
+    assert result == sorted(words)
+    assert lcp == [0] + [
+        len(commonprefix([a, b])) for a, b in zip(result, result[1:])
+    ]
+    assert radix_sort.radix_sort([w.encode() for w in words]) == sorted(
+        w.encode() for w in words
+    )
+
+
+def string_lists(seed, count=20):
+    """Large lists with shared prefixes, duplicates, NULs and astral chars."""
+    rng = random.Random(seed)
+    prefixes = ["", "https://example.com/", "https://example.com/a/" * 4, "\x00"]
+    alphabet = "ab\x00é€😀"
+    for _ in range(count):
+        yield [
+            rng.choice(prefixes)
+            + "".join(rng.choice(alphabet) for _ in range(rng.randrange(12)))
+            for _ in range(rng.randrange(0, 3_000))
+        ]
+
+
+def test_radix_sort_strings_large_inputs():
+    # Scrambles UTF-8 bytes so bytes keys use all 256 values
+    table = bytes(random.Random(2).sample(range(256), 256))
+    for words in string_lists(1):
+        result, lcp = radix_sort.radix_sort_strings(list(words), return_lcp=True)
+        assert result == sorted(words)
+        assert lcp == [
+            len(commonprefix([a, b])) for a, b in zip([""] + result, result)
+        ]
+
+        keys = [w.encode().translate(table) for w in words]
+        result, lcp = radix_sort.radix_sort_strings(keys, return_lcp=True)
+        assert result == sorted(keys)
+        assert lcp == [
+            len(commonprefix([a, b])) for a, b in zip([b""] + result, result)
+        ]
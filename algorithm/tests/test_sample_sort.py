@@ -0,0 +1,68 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sort_support import load_sibling, np
+
+sample_sort = load_sibling("sample-sort")
+needs_numpy = pytest.mark.skipif(np is None, reason="needs NumPy")
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 500])
+def test_sample_sort_matches_sorted(n):
+    rng = random.Random(n)
+    data = [rng.choice([rng.randrange(5), rng.random(), -0.0, 2**62]) for _ in range(n)]
+    assert sample_sort.sample_sort(data, buckets=4, oversample=4) == sorted(data)
+
+
+@needs_numpy
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.random.default_rng(0).integers(-(2**62), 2**62, size=5_000),
+        np.full(5_000, 7, dtype=np.int64),
+        np.random.default_rng(1).zipf(1.3, size=5_000).astype(np.int64),
+    ],
+)
+def test_parallel_sample_sort_forced_parallel(values):
+    # threshold=0 skips the np.sort fallback even on a 1-CPU machine
+    result = sample_sort.parallel_sample_sort(values, workers=2, threshold=0)
+    assert np.array_equal(result, np.sort(values))
+
+
+@needs_numpy
+def test_parallel_sample_sort_spawn(spawn):
+    values = np.random.default_rng(2).integers(-(2**62), 2**62, size=5_000)
+    result = sample_sort.parallel_sample_sort(values, workers=2, threshold=0)
+    assert np.array_equal(result, np.sort(values))
+
+
+@needs_numpy
+def test_parallel_sample_sort_worker_error_propagates(monkeypatch):
+    def fail(*args):
+        raise ValueError("worker failed")
+
+    monkeypatch.setattr(sample_sort, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(sample_sort, "_sort_shared_bucket", fail)
+    values = np.arange(5_000)[::-1].copy()
+    with pytest.raises(ValueError, match="worker failed"):
+        sample_sort.parallel_sample_sort(values, workers=2, threshold=0)
+
+
+@needs_numpy
+@pytest.mark.parametrize("dtype", ["int64", "uint64", "float64"])
+def test_parallel_sample_sort_full_range(dtype):
+    rng = np.random.default_rng(3)
+    if dtype == "float64":
+        specials = [0.0, -0.0, 1.5, np.inf, -np.inf, np.nan]
+        values = rng.choice(specials, size=5_000)
+    else:
+        info = np.iinfo(dtype)
+        values = rng.integers(info.min, info.max, size=5_000, dtype=dtype)
+        values[::7] = info.max
+        values[1::7] = info.min
+    result = sample_sort.parallel_sample_sort(values, workers=2, threshold=0)
+    # NaNs last as with np.sort, and no zero changes sign
+    assert np.array_equal(result, np.sort(values), equal_nan=True)
+    assert np.signbit(result).sum() == np.signbit(values).sum()
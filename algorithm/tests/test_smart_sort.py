@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from sort_support import load_sibling
+
+smart_sort = load_sibling("smart-sort")
+
+CANDIDATES = sorted(
+    {name for names in smart_sort.CANDIDATES.values() for name in names}
+)
+
+
+def number_lists(seed, count=60):
+    """Lists with duplicates, ±0.0, int/float ties and int64 extremes."""
+    rng = random.Random(seed)
+    pools = [
+        lambda: rng.randrange(-3, 3),
+        lambda: rng.choice([0.0, -0.0, 0, 1, 1.0]),
+        lambda: rng.choice([2**53, 2**53 + 1, -(2**63), 2**63 - 1]),
+        lambda: rng.randrange(-(2**63), 2**63),
+    ]
+    for _ in range(count):
+        kinds = rng.sample(pools, rng.randint(1, len(pools)))
+        data = [rng.choice(kinds)() for _ in range(rng.randrange(0, 300))]
+        if rng.random() < 0.3:
+            data.sort(reverse=rng.random() < 0.5)
+        yield data
+
+
+@pytest.mark.parametrize("algorithm", CANDIDATES)
+def test_every_candidate_matches_sorted(algorithm):
+    table = {"default": algorithm, "cells": {}}
+    for data in number_lists(0):
+        assert smart_sort.smart_sort(data, table) == sorted(data)
+
+
+def test_calibrated_table_matches_sorted():
+    for data in number_lists(1):
+        assert smart_sort.smart_sort(data) == sorted(data)
+    words = ["pear", "", "fig", "é", "banana", "fig"] * 50
+    assert smart_sort.smart_sort(words) == sorted(words)
+
+
+def test_falls_back_when_the_sample_misses_an_element():
+    data = list(range(5_000, 0, -1))
+    data[1234] = 0.5
+    table = {"default": "counting_sort", "cells": {}}
+    assert smart_sort.choose(data, table)["profile"]["kind"] == "int"
+    assert smart_sort.smart_sort(data, table) == sorted(data)
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from sort_support import load_sibling
+
+sort_api = load_sibling("sort-api")
+
+# odd_even_merge_sort is known to mis-sort inputs whose length is not a
+# power of two
+ENGINES = [
+    pytest.param(name, marks=pytest.mark.xfail(reason="known incorrect"))
+    if name == "odd_even_merge_sort"
+    else name
+    for name in sort_api.SORTS
+]
+FLOAT_ENGINES = {"radix_sort", "bucket_sort", "flash_sort"}
+
+
+def stable_order(keys, reverse=False):
+    return sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+
+
+def key_lists(name, seed):
+    rng = random.Random(seed)
+    floats = sort_api.SORTS[name][1] == sort_api.COMPARISON or name in FLOAT_ENGINES
+    for n in (0, 1, 2, 7, 60):
+        yield [rng.randrange(8) for _ in range(n)]
+        if floats:
+            pool = [0.0, -0.0, 1.5, -2.25, 2**53, 2**53 + 1]
+            yield [rng.choice(pool) for _ in range(n)]
+
+
+@pytest.mark.parametrize("name", ENGINES)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_argsort_engines_agree_with_stable_sort(name, reverse):
+    for keys in key_lists(name, 0):
+        assert sort_api.argsort(keys, name, reverse=reverse) == stable_order(
+            keys, reverse
+        ), keys
+
+
+@pytest.mark.parametrize("name", ENGINES)
+def test_sort_with_key_matches_sorted(name):
+    rng = random.Random(1)
+    records = [(rng.randrange(5), i) for i in range(40)]
+    result = sort_api.sort(records, name, key=lambda r: r[0])
+    assert result == sorted(records, key=lambda r: r[0])
+
+
+def test_signed_zeros_are_stable_on_every_float_engine():
+    keys = [0.0, -0.0, 0.0, -0.0]
+    for name in ["tim_sort", "merge_sort", *sorted(FLOAT_ENGINES)]:
+        assert sort_api.argsort(keys, name) == [0, 1, 2, 3], name
+
+
+def test_rank_and_apply_permutation():
+    assert sort_api.rank([30, 10, 30, 20]) == [2, 0, 2, 1]
+    assert sort_api.rank([0.0, -0.0, 1.0], "radix") == [0, 0, 1]
+    ages, names = [34, 27, 34, 19], ["ada", "bob", "cy", "dee"]
+    sort_api.apply_permutation(sort_api.argsort(ages, "radix"), ages, names)
+    assert ages == [19, 27, 34, 34]
+    assert names == ["dee", "bob", "ada", "cy"]
+
+
+def test_sort_inplace_returns_none():
+    words = ["pear", "fig", "banana", "kiwi"]
+    assert sort_api.sort(words, "quick_sort", key=len, inplace=True) is None
+    assert words == ["fig", "pear", "kiwi", "banana"]
@@ -0,0 +1,35 @@
+import pytest
+
+from sort_support import load_sibling
+
+benchmark = load_sibling("sort-benchmark")
+
+
+def test_counting_key_rejects_bare_values():
+    key = benchmark.CountingKey(3)
+    for compare in (
+        lambda: key < 0,
+        lambda: 0 < key,
+        lambda: key == 3,
+        lambda: key != 3,
+    ):
+        with pytest.raises(TypeError):
+            compare()
+
+
+def test_count_comparisons():
+    merge_sort = load_sibling("merge-sort").merge_sort
+    counting_sort = load_sibling("counting-sort").counting_sort
+    bead_sort = load_sibling("bead-sort").bead_sort
+    data = [3, 1, 2, 5, 4] * 20
+    assert benchmark.count_comparisons(merge_sort, data) > 0
+    assert benchmark.count_comparisons(counting_sort, data) is None
+    assert benchmark.count_comparisons(bead_sort, data) is None
+
+
+def test_count_comparisons_does_not_hide_bugs():
+    def broken_sort(arr):
+        return arr.missing_method()
+
+    with pytest.raises(AttributeError):
+        benchmark.count_comparisons(broken_sort, [2, 1])
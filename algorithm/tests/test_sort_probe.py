@@ -0,0 +1,77 @@
+import random
+import sys
+import tracemalloc
+
+import pytest
+
+from sort_support import load_sibling
+
+probe = load_sibling("sort-probe")
+
+
+def test_probed_key_rejects_bare_values():
+    key = probe.ProbedKey(3, probe.Probe())
+    for compare in (
+        lambda: key < 0,
+        lambda: 0 < key,
+        lambda: key == 3,
+        lambda: key != 3,
+    ):
+        with pytest.raises(TypeError):
+            compare()
+
+
+@pytest.mark.parametrize(
+    "algorithm", ["cycle_sort", "heap_sort", "merge_sort", "counting_sort"]
+)
+def test_probe_sort_matches_sorted(algorithm):
+    rng = random.Random(algorithm)
+    data = [rng.randrange(50) for _ in range(300)]
+    result, report = probe.probe_sort(algorithm, data, depth=False)
+    assert result == sorted(data)
+    if algorithm == "counting_sort":
+        assert report["comparisons"] is None
+    else:
+        assert report["comparisons"] > 0
+
+
+def test_value_sort_runs_bare():
+    bead_sort = load_sibling("bead-sort").bead_sort
+    p = probe.Probe(depth=False, memory=False)
+    assert p.run(bead_sort, [3, 1, 2, 0, 3]) == [0, 1, 2, 3, 3]
+    assert p.report()["comparisons"] is None
+
+
+def test_run_does_not_hide_bugs():
+    def broken_sort(arr):
+        return arr.missing_method()
+
+    with pytest.raises(AttributeError):
+        probe.Probe().run(broken_sort, [2, 1])
+
+
+def test_run_keeps_caller_profiler_and_tracemalloc():
+    calls = []
+
+    def profiler(frame, event, arg):
+        calls.append(event)
+
+    merge_sort = load_sibling("merge-sort").merge_sort
+    previous = sys.getprofile()
+    tracemalloc.start()
+    sys.setprofile(profiler)
+    try:
+        p = probe.Probe()
+        assert p.run(merge_sort, [5, 2, 9, 1]) == [1, 2, 5, 9]
+        assert sys.getprofile() is profiler
+        assert tracemalloc.is_tracing()
+        assert p.report()["peak_aux_bytes"] >= 0
+    finally:
+        sys.setprofile(previous)
+        tracemalloc.stop()
+
+
+def test_run_stops_tracemalloc_it_started():
+    assert not tracemalloc.is_tracing()
+    probe.Probe(depth=False).run(sorted, [3, 2, 1])
+    assert not tracemalloc.is_tracing()
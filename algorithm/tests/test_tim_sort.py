@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from sort_support import load_sibling
+
+tim_sort = load_sibling("tim-sort")
+
+
+def number_lists(seed, count=100):
+    """Lists with duplicates, ±0.0, int64 extremes and long presorted runs."""
+    rng = random.Random(seed)
+    pools = [
+        lambda: rng.randrange(-3, 3),
+        lambda: rng.choice([0.0, -0.0, 0, 1, 1.0]),
+        lambda: rng.choice([2**53, 2**53 + 1, -(2**63), 2**63 - 1, 2**64]),
+        lambda: rng.randrange(-(2**63), 2**63),
+    ]
+    for _ in range(count):
+        kinds = rng.sample(pools, rng.randint(1, len(pools)))
+        data = [rng.choice(kinds)() for _ in range(rng.randrange(0, 300))]
+        # Sorted and reversed stretches make runs long enough to gallop over
+        for _ in range(rng.randrange(3)):
+            lo = rng.randrange(len(data) + 1)
+            hi = rng.randrange(lo, len(data) + 1)
+            data[lo:hi] = sorted(data[lo:hi], reverse=rng.random() < 0.5)
+        yield data
+
+
+def reprs(values):
+    return [repr(x) for x in values]
+
+
+def test_tim_sort_matches_sorted():
+    for data in number_lists(0):
+        # repr tells -0.0 from 0.0 and 1 from 1.0, so this also checks that
+        # equal elements keep their input order
+        assert reprs(tim_sort.tim_sort(data)) == reprs(sorted(data))
+
+
+def test_tim_sort_in_place_range():
+    for data in number_lists(1, count=30):
+        arr = list(data)
+        lo, hi = len(arr) // 4, len(arr) - len(arr) // 4
+        tim_sort.tim_sort_in_place(arr, lo, hi)
+        assert arr == data[:lo] + sorted(data[lo:hi]) + data[hi:]
+
+
+@pytest.mark.parametrize("n", [0, 1, 31, 32, 33, 1000])
+def test_presorted_and_reversed(n):
+    data = list(range(n))
+    assert tim_sort.tim_sort(data) == data
+    assert tim_sort.tim_sort(data[::-1]) == data
@@ -0,0 +1,63 @@
+import bisect
+import random
+
+from sort_support import load_sibling
+
+tree_sort = load_sibling("tree-sort")
+
+
+def number_lists(seed, count=100):
+    """Lists with duplicates, ±0.0, int/float ties and int64 extremes."""
+    rng = random.Random(seed)
+    pools = [
+        lambda: rng.randrange(-3, 3),
+        lambda: rng.choice([0.0, -0.0, 0, 1, 1.0]),
+        lambda: rng.choice([2**53, 2**53 + 1, -(2**63), 2**63 - 1, 2**64]),
+        lambda: rng.randrange(-(2**63), 2**63),
+    ]
+    for _ in range(count):
+        kinds = rng.sample(pools, rng.randint(1, len(pools)))
+        data = [rng.choice(kinds)() for _ in range(rng.randrange(0, 200))]
+        if rng.random() < 0.3:
+            data.sort()
+        yield data
+
+
+def test_tree_sort_matches_sorted():
+    for data in number_lists(0):
+        # reprs: equal values must stay in insertion order
+        assert [repr(x) for x in tree_sort.tree_sort(data)] == [
+            repr(x) for x in sorted(data)
+        ]
+
+
+def test_sorted_tree_tracks_a_sorted_list():
+    rng = random.Random(1)
+    for data in number_lists(2, count=40):
+        tree = tree_sort.SortedTree()
+        model = []
+        for x in data:
+            if model and rng.random() < 0.3:
+                victim = rng.choice(model)
+                tree.remove(victim)
+                model.remove(victim)
+            tree.add(x)
+            bisect.insort(model, x)
+        assert list(tree) == model
+        assert list(reversed(tree)) == model[::-1]
+        assert len(tree) == len(model)
+        for i in range(-len(model), len(model)):
+            assert tree[i] == model[i]
+        for x in data[:20] + [0, 2**63]:
+            assert tree.bisect_left(x) == bisect.bisect_left(model, x)
+            assert tree.bisect_right(x) == bisect.bisect_right(model, x)
+            assert tree.count(x) == model.count(x)
+            assert (x in tree) == (x in model)
+        if len(data) >= 2:
+            low, high = sorted(rng.sample(data, 2))
+            assert list(tree.irange(low, high)) == [
+                x for x in model if low <= x <= high
+            ]
+            assert list(tree.irange(low, high, (False, False))) == [
+                x for x in model if low < x < high
+            ]
@@ -5,74 +5,504 @@ Tim sort is a hybrid of merge sort and insertion sort. It's the default
 sorting algorithm in Python and Java. It finds runs (already sorted sequences),
 uses insertion sort for small runs, and merges runs together.
 
+This follows the same design as CPython's listsort:
+- natural ascending runs are detected and strictly descending runs are
+  reversed in place
+- short runs are extended to ``minrun`` with binary insertion sort
+- pending runs live on a stack whose lengths keep the invariants
+  ``A > B + C`` and ``B > C``, which bounds the stack to O(log n) entries
+- merges gallop (exponential search) once one run keeps winning, and all
+  merges share a single temporary buffer sized to the smaller run
+
+On presorted input this does roughly n comparisons and no merging at all.
+
 Time Complexity: O(n log n) worst case, O(n) best case
 Space Complexity: O(n)
 """
 
 MIN_MERGE = 32
+MIN_GALLOP = 7
 
 
 def tim_sort(arr):
-    n = len(arr)
     sorted_arr = arr.copy()
-    
-    # Sort individual subarrays of size MIN_MERGE
-    for i in range(0, n, MIN_MERGE):
-        insertion_sort_tim(sorted_arr, i, min(i + MIN_MERGE - 1, n - 1))
-    
-    # Merge subarrays
-    size = MIN_MERGE
-    while size < n:
-        for left in range(0, n, 2 * size):
-            mid = left + size - 1
-            right = min(left + 2 * size - 1, n - 1)
-            
-            if mid < right:
-                merge_tim(sorted_arr, left, mid, right)
-        
-        size *= 2
-    
+    tim_sort_in_place(sorted_arr)
     return sorted_arr
 
 
-def insertion_sort_tim(arr, left, right):
-    for i in range(left + 1, right + 1):
-        key = arr[i]
-        j = i - 1
-        while j >= left and arr[j] > key:
-            arr[j + 1] = arr[j]
-            j -= 1
-        arr[j + 1] = key
-
-
-def merge_tim(arr, left, mid, right):
-    left_arr = arr[left:mid + 1]
-    right_arr = arr[mid + 1:right + 1]
-    
-    i = j = 0
-    k = left
-    
-    while i < len(left_arr) and j < len(right_arr):
-        if left_arr[i] <= right_arr[j]:
-            arr[k] = left_arr[i]
-            i += 1
+def tim_sort_in_place(arr, lo=0, hi=None):
+    """
+    Tim Sort - In-place version (modifies original list)
+
+    Args:
+        arr: List to sort (will be modified)
+        lo, hi: Optional half-open range to sort
+
+    Returns:
+        None (sorts in place)
+    """
+    if hi is None:
+        hi = len(arr)
+    remaining = hi - lo
+    if remaining < 2:
+        return
+
+    # Small inputs: one binary insertion sort after the leading run
+    if remaining < MIN_MERGE:
+        run_len = count_run_and_make_ascending(arr, lo, hi)
+        binary_insertion_sort(arr, lo, hi, lo + run_len)
+        return
+
+    state = TimSort(arr)
+    min_run = compute_min_run(remaining)
+    while remaining:
+        run_len = count_run_and_make_ascending(arr, lo, hi)
+
+        # Extend short runs to min_run with binary insertion sort
+        if run_len < min_run:
+            force = min(remaining, min_run)
+            binary_insertion_sort(arr, lo, lo + force, lo + run_len)
+            run_len = force
+
+        state.push_run(lo, run_len)
+        state.merge_collapse()
+        lo += run_len
+        remaining -= run_len
+
+    state.merge_force_collapse()
+
+
+def compute_min_run(n):
+    """
+    Pick a run length in [MIN_MERGE / 2, MIN_MERGE] so that n / min_run is
+    a power of two or slightly less, which keeps the final merges balanced.
+    """
+    r = 0
+    while n >= MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def count_run_and_make_ascending(arr, lo, hi):
+    """
+    Return the length of the run starting at lo. Strictly descending runs
+    are reversed in place; the strictness keeps the sort stable.
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+
+    if arr[run_hi] < arr[lo]:
+        run_hi += 1
+        while run_hi < hi and arr[run_hi] < arr[run_hi - 1]:
+            run_hi += 1
+        arr[lo:run_hi] = arr[lo:run_hi][::-1]
+    else:
+        run_hi += 1
+        while run_hi < hi and not arr[run_hi] < arr[run_hi - 1]:
+            run_hi += 1
+
+    return run_hi - lo
+
+
+def binary_insertion_sort(arr, lo, hi, start):
+    """Sort arr[lo:hi], given that arr[lo:start] is already sorted."""
+    if start == lo:
+        start += 1
+    for i in range(start, hi):
+        pivot = arr[i]
+
+        # Find the rightmost insertion point to keep equal elements stable
+        left, right = lo, i
+        while left < right:
+            mid = (left + right) >> 1
+            if pivot < arr[mid]:
+                right = mid
+            else:
+                left = mid + 1
+
+        arr[left + 1 : i + 1] = arr[left:i]
+        arr[left] = pivot
+
+
+def gallop_left(key, arr, base, length, hint):
+    """
+    Locate the leftmost position in the sorted arr[base:base + length] at
+    which key could be inserted, searching outward from base + hint.
+
+    Returns k such that arr[base + k - 1] < key <= arr[base + k].
+    """
+    last_ofs = 0
+    ofs = 1
+    if arr[base + hint] < key:
+        # Gallop right until arr[base + hint + last_ofs] < key <= arr[base + hint + ofs]
+        max_ofs = length - hint
+        while ofs < max_ofs and arr[base + hint + ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs += hint
+        ofs += hint
+    else:
+        # Gallop left until arr[base + hint - ofs] < key <= arr[base + hint - last_ofs]
+        max_ofs = hint + 1
+        while ofs < max_ofs and not arr[base + hint - ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+
+    # Binary search the remaining (last_ofs, ofs] window
+    last_ofs += 1
+    while last_ofs < ofs:
+        mid = last_ofs + ((ofs - last_ofs) >> 1)
+        if arr[base + mid] < key:
+            last_ofs = mid + 1
+        else:
+            ofs = mid
+    return ofs
+
+
+def gallop_right(key, arr, base, length, hint):
+    """
+    Like gallop_left, but returns the rightmost position, so that
+    arr[base + k - 1] <= key < arr[base + k].
+    """
+    last_ofs = 0
+    ofs = 1
+    if key < arr[base + hint]:
+        max_ofs = hint + 1
+        while ofs < max_ofs and key < arr[base + hint - ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+    else:
+        max_ofs = length - hint
+        while ofs < max_ofs and not key < arr[base + hint + ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs += hint
+        ofs += hint
+
+    last_ofs += 1
+    while last_ofs < ofs:
+        mid = last_ofs + ((ofs - last_ofs) >> 1)
+        if key < arr[base + mid]:
+            ofs = mid
         else:
-            arr[k] = right_arr[j]
-            j += 1
-        k += 1
-    
-    while i < len(left_arr):
-        arr[k] = left_arr[i]
-        i += 1
-        k += 1
-    
-    while j < len(right_arr):
-        arr[k] = right_arr[j]
-        j += 1
-        k += 1
+            last_ofs = mid + 1
+    return ofs
+
+
+class TimSort:
+    """Merge state for one sort: the pending-run stack and the temp buffer."""
+
+    def __init__(self, arr):
+        self.arr = arr
+        self.min_gallop = MIN_GALLOP
+        self.tmp = []
+        self.run_base = []
+        self.run_len = []
+
+    def push_run(self, base, length):
+        self.run_base.append(base)
+        self.run_len.append(length)
+
+    def merge_collapse(self):
+        """
+        Merge runs until the stack invariants hold again:
+            run_len[i - 2] > run_len[i - 1] + run_len[i]
+            run_len[i - 1] > run_len[i]
+        The invariant is checked on the top four runs, not three (see
+        "OpenJDK's java.utils.Collection.sort() is broken", de Gouw et al.).
+        """
+        run_len = self.run_len
+        while len(run_len) > 1:
+            n = len(run_len) - 2
+            if (n > 0 and run_len[n - 1] <= run_len[n] + run_len[n + 1]) or (
+                n > 1 and run_len[n - 2] <= run_len[n] + run_len[n - 1]
+            ):
+                if run_len[n - 1] < run_len[n + 1]:
+                    n -= 1
+            elif run_len[n] > run_len[n + 1]:
+                break
+            self.merge_at(n)
+
+    def merge_force_collapse(self):
+        """Merge everything left on the stack into a single run."""
+        run_len = self.run_len
+        while len(run_len) > 1:
+            n = len(run_len) - 2
+            if n > 0 and run_len[n - 1] < run_len[n + 1]:
+                n -= 1
+            self.merge_at(n)
+
+    def merge_at(self, i):
+        """Merge the runs at stack positions i and i + 1."""
+        arr = self.arr
+        base1, len1 = self.run_base[i], self.run_len[i]
+        base2, len2 = self.run_base[i + 1], self.run_len[i + 1]
+
+        self.run_len[i] = len1 + len2
+        del self.run_base[i + 1]
+        del self.run_len[i + 1]
+
+        # Elements of run1 that are <= run2[0] are already in place
+        k = gallop_right(arr[base2], arr, base1, len1, 0)
+        base1 += k
+        len1 -= k
+        if len1 == 0:
+            return
+
+        # Elements of run2 that are >= run1[-1] are already in place
+        len2 = gallop_left(arr[base1 + len1 - 1], arr, base2, len2, len2 - 1)
+        if len2 == 0:
+            return
+
+        if len1 <= len2:
+            self.merge_lo(base1, len1, base2, len2)
+        else:
+            self.merge_hi(base1, len1, base2, len2)
+
+    def _ensure_capacity(self, size):
+        if len(self.tmp) < size:
+            self.tmp.extend([None] * (size - len(self.tmp)))
+        return self.tmp
+
+    def merge_lo(self, base1, len1, base2, len2):
+        """
+        Merge two adjacent runs left to right, copying only the (smaller)
+        first run into the temp buffer. Requires arr[base2] < arr[base1]
+        and arr[base1 + len1 - 1] > every element of run2's tail.
+        """
+        arr = self.arr
+        tmp = self._ensure_capacity(len1)
+        tmp[:len1] = arr[base1 : base1 + len1]
+
+        cursor1 = 0
+        cursor2 = base2
+        dest = base1
+
+        arr[dest] = arr[cursor2]
+        dest += 1
+        cursor2 += 1
+        len2 -= 1
+        if len2 == 0:
+            arr[dest : dest + len1] = tmp[:len1]
+            return
+        if len1 == 1:
+            arr[dest : dest + len2] = arr[cursor2 : cursor2 + len2]
+            arr[dest + len2] = tmp[cursor1]
+            return
+
+        min_gallop = self.min_gallop
+        done = False
+        while not done:
+            count1 = count2 = 0
+
+            # One pair at a time until one run starts winning consistently
+            while True:
+                if arr[cursor2] < tmp[cursor1]:
+                    arr[dest] = arr[cursor2]
+                    dest += 1
+                    cursor2 += 1
+                    count2 += 1
+                    count1 = 0
+                    len2 -= 1
+                    if len2 == 0:
+                        done = True
+                        break
+                else:
+                    arr[dest] = tmp[cursor1]
+                    dest += 1
+                    cursor1 += 1
+                    count1 += 1
+                    count2 = 0
+                    len1 -= 1
+                    if len1 == 1:
+                        done = True
+                        break
+                if (count1 | count2) >= min_gallop:
+                    break
+            if done:
+                break
+
+            # Galloping mode: copy whole stretches found by exponential search
+            while True:
+                count1 = gallop_right(arr[cursor2], tmp, cursor1, len1, 0)
+                if count1:
+                    arr[dest : dest + count1] = tmp[cursor1 : cursor1 + count1]
+                    dest += count1
+                    cursor1 += count1
+                    len1 -= count1
+                    if len1 <= 1:
+                        done = True
+                        break
+                arr[dest] = arr[cursor2]
+                dest += 1
+                cursor2 += 1
+                len2 -= 1
+                if len2 == 0:
+                    done = True
+                    break
+
+                count2 = gallop_left(tmp[cursor1], arr, cursor2, len2, 0)
+                if count2:
+                    arr[dest : dest + count2] = arr[cursor2 : cursor2 + count2]
+                    dest += count2
+                    cursor2 += count2
+                    len2 -= count2
+                    if len2 == 0:
+                        done = True
+                        break
+                arr[dest] = tmp[cursor1]
+                dest += 1
+                cursor1 += 1
+                len1 -= 1
+                if len1 == 1:
+                    done = True
+                    break
+
+                min_gallop -= 1
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            if done:
+                break
+
+            # Leaving gallop mode makes re-entering it harder
+            min_gallop = max(min_gallop, 0) + 2
+
+        self.min_gallop = max(min_gallop, 1)
+
+        if len1 == 1:
+            arr[dest : dest + len2] = arr[cursor2 : cursor2 + len2]
+            arr[dest + len2] = tmp[cursor1]
+        elif len1 == 0:
+            raise ValueError("Comparison method violates its general contract")
+        else:
+            arr[dest : dest + len1] = tmp[cursor1 : cursor1 + len1]
+
+    def merge_hi(self, base1, len1, base2, len2):
+        """
+        Mirror image of merge_lo: merge right to left, copying only the
+        (smaller) second run into the temp buffer.
+        """
+        arr = self.arr
+        tmp = self._ensure_capacity(len2)
+        tmp[:len2] = arr[base2 : base2 + len2]
+
+        cursor1 = base1 + len1 - 1
+        cursor2 = len2 - 1
+        dest = base2 + len2 - 1
+
+        arr[dest] = arr[cursor1]
+        dest -= 1
+        cursor1 -= 1
+        len1 -= 1
+        if len1 == 0:
+            arr[dest - len2 + 1 : dest + 1] = tmp[:len2]
+            return
+        if len2 == 1:
+            dest -= len1
+            cursor1 -= len1
+            arr[dest + 1 : dest + 1 + len1] = arr[cursor1 + 1 : cursor1 + 1 + len1]
+            arr[dest] = tmp[cursor2]
+            return
+
+        min_gallop = self.min_gallop
+        done = False
+        while not done:
+            count1 = count2 = 0
+
+            while True:
+                if tmp[cursor2] < arr[cursor1]:
+                    arr[dest] = arr[cursor1]
+                    dest -= 1
+                    cursor1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    len1 -= 1
+                    if len1 == 0:
+                        done = True
+                        break
+                else:
+                    arr[dest] = tmp[cursor2]
+                    dest -= 1
+                    cursor2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    len2 -= 1
+                    if len2 == 1:
+                        done = True
+                        break
+                if (count1 | count2) >= min_gallop:
+                    break
+            if done:
+                break
+
+            while True:
+                count1 = len1 - gallop_right(tmp[cursor2], arr, base1, len1, len1 - 1)
+                if count1:
+                    dest -= count1
+                    cursor1 -= count1
+                    len1 -= count1
+                    arr[dest + 1 : dest + 1 + count1] = arr[
+                        cursor1 + 1 : cursor1 + 1 + count1
+                    ]
+                    if len1 == 0:
+                        done = True
+                        break
+                arr[dest] = tmp[cursor2]
+                dest -= 1
+                cursor2 -= 1
+                len2 -= 1
+                if len2 == 1:
+                    done = True
+                    break
+
+                count2 = len2 - gallop_left(arr[cursor1], tmp, 0, len2, len2 - 1)
+                if count2:
+                    dest -= count2
+                    cursor2 -= count2
+                    len2 -= count2
+                    arr[dest + 1 : dest + 1 + count2] = tmp[
+                        cursor2 + 1 : cursor2 + 1 + count2
+                    ]
+                    if len2 <= 1:
+                        done = True
+                        break
+                arr[dest] = arr[cursor1]
+                dest -= 1
+                cursor1 -= 1
+                len1 -= 1
+                if len1 == 0:
+                    done = True
+                    break
+
+                min_gallop -= 1
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            if done:
+                break
+
+            min_gallop = max(min_gallop, 0) + 2
+
+        self.min_gallop = max(min_gallop, 1)
+
+        if len2 == 1:
+            dest -= len1
+            cursor1 -= len1
+            arr[dest + 1 : dest + 1 + len1] = arr[cursor1 + 1 : cursor1 + 1 + len1]
+            arr[dest] = tmp[cursor2]
+        elif len2 == 0:
+            raise ValueError("Comparison method violates its general contract")
+        else:
+            arr[dest - len2 + 1 : dest + 1] = tmp[:len2]
 
 
 if __name__ == "__main__":
     arr = [64, 34, 25, 12, 22, 11, 90]
     print("Tim Sort:", tim_sort(arr))
-
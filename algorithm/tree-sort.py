@@ -4,7 +4,14 @@ Tree Sort Implementation in Python
 Tree sort inserts elements into a Binary Search Tree (BST), then performs
 an in-order traversal to get the sorted order.
 
-Time Complexity: O(n log n) average, O(n²) worst (unbalanced tree)
+The plain BST below degenerates into a linked list on sorted input, so
+tree_sort() uses SortedTree instead: an AVL tree whose nodes also store
+their subtree size. That keeps it balanced and makes it usable as a live
+sorted container (leaderboards, sliding windows) with O(log n) insert,
+remove, rank/select and bisect, and range iteration. Every operation is
+iterative, so no input depth can hit the recursion limit.
+
+Time Complexity: O(n log n) (BST: O(n log n) average, O(n²) worst)
 Space Complexity: O(n) - for the tree structure
 """
 
@@ -46,14 +53,310 @@ class BST:
             self._in_order(node.right, result)
 
 
+class AVLNode:
+    __slots__ = ("value", "left", "right", "height", "size")
+
+    def __init__(self, value):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+def _update(node):
+    left, right = node.left, node.right
+    lh = left.height if left is not None else 0
+    rh = right.height if right is not None else 0
+    node.height = (lh if lh > rh else rh) + 1
+    node.size = _size(left) + _size(right) + 1
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    """Restore the AVL invariant at node; returns the new subtree root."""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class SortedTree:
+    """
+    Balanced (AVL) order-statistics tree: a list that stays sorted.
+
+    Duplicates are allowed; equal values are kept in insertion order, so
+    tree_sort() is stable. Values only need to support <.
+
+        board = SortedTree()
+        board.add((-score, name))      # O(log n)
+        board.select(0)                # current leader
+        board.rank((-score, name))     # 0-based position
+    """
+
+    def __init__(self, iterable=()):
+        self.root = None
+        for value in iterable:
+            self.add(value)
+
+    def __len__(self):
+        return _size(self.root)
+
+    def __bool__(self):
+        return self.root is not None
+
+    def __iter__(self):
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def __reversed__(self):
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield node.value
+            node = node.left
+
+    def __contains__(self, value):
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            elif node.value < value:
+                node = node.right
+            else:
+                return True
+        return False
+
+    def __getitem__(self, index):
+        return self.select(index)
+
+    def __repr__(self):
+        return f"SortedTree({list(self)!r})"
+
+    def _fix_path(self, path, node):
+        """Rebalance back up a root-to-node path after node changed."""
+        while path:
+            parent, went_left = path.pop()
+            if went_left:
+                parent.left = node
+            else:
+                parent.right = node
+            node = _rebalance(parent)
+        self.root = node
+
+    def add(self, value):
+        """Insert value after any equal values already present."""
+        path = []
+        node = self.root
+        while node is not None:
+            went_left = value < node.value
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
+        self._fix_path(path, AVLNode(value))
+
+    def remove(self, value):
+        """Remove one occurrence of value; raises ValueError if absent."""
+        path = []
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                path.append((node, True))
+                node = node.left
+            elif node.value < value:
+                path.append((node, False))
+                node = node.right
+            else:
+                break
+        if node is None:
+            raise ValueError(f"{value!r} not in tree")
+
+        if node.left is not None and node.right is not None:
+            # Move the in-order successor's value up, then unlink the
+            # successor (which has no left child) instead
+            target = node
+            path.append((node, False))
+            node = node.right
+            while node.left is not None:
+                path.append((node, True))
+                node = node.left
+            target.value = node.value
+
+        child = node.left if node.left is not None else node.right
+        if path:
+            parent, went_left = path.pop()
+            if went_left:
+                parent.left = child
+            else:
+                parent.right = child
+            self._fix_path(path, _rebalance(parent))
+        else:
+            self.root = child
+
+    def discard(self, value):
+        """Remove one occurrence of value if present."""
+        if value in self:
+            self.remove(value)
+
+    def pop(self, index=-1):
+        """Remove and return the value at index (default: the largest)."""
+        value = self.select(index)
+        self.remove(value)
+        return value
+
+    def bisect_left(self, value):
+        """Number of values < value (the insertion point before equals)."""
+        count = 0
+        node = self.root
+        while node is not None:
+            if node.value < value:
+                count += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def bisect_right(self, value):
+        """Number of values <= value (the insertion point after equals)."""
+        count = 0
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            else:
+                count += _size(node.left) + 1
+                node = node.right
+        return count
+
+    rank = bisect_left
+
+    def count(self, value):
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def select(self, index):
+        """The value at sorted position index (negative counts from the end)."""
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("SortedTree index out of range")
+        node = self.root
+        while True:
+            left = _size(node.left)
+            if index < left:
+                node = node.left
+            elif index == left:
+                return node.value
+            else:
+                index -= left + 1
+                node = node.right
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """
+        Iterate over values between minimum and maximum in sorted order.
+
+        Args:
+            minimum, maximum: Bounds; None means unbounded
+            inclusive: Whether each bound is itself included
+        """
+        low_inclusive, high_inclusive = inclusive
+
+        def above_min(value):
+            if minimum is None:
+                return True
+            return not value < minimum if low_inclusive else minimum < value
+
+        def below_max(value):
+            if maximum is None:
+                return True
+            return not maximum < value if high_inclusive else value < maximum
+
+        # Descend to the first value >= minimum, stacking the nodes whose
+        # right subtrees still have to be visited
+        stack = []
+        node = self.root
+        while node is not None:
+            if above_min(node.value):
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        while stack:
+            node = stack.pop()
+            if not below_max(node.value):
+                return
+            yield node.value
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+
 def tree_sort(arr):
-    bst = BST()
-    for value in arr:
-        bst.insert(value)
-    return bst.in_order()
+    """
+    Tree Sort - AVL version (stable, O(n log n) on any input)
+
+    Returns:
+        List: New sorted list
+    """
+    return list(SortedTree(arr))
 
 
 if __name__ == "__main__":
     arr = [64, 34, 25, 12, 22, 11, 90]
     print("Tree Sort:", tree_sort(arr))
 
+    bst = BST()
+    for value in arr:
+        bst.insert(value)
+    print("Tree Sort (unbalanced BST):", bst.in_order())
+
+    board = SortedTree([(-310, "ana"), (-275, "ben"), (-290, "cal")])
+    board.add((-300, "dia"))
+    board.remove((-275, "ben"))
+    print("Leaderboard:", [name for _, name in board])
+    print("Rank of dia:", board.rank((-300, "dia")), "| 2nd place:", board[1])
+    print("Scores 290..300:", list(board.irange((-300,), (-290, "~"))))
+